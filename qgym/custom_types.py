@@ -1,5 +1,143 @@
 """This module contains custom type definitions to ease type hinting."""
 
+from __future__ import annotations
+
 from collections import namedtuple
+from collections.abc import Iterable, Iterator, Mapping
+from copy import deepcopy
+from typing import Any, overload
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
 
 Gate = namedtuple("Gate", ["name", "q1", "q2"])
+
+
+class Circuit:
+    """Columnar representation of a quantum circuit.
+
+    The gates of the circuit are stored in three arrays of equal length: the gate
+    names, the first qubits and the second qubits. The names are either strings or
+    integers, e.g., after encoding with a :class:`~qgym.utils.GateEncoder`. A
+    :class:`Circuit` can be indexed and iterated like a list of ``Gate`` objects, which
+    makes it a drop-in replacement for circuits in the list representation.
+
+    The arrays of a :class:`Circuit` are treated as immutable, so circuits can be shared
+    and used as keys of dictionaries. The `metadata` is not taken into account when
+    comparing or hashing circuits.
+    """
+
+    __slots__ = ("name", "q1", "q2", "metadata")
+
+    def __init__(
+        self,
+        name: ArrayLike,
+        q1: ArrayLike,
+        q2: ArrayLike,
+        metadata: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Init of the :class:`Circuit`.
+
+        Args:
+            name: Names of the gates.
+            q1: First qubit of each gate.
+            q2: Second qubit of each gate. For single qubit gates, this is equal to
+                `q1`.
+            metadata: Optional mapping with additional information about the circuit.
+
+        Raises:
+            ValueError: If the arrays are not one dimensional or have different lengths.
+        """
+        self.name: NDArray[Any] = np.asarray(name)
+        """Array with the name of each gate."""
+        self.q1: NDArray[np.int_] = np.asarray(q1, dtype=np.int_)
+        """Array with the first qubit of each gate."""
+        self.q2: NDArray[np.int_] = np.asarray(q2, dtype=np.int_)
+        """Array with the second qubit of each gate."""
+        self.metadata: dict[str, Any] = {} if metadata is None else dict(metadata)
+        """Dictionary with additional information about the circuit."""
+
+        if self.name.ndim != 1 or self.q1.ndim != 1 or self.q2.ndim != 1:
+            raise ValueError("the arrays of a circuit should be one dimensional")
+        if not len(self.name) == len(self.q1) == len(self.q2):
+            raise ValueError("the arrays of a circuit should have the same length")
+
+    @classmethod
+    def from_gates(
+        cls, gates: Iterable[Gate], metadata: Mapping[str, Any] | None = None
+    ) -> Circuit:
+        """Create a :class:`Circuit` from ``Gate`` objects.
+
+        Args:
+            gates: Gates of the circuit.
+            metadata: Optional mapping with additional information about the circuit.
+
+        Returns:
+            :class:`Circuit` containing `gates`.
+        """
+        gates = list(gates)
+        if len(gates) == 0:
+            return cls(np.empty(0, dtype=str), [], [], metadata)
+        names, qubits1, qubits2 = zip(*gates)
+        return cls(names, qubits1, qubits2, metadata)
+
+    def to_gates(self) -> list[Gate]:
+        """Convert the circuit to a list of ``Gate`` objects.
+
+        Returns:
+            List with a ``Gate`` for each gate in the circuit.
+        """
+        return list(map(Gate, self.name.tolist(), self.q1.tolist(), self.q2.tolist()))
+
+    def copy(self) -> Circuit:
+        """Copy the circuit.
+
+        Returns:
+            :class:`Circuit` with copies of the arrays and the `metadata`.
+        """
+        return Circuit(
+            self.name.copy(), self.q1.copy(), self.q2.copy(), deepcopy(self.metadata)
+        )
+
+    def __len__(self) -> int:
+        """Number of gates in the circuit."""
+        return len(self.name)
+
+    @overload
+    def __getitem__(self, idx: int) -> Gate: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> Circuit: ...
+
+    def __getitem__(self, idx: int | slice) -> Gate | Circuit:
+        """Get a single gate, or a sub circuit if `idx` is a slice."""
+        if isinstance(idx, slice):
+            return Circuit(self.name[idx], self.q1[idx], self.q2[idx], self.metadata)
+        return Gate(self.name[idx].item(), int(self.q1[idx]), int(self.q2[idx]))
+
+    def __iter__(self) -> Iterator[Gate]:
+        """Iterate over the gates of the circuit."""
+        return iter(self.to_gates())
+
+    def __eq__(self, other: object) -> bool:
+        """Circuits are equal if they contain the same gates."""
+        if not isinstance(other, Circuit):
+            return NotImplemented
+        return (
+            np.array_equal(self.name, other.name)
+            and np.array_equal(self.q1, other.q1)
+            and np.array_equal(self.q2, other.q2)
+        )
+
+    def __hash__(self) -> int:
+        """Hash of the gates of the circuit."""
+        if self.name.dtype.kind in "iub":
+            names: Any = self.name.astype(np.int_).tobytes()
+        else:
+            # The width of string arrays may differ between equal circuits
+            names = tuple(self.name.tolist())
+        return hash((names, self.q1.tobytes(), self.q2.tobytes()))
+
+    def __repr__(self) -> str:
+        """String representation of the :class:`Circuit`."""
+        return f"Circuit[n_gates={len(self)}, metadata={self.metadata}]"
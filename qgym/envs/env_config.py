@@ -0,0 +1,161 @@
+"""This module contains the :class:`EnvConfig` class, which is used to create many
+environments with the same configuration cheaply.
+
+Creating an environment parses and validates all arguments, copies the connection graph,
+machine properties, rulebook, rewarder and generator, and builds the observation and
+action spaces. An :class:`EnvConfig` does this only once, for a prototype environment.
+New environments are copies of the prototype, which share the parts that never change
+after initialization, such as the connection graph and the machine properties. Each
+environment gets its own, independently seeded, random number generators.
+
+Usage:
+    >>> from qgym.envs import EnvConfig, Routing
+    >>> config = EnvConfig(Routing, connection_graph=(3, 3), max_observation_reach=5)
+    >>> envs = config.make_envs(512, seed=42)
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from copy import deepcopy
+from types import MappingProxyType
+from typing import Any, Generic, List, TypeVar
+
+import networkx as nx
+import numpy as np
+from numpy.random import Generator, SeedSequence
+
+from qgym.templates.environment import Environment
+
+EnvT = TypeVar("EnvT", bound=Environment[Any, Any])
+
+
+class EnvConfig(Generic[EnvT]):
+    """Frozen and hashable configuration of an environment.
+
+    Two configurations are equal if they have the same environment type and equal
+    arguments, so configurations can be used as keys of dictionaries.
+    """
+
+    __slots__ = ("env_type", "kwargs", "_key", "_prototype")
+
+    def __init__(self, env_type: type[EnvT], **kwargs: Any) -> None:
+        """Init of the :class:`EnvConfig`.
+
+        The arguments are validated by creating a prototype environment.
+
+        Args:
+            env_type: Type of the environment, e.g., :class:`~qgym.envs.Routing`.
+            kwargs: Keyword arguments for the init of `env_type`.
+
+        Raises:
+            ValueError: If a `render_mode` is given. Environments that render should
+                be created directly.
+        """
+        if kwargs.get("render_mode") is not None:
+            raise ValueError("environments with a render_mode can not be configured")
+
+        object.__setattr__(self, "env_type", env_type)
+        object.__setattr__(self, "kwargs", MappingProxyType(dict(kwargs)))
+        object.__setattr__(self, "_key", (env_type, _freeze(kwargs)))
+        object.__setattr__(self, "_prototype", env_type(**kwargs))
+
+    env_type: type[EnvT]
+    """Type of the configured environment."""
+    kwargs: Mapping[str, Any]
+    """Read-only mapping with the keyword arguments of the environment."""
+
+    def make_env(self, seed: int | SeedSequence | None = None) -> EnvT:
+        """Create a new environment from this configuration.
+
+        Args:
+            seed: Seed for the random number generators of the environment. If
+                ``None`` (default), fresh entropy is used.
+
+        Returns:
+            New environment, which shares all static parts with the prototype.
+        """
+        if not isinstance(seed, SeedSequence):
+            seed = SeedSequence(seed)
+
+        prototype = self._prototype
+        static_objects = prototype._static_objects()  # pylint: disable=protected-access
+        memo: dict[int, Any] = {id(obj): obj for obj in static_objects}
+        env = deepcopy(prototype, memo)
+
+        # All copied random number generators have the same state as the prototype.
+        generators = [obj for obj in memo.values() if isinstance(obj, Generator)]
+        for generator, child in zip(generators, seed.spawn(len(generators))):
+            bit_generator = generator.bit_generator
+            bit_generator.state = type(bit_generator)(child).state
+        return env
+
+    def make_envs(
+        self, n_envs: int, seed: int | SeedSequence | None = None
+    ) -> List[EnvT]:
+        """Create multiple environments from this configuration.
+
+        Args:
+            n_envs: Number of environments to create.
+            seed: Seed from which the seeds of the environments are spawned. If
+                ``None`` (default), fresh entropy is used.
+
+        Returns:
+            List of `n_envs` environments with independent random number generators.
+        """
+        if not isinstance(seed, SeedSequence):
+            seed = SeedSequence(seed)
+        return [self.make_env(child) for child in seed.spawn(n_envs)]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Configurations are immutable."""
+        raise AttributeError(f"cannot assign to field '{name}' of a frozen EnvConfig")
+
+    def __eq__(self, other: object) -> bool:
+        """Configurations are equal if they configure the same environment."""
+        if not isinstance(other, EnvConfig):
+            return NotImplemented
+        return bool(self._key == other._key)
+
+    def __hash__(self) -> int:
+        """Hash of the environment type and the arguments."""
+        return hash(self._key)
+
+    def __repr__(self) -> str:
+        """String representation of the :class:`EnvConfig`."""
+        kwargs = ", ".join(f"{key}={value!r}" for key, value in self.kwargs.items())
+        return f"{self.__class__.__name__}[{self.env_type.__name__}]({kwargs})"
+
+
+def _freeze(value: Any) -> Any:
+    """Convert an argument to a hashable value that compares equal for equal input.
+
+    Args:
+        value: Argument to convert.
+
+    Returns:
+        Hashable representation of `value`. Objects that are not supported are
+        represented by their identity.
+    """
+    if isinstance(value, Mapping):
+        items = sorted(value.items(), key=lambda item: repr(item[0]))
+        return ("mapping", tuple((key, _freeze(val)) for key, val in items))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = (
+            sorted(value, key=repr) if isinstance(value, (set, frozenset)) else value
+        )
+        return (type(value).__name__, tuple(_freeze(item) for item in items))
+    if isinstance(value, np.ndarray):
+        return ("ndarray", value.shape, value.dtype.str, value.tobytes())
+    if isinstance(value, nx.Graph):
+        return (
+            "graph",
+            tuple(value.nodes),
+            tuple((u, v, _freeze(data)) for u, v, data in value.edges(data=True)),
+        )
+    try:
+        hash(value)
+    except TypeError:
+        return ("id", id(value))
+    return value
@@ -2,6 +2,12 @@
 problem of OpenQL.
 """
 
+from qgym.envs.initial_mapping.baselines import (
+    greedy_degree_mapping,
+    score_mappings,
+    simulated_annealing_mapping,
+    subgraph_isomorphism_mapping,
+)
 from qgym.envs.initial_mapping.initial_mapping import InitialMapping
 from qgym.envs.initial_mapping.initial_mapping_rewarders import (
     BasicRewarder,
@@ -16,4 +22,8 @@ __all__ = [
     "BasicRewarder",
     "EpisodeRewarder",
     "SingleStepRewarder",
+    "greedy_degree_mapping",
+    "score_mappings",
+    "simulated_annealing_mapping",
+    "subgraph_isomorphism_mapping",
 ]
@@ -0,0 +1,287 @@
+"""This module contains heuristic baselines for the :class:`~qgym.envs.InitialMapping`
+environment.
+
+The baselines act directly on an
+:class:`~qgym.envs.initial_mapping.InitialMappingState` by performing the same actions
+an agent could take. The resulting mapping has the same format as the `mapping`
+observation of the environment, i.e., the index represents a physical qubit and the
+value the logical qubit mapped to it.
+
+Mappings are scored with :func:`score_mappings`, which computes the same value as the
+:class:`~qgym.envs.initial_mapping.BasicRewarder` for a complete mapping. The scoring is
+vectorized over a batch of candidate mappings.
+
+Usage:
+    .. code-block:: python
+
+        from qgym.envs import InitialMapping
+        from qgym.envs.initial_mapping import simulated_annealing_mapping
+
+        env = InitialMapping((3, 3))
+        env.reset()
+        mapping = simulated_annealing_mapping(env.state, seed=42)
+
+"""
+
+from __future__ import annotations
+
+from itertools import islice
+from typing import SupportsInt
+
+import networkx as nx
+import numpy as np
+from networkx.algorithms import isomorphism
+from numpy.random import Generator
+from numpy.typing import ArrayLike, NDArray
+
+from qgym.envs.initial_mapping.initial_mapping_state import InitialMappingState
+from qgym.utils.input_parsing import parse_seed
+
+
+def score_mappings(
+    state: InitialMappingState,
+    mappings: ArrayLike,
+    *,
+    reward_per_edge: float = 5,
+    penalty_per_edge: float = -1,
+) -> NDArray[np.float_]:
+    """Score a batch of complete mappings of the interaction graph of `state`.
+
+    Every interaction edge that is mapped onto an edge of the connection graph adds its
+    fidelity times `reward_per_edge`, every other interaction edge adds
+    `penalty_per_edge`. This is the reward the
+    :class:`~qgym.envs.initial_mapping.BasicRewarder` gives for a complete mapping.
+
+    Args:
+        state: :class:`~qgym.envs.initial_mapping.InitialMappingState` containing the
+            connection and interaction graph.
+        mappings: Array of shape ``(..., n_nodes)``, where the index represents a
+            logical qubit and the value the physical qubit it is mapped to.
+        reward_per_edge: Reward gained per 'good' edge. Defaults to 5.
+        penalty_per_edge: Penalty given per 'bad' edge. Defaults to -1.
+
+    Returns:
+        Array of shape ``mappings.shape[:-1]`` with the score of each mapping.
+    """
+    mappings = np.asarray(mappings)
+    edges = state.graphs["interaction"]["edges"]
+    connection_matrix = state.graphs["connection"]["matrix"]
+
+    # Self loops are counted half, in line with the rewarders
+    weights = np.where(edges[:, 0] == edges[:, 1], 0.5, 1.0)
+    fidelity = connection_matrix[mappings[..., edges[:, 0]], mappings[..., edges[:, 1]]]
+    edge_scores = np.where(fidelity == 0, penalty_per_edge, reward_per_edge * fidelity)
+    return np.asarray(np.sum(weights * edge_scores, axis=-1), dtype=np.float_)
+
+
+def greedy_degree_mapping(state: InitialMappingState) -> NDArray[np.int_]:
+    """Map the interaction graph of `state` greedily based on the node degrees.
+
+    The logical qubit with the most mapped interaction neighbours is mapped next, where
+    ties are broken by the degree of the logical qubit. It is mapped to the free
+    physical qubit with the highest connection fidelity to those mapped neighbours,
+    where ties are broken by the number of free neighbours of the physical qubit.
+
+    Args:
+        state: :class:`~qgym.envs.initial_mapping.InitialMappingState` without mapped
+            qubits. The state is updated in place.
+
+    Returns:
+        Array of which the index represents a physical qubit, and the value the logical
+        qubit mapped to it.
+    """
+    _check_unmapped(state)
+    n_nodes = state.n_nodes
+    connection_matrix = state.graphs["connection"]["matrix"]
+    is_connected = connection_matrix != 0
+    indptr, neighbours = state.graphs["interaction"]["neighbours"]
+    logical_degree = np.diff(indptr)
+
+    n_mapped_neighbours = np.zeros(n_nodes, dtype=np.int_)
+    for _ in range(n_nodes):
+        free_logical = np.flatnonzero(~state.mapped_qubits["logical"])
+        order = np.lexsort(
+            (logical_degree[free_logical], n_mapped_neighbours[free_logical])
+        )
+        logical_qubit = free_logical[order[-1]]
+
+        logical_neighbours = neighbours[
+            indptr[logical_qubit] : indptr[logical_qubit + 1]
+        ]
+        mapped_neighbours = state.inverse_mapping[logical_neighbours]
+        mapped_neighbours = mapped_neighbours[mapped_neighbours != n_nodes]
+        gain = connection_matrix[:, mapped_neighbours].sum(axis=1)
+
+        is_free = ~state.mapped_qubits["physical"]
+        free_physical = np.flatnonzero(is_free)
+        free_degree = np.count_nonzero(is_connected[:, is_free], axis=1)
+        order = np.lexsort((free_degree[free_physical], gain[free_physical]))
+        physical_qubit = free_physical[order[-1]]
+
+        n_mapped_neighbours[logical_neighbours] += 1
+        state.update_state(np.array([physical_qubit, logical_qubit]))
+
+    return state.mapping.copy()
+
+
+def simulated_annealing_mapping(  # pylint: disable=too-many-arguments,too-many-locals
+    state: InitialMappingState,
+    *,
+    n_chains: int = 64,
+    n_iterations: int = 1000,
+    initial_temperature: float = 10.0,
+    final_temperature: float = 0.01,
+    reward_per_edge: float = 5,
+    penalty_per_edge: float = -1,
+    seed: Generator | SupportsInt | None = None,
+) -> NDArray[np.int_]:
+    """Map the interaction graph of `state` using simulated annealing.
+
+    A batch of independent Markov chains is run in parallel. In each iteration, every
+    chain proposes to swap the physical qubits of two logical qubits. Proposals are
+    scored in one batch with :func:`score_mappings` and accepted with the Metropolis
+    criterion. The temperature decreases geometrically. The best mapping found by any
+    chain is applied to the state.
+
+    Args:
+        state: :class:`~qgym.envs.initial_mapping.InitialMappingState` without mapped
+            qubits. The state is updated in place.
+        n_chains: Number of chains that are run in parallel. Defaults to 64.
+        n_iterations: Number of iterations of each chain. Defaults to 1000.
+        initial_temperature: Temperature of the first iteration. Defaults to 10.
+        final_temperature: Temperature of the last iteration. Defaults to 0.01.
+        reward_per_edge: Reward gained per 'good' edge. Defaults to 5.
+        penalty_per_edge: Penalty given per 'bad' edge. Defaults to -1.
+        seed: Seed for the random number generator.
+
+    Returns:
+        Array of which the index represents a physical qubit, and the value the logical
+        qubit mapped to it.
+    """
+    _check_unmapped(state)
+    rng = parse_seed(seed)
+    n_nodes = state.n_nodes
+    if n_nodes == 0:
+        return state.mapping.copy()
+
+    def score(mappings: NDArray[np.int_]) -> NDArray[np.float_]:
+        return score_mappings(
+            state,
+            mappings,
+            reward_per_edge=reward_per_edge,
+            penalty_per_edge=penalty_per_edge,
+        )
+
+    chains = rng.permuted(np.tile(np.arange(n_nodes), (n_chains, 1)), axis=1)
+    scores = score(chains)
+    best_idx = np.argmax(scores)
+    best_mapping, best_score = chains[best_idx].copy(), scores[best_idx]
+
+    rows = np.arange(n_chains)
+    temperatures = np.geomspace(initial_temperature, final_temperature, n_iterations)
+    for temperature in temperatures:
+        qubits1 = rng.integers(n_nodes, size=n_chains)
+        qubits2 = rng.integers(n_nodes, size=n_chains)
+        proposals = chains.copy()
+        proposals[rows, qubits1] = chains[rows, qubits2]
+        proposals[rows, qubits2] = chains[rows, qubits1]
+
+        proposal_scores = score(proposals)
+        improvement = np.minimum(proposal_scores - scores, 0)
+        accept = rng.random(n_chains) < np.exp(improvement / temperature)
+        chains[accept] = proposals[accept]
+        scores[accept] = proposal_scores[accept]
+
+        best_idx = np.argmax(scores)
+        if scores[best_idx] > best_score:
+            best_mapping, best_score = chains[best_idx].copy(), scores[best_idx]
+
+    _apply_mapping(state, best_mapping)
+    return state.mapping.copy()
+
+
+def subgraph_isomorphism_mapping(
+    state: InitialMappingState,
+    *,
+    max_candidates: int = 10_000,
+    reward_per_edge: float = 5,
+    penalty_per_edge: float = -1,
+) -> NDArray[np.int_]:
+    """Map the interaction graph of `state` onto a subgraph of the connection graph.
+
+    All embeddings of the interaction graph in the connection graph, up to
+    `max_candidates`, are enumerated and the one with the highest score according to
+    :func:`score_mappings` is applied. Hence, the result is optimal if the number of
+    embeddings does not exceed `max_candidates`. Isolated logical qubits are mapped to
+    the remaining physical qubits. Because the search is exponential in the worst case,
+    this mapper is meant for small interaction graphs.
+
+    Args:
+        state: :class:`~qgym.envs.initial_mapping.InitialMappingState` without mapped
+            qubits. The state is updated in place.
+        max_candidates: Maximum number of embeddings to consider. Defaults to 10000.
+        reward_per_edge: Reward gained per 'good' edge. Defaults to 5.
+        penalty_per_edge: Penalty given per 'bad' edge. Defaults to -1.
+
+    Raises:
+        ValueError: If the interaction graph (without self loops) is not a subgraph of
+            the connection graph.
+
+    Returns:
+        Array of which the index represents a physical qubit, and the value the logical
+        qubit mapped to it.
+    """
+    _check_unmapped(state)
+    n_nodes = state.n_nodes
+    connection_graph = nx.from_numpy_array(state.graphs["connection"]["matrix"])
+    edges = state.graphs["interaction"]["edges"]
+    interaction_graph = nx.Graph(edges[edges[:, 0] != edges[:, 1]].tolist())
+
+    matcher = isomorphism.GraphMatcher(connection_graph, interaction_graph)
+    embeddings = list(islice(matcher.subgraph_monomorphisms_iter(), max_candidates))
+    if len(embeddings) == 0:
+        msg = "the interaction graph is not a subgraph of the connection graph"
+        raise ValueError(msg)
+
+    candidates = np.empty((len(embeddings), n_nodes), dtype=np.int_)
+    for candidate, embedding in zip(candidates, embeddings):
+        physical_qubits = np.fromiter(embedding.keys(), dtype=np.int_)
+        logical_qubits = np.fromiter(embedding.values(), dtype=np.int_)
+        free_physical = np.setdiff1d(np.arange(n_nodes), physical_qubits)
+        free_logical = np.setdiff1d(np.arange(n_nodes), logical_qubits)
+        candidate[logical_qubits] = physical_qubits
+        candidate[free_logical] = free_physical
+
+    scores = score_mappings(
+        state,
+        candidates,
+        reward_per_edge=reward_per_edge,
+        penalty_per_edge=penalty_per_edge,
+    )
+    _apply_mapping(state, candidates[np.argmax(scores)])
+    return state.mapping.copy()
+
+
+def _check_unmapped(state: InitialMappingState) -> None:
+    """Check that no qubits of `state` have been mapped yet.
+
+    Args:
+        state: :class:`~qgym.envs.initial_mapping.InitialMappingState` to check.
+
+    Raises:
+        ValueError: If a qubit has been mapped already.
+    """
+    if state.mapped_qubits["physical"].any():
+        raise ValueError("the state should not contain mapped qubits")
+
+
+def _apply_mapping(state: InitialMappingState, mapping: NDArray[np.int_]) -> None:
+    """Apply a complete mapping to `state` by performing the corresponding actions.
+
+    Args:
+        state: :class:`~qgym.envs.initial_mapping.InitialMappingState` to update.
+        mapping: Array of which the index represents a logical qubit and the value the
+            physical qubit it is mapped to.
+    """
+    for logical_qubit, physical_qubit in enumerate(mapping):
+        state.update_state(np.array([physical_qubit, logical_qubit]))
@@ -40,14 +40,21 @@ State Space:
     * `steps_done`: Number of steps done since the last reset.
     * `n_nodes`: Number of *physical* qubits.
     * `graphs`: Dictionary containing the graph and matrix representations of the both
-      the interaction graph and connection graph.
+      the interaction graph and connection graph. The interaction graph is stored as an
+      array of edges, its ``networkx`` graph is only built when it is rendered.
     * `mapping`: Array of which the index represents a physical qubit, and the value a
-      virtual qubit. A value of ``n_nodes + 1`` represents the case when nothing is
-      mapped to the physical qubit yet.
-    * `mapping_dict`: Dictionary that maps logical qubits (keys) to physical qubit
-      (values).
-    * `mapped_qubits`: Dictionary with a two Sets containing all mapped physical and
-      logical qubits.
+      virtual qubit. A value of ``n_nodes`` represents the case when nothing is mapped
+      to the physical qubit yet.
+    * `inverse_mapping`: Array of which the index represents a virtual qubit, and the
+      value a physical qubit. A value of ``n_nodes`` represents the case when the
+      virtual qubit has not been mapped yet.
+    * `mapping_dict`: Read-only dictionary view of `inverse_mapping`, which maps logical
+      qubits (keys) to physical qubits (values).
+    * `mapped_qubits`: Dictionary with two boolean arrays stating which physical and
+      logical qubits are mapped.
+    * `mapped_edges`: Dictionary with the summed fidelity of the mapped interaction
+      edges that overlap with the connection graph and the number of mapped interaction
+      edges that do not. These are updated incrementally when a qubit is mapped.
 
 Observation Space:
     The observation space is a :class:`~qgym.spaces.Dict` with 2 entries:
@@ -55,6 +62,25 @@ Observation Space:
     * `mapping`: The current state of the mapping.
     * `interaction_matrix`: The flattened adjacency matrix of the interaction graph.
 
+    If the environment is created with ``interaction_format="edge_list"``, the
+    `interaction_matrix` is replaced by:
+
+    * `interaction_edges`: The edges of the interaction graph as a flattened array of
+      shape ``(2, max_interaction_edges)``, i.e., the first half contains the first
+      node of each edge and the second half the second node. Unused entries are padded
+      with ``n_nodes``. This observation scales with the number of edges instead of the
+      squared number of qubits, which makes it suited for large sparse graphs.
+
+    If the environment is created with ``flatten_observation=True``, the observation is
+    a single vector in a :class:`~qgym.spaces.Box` space, in which the entries are laid
+    out as follows ($n$ is the number of qubits and $E$ is `max_interaction_edges`):
+
+    * `mapping`: ``[0, n)``.
+    * `interaction_matrix`: ``[n, n + n**2)``, or `interaction_edges`:
+      ``[n, n + 2E)``.
+
+    The offsets are also available as ``env.observation_layout.offsets``.
+
 Action Space:
     A valid action is a tuple of integers  $(i,j)$, such that  $0 \le i, j < n$, where
     $n$ is the number of physical qubits. The action  $(i,j)$ maps virtual qubit $j$ to
@@ -63,6 +89,10 @@ Action Space:
     #. virtual qubit $i$ has not been mapped to another physical qubit; and
     #. no other virual qubit has been mapped to physical qubit $j$.
 
+    The legal choices for both dimensions of the action can be obtained with
+    :func:`InitialMapping.action_masks`, which can be used for action masking (e.g., by
+    ``MaskablePPO`` of ``sb3-contrib``).
+
 Example 1:
     Creating an environment with a gridlike connection graph is done by executing the
     following code:
@@ -136,7 +166,12 @@ from qgym.utils.input_parsing import (
     parse_rewarder,
     parse_visualiser,
 )
-from qgym.utils.input_validation import check_instance
+from qgym.utils.input_validation import (
+    check_bool,
+    check_instance,
+    check_int,
+    check_string,
+)
 
 if TYPE_CHECKING:
     Gridspecs = list[int] | tuple[int, ...]
@@ -161,6 +196,10 @@ class InitialMapping(Environment[Dict[str, NDArray[np.int_]], NDArray[np.int_]])
         *,
         rewarder: Rewarder | None = None,
         render_mode: str | None = None,
+        interaction_format: str = "matrix",
+        max_interaction_edges: int | None = None,
+        flatten_observation: bool = False,
+        render_backend: str = "pygame",
     ) -> None:
         """Initialize the action space, observation space, and initial states.
         Furthermore, the connection graph and edge probability for the random
@@ -187,9 +226,37 @@ class InitialMapping(Environment[Dict[str, NDArray[np.int_]], NDArray[np.int_]])
             render_mode: If ``"human"`` open a ``pygame`` screen visualizing the step.
                 If ``"rgb_array"``, return an RGB array encoding of the rendered frame
                 on each render call.
+            interaction_format: Format of the interaction graph in the observation.
+                Either ``"matrix"`` (default) for the flattened adjacency matrix or
+                ``"edge_list"`` for a padded list of edges, see the observation space
+                description.
+            max_interaction_edges: Maximum number of edges of an interaction graph when
+                `interaction_format` is ``"edge_list"``. If ``None`` (default), the
+                maximum number of edges of a graph with ``n_nodes`` nodes (including
+                self loops) is used. If the `graph_generator` can generate graphs with
+                more edges, a ``ValueError`` is raised on construction. Graphs with
+                more edges that are passed to :func:`InitialMapping.reset` raise a
+                ``ValueError`` as well.
+            flatten_observation: If ``True``, the observation is flattened into a
+                single vector, see the observation space description. Defaults to
+                ``False``.
+            render_backend: Backend used for rendering. Choose from ``"pygame"``
+                (default) and ``"numpy"``. The ``"numpy"`` backend draws the
+                ``"rgb_array"`` frames with NumPy, without initializing ``pygame``.
         """
         # Check user input and parse it to a uniform format
         connection_graph = parse_connection_graph(connection_graph)
+        interaction_format = check_string(
+            interaction_format, "interaction_format", lower=True
+        )
+        if interaction_format not in ("matrix", "edge_list"):
+            msg = "'interaction_format' must be 'matrix' or 'edge_list', but was "
+            msg += f"'{interaction_format}'"
+            raise ValueError(msg)
+        if max_interaction_edges is not None:
+            max_interaction_edges = check_int(
+                max_interaction_edges, "max_interaction_edges", l_bound=0
+            )
 
         if graph_generator is None:
             graph_generator = BasicGraphGenerator(seed=self.rng)
@@ -203,8 +270,15 @@ class InitialMapping(Environment[Dict[str, NDArray[np.int_]], NDArray[np.int_]])
         self._rewarder = parse_rewarder(rewarder, BasicRewarder)
 
         # Define internal attributes
-        self._state = InitialMappingState(connection_graph, graph_generator)
-        self.observation_space = self._state.create_observation_space()
+        self._state = InitialMappingState(
+            connection_graph,
+            graph_generator,
+            interaction_format=interaction_format,
+            max_interaction_edges=max_interaction_edges,
+        )
+        self._set_observation_space(
+            check_bool(flatten_observation, "flatten_observation", safe=True)
+        )
         # Define attributes defined in parent class
         self.action_space = qgym.spaces.MultiDiscrete(
             nvec=[self._state.n_nodes, self._state.n_nodes], rng=self.rng
@@ -212,7 +286,7 @@ class InitialMapping(Environment[Dict[str, NDArray[np.int_]], NDArray[np.int_]])
 
         self.metadata = {"render_modes": ["human", "rgb_array"]}
         self._visualiser = parse_visualiser(
-            render_mode, InitialMappingVisualiser, [connection_graph]
+            render_mode, InitialMappingVisualiser, [connection_graph], render_backend
         )
 
     def reset(
@@ -239,3 +313,22 @@ class InitialMapping(Environment[Dict[str, NDArray[np.int_]], NDArray[np.int_]])
         """
         # call super method for dealing with the general stuff
         return super().reset(seed=seed, options=options)
+
+    def action_masks(self) -> NDArray[np.bool_]:
+        """Compute the action masks for the current state.
+
+        Returns:
+            Boolean array of length ``2*n_nodes``, containing the mask of the physical
+            qubits followed by the mask of the logical qubits. An entry is ``True`` if
+            the corresponding qubit has not been mapped yet.
+        """
+        return self._state.action_masks()
+
+    def _static_objects(self) -> list[Any]:
+        """Objects which are not changed after the init of the environment.
+
+        Returns:
+            List with the graph and matrix representation of the connection graph.
+        """
+        connection = self._state.graphs["connection"]
+        return [connection, connection["graph"], connection["matrix"]]
@@ -109,28 +109,19 @@ class BasicRewarder(Rewarder):
     def _compute_state_reward(self, state: InitialMappingState) -> float:
         """Compute the value of the mapping defined by the input state.
 
+        The mapped edge statistics are maintained incrementally by the state, so this
+        takes constant time.
+
         Args:
             state: The state to compute the value of.
 
         Returns:
             The reward value of this state.
         """
-        reward = 0.0
-        for flat_idx in state.graphs["interaction"]["matrix"].nonzero()[0]:
-            interaction_i, interaction_j = divmod(flat_idx, state.n_nodes)
-            mapped_interaction_i = state.mapping_dict.get(interaction_i, None)
-            mapped_interaction_j = state.mapping_dict.get(interaction_j, None)
-            if mapped_interaction_i is None or mapped_interaction_j is None:
-                continue
-            edge_fidelity = state.graphs["connection"]["matrix"][
-                mapped_interaction_i, mapped_interaction_j
-            ]
-            if edge_fidelity == 0:
-                reward += self._penalty_per_edge
-            else:
-                reward += edge_fidelity * self._reward_per_edge
-
-        return reward / 2  # divide by two due to double counting of edges
+        return float(
+            state.mapped_edges["fidelity"] * self._reward_per_edge
+            + state.mapped_edges["n_bad"] * self._penalty_per_edge
+        )
 
     @staticmethod
     def _is_illegal(action: NDArray[np.int_], old_state: InitialMappingState) -> bool:
@@ -145,10 +136,7 @@ class BasicRewarder(Rewarder):
         Returns:
             Whether this action is valid for the given state.
         """
-        return (
-            action[0] in old_state.mapped_qubits["physical"]
-            or action[1] in old_state.mapped_qubits["logical"]
-        )
+        return old_state.is_illegal(action)
 
     def _set_reward_range(self) -> None:
         """Set the reward range."""
@@ -239,7 +227,7 @@ class EpisodeRewarder(BasicRewarder):
         if self._is_illegal(action, old_state):
             return self._illegal_action_penalty
 
-        if len(new_state.mapped_qubits["physical"]) != new_state.n_nodes:
+        if not new_state.is_done():
             return 0
 
         return self._compute_state_reward(new_state)
@@ -17,11 +17,11 @@ Usage:
 from __future__ import annotations
 
 from copy import deepcopy
-from typing import Any, Dict, cast
+from typing import Any, Dict, Iterator, Mapping, cast
 
 import networkx as nx
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
 
 from qgym import spaces
 from qgym.generators.graph import GraphGenerator
@@ -35,12 +35,20 @@ class InitialMappingState(State[Dict[str, NDArray[np.int_]], NDArray[np.int_]]):
         "steps_done",
         "graphs",
         "mapping",
-        "mapping_dict",
+        "inverse_mapping",
         "mapped_qubits",
+        "mapped_edges",
+        "interaction_format",
+        "max_interaction_edges",
     )
 
     def __init__(
-        self, connection_graph: nx.Graph, graph_generator: GraphGenerator
+        self,
+        connection_graph: nx.Graph,
+        graph_generator: GraphGenerator,
+        *,
+        interaction_format: str = "matrix",
+        max_interaction_edges: int | None = None,
     ) -> None:
         # pylint: disable=line-too-long
         """Init of the :class:`~qgym.envs.initial_mapping.InitialMappingState` class.
@@ -53,13 +61,33 @@ class InitialMappingState(State[Dict[str, NDArray[np.int_]], NDArray[np.int_]]):
                 generator is used to generate a new interaction graph when
                 :func:`InitialMappingState.reset` is called without an interaction
                 graph.
+            interaction_format: Format of the interaction graph in the observation.
+                Either ``"matrix"`` for the flattened adjacency matrix or
+                ``"edge_list"`` for a padded list of edges. Defaults to ``"matrix"``.
+            max_interaction_edges: Maximum number of edges of an interaction graph when
+                `interaction_format` is ``"edge_list"``. The edge list observation is
+                padded to this length. If ``None`` (default), ``n_nodes*(n_nodes+1)/2``
+                is used, which is enough for every interaction graph.
+
+        Raises:
+            ValueError: If the `graph_generator` can generate graphs with more than
+                `max_interaction_edges` edges in ``"edge_list"`` format.
         """
         # pylint: enable=line-too-long
-
-        # Create a random connection graph with `n_nodes` and with edges existing with
-        # probability `interaction_graph_edge_probability` (nodes without connections
-        # can be seen as 'null' nodes)
-        interaction_graph = next(graph_generator)
+        n_nodes = connection_graph.number_of_nodes()
+        if max_interaction_edges is None:
+            max_interaction_edges = n_nodes * (n_nodes + 1) // 2
+        generator_max_edges = graph_generator.max_edges()
+        if (
+            interaction_format == "edge_list"
+            and generator_max_edges is not None
+            and generator_max_edges > max_interaction_edges
+        ):
+            msg = f"the graph generator can generate {generator_max_edges} edges, "
+            msg += (
+                f"which is more than 'max_interaction_edges' ({max_interaction_edges})"
+            )
+            raise ValueError(msg)
 
         self.steps_done: int = 0
         """Number of steps done since the last reset."""
@@ -72,23 +100,47 @@ class InitialMappingState(State[Dict[str, NDArray[np.int_]], NDArray[np.int_]]):
         self.graphs = {
             "connection": connection,
             "interaction": {
-                "graph": deepcopy(interaction_graph),
-                "matrix": nx.to_numpy_array(interaction_graph, dtype=np.int8).flatten(),
+                "graph": None,
+                "edges": graph_generator.generate_edges(),
                 "generator": graph_generator,
             },
         }
         """Dictionary containing the graph and matrix representations of the both the
-        interaction graph and connection graph.
+        interaction graph and connection graph. The interaction graph is primarily
+        stored as an array of edges. Its ``networkx`` graph is only constructed when
+        requested through :attr:`interaction_graph` and in ``"edge_list"`` format it
+        has no matrix representation.
         """
+        self.interaction_format = interaction_format
+        """Format of the interaction graph in the observation, either ``"matrix"`` or
+        ``"edge_list"``.
+        """
+        self.max_interaction_edges = max_interaction_edges
+        """Maximum number of edges of the interaction graph in ``"edge_list"`` format."""
         self.mapping = np.full(self.n_nodes, self.n_nodes, dtype=np.int_)
         """Array of which the index represents a physical qubit, and the value a virtual
-        qubit. A value of ``n_nodes + 1`` represents the case when nothing is mapped to
-        the physical qubit yet.
+        qubit. A value of ``n_nodes`` represents the case when nothing is mapped to the
+        physical qubit yet.
+        """
+        self.inverse_mapping = np.full(self.n_nodes, self.n_nodes, dtype=np.int_)
+        """Array of which the index represents a virtual qubit, and the value a physical
+        qubit. A value of ``n_nodes`` represents the case when the virtual qubit has not
+        been mapped yet.
         """
-        self.mapping_dict: dict[int, int] = {}
-        """Dictionary that maps logical qubits (keys) to physical qubits (values)."""
-        self.mapped_qubits: dict[str, set[int]] = {"physical": set(), "logical": set()}
-        """Dictionary with two sets containing mapped physical and logical qubits."""
+        self.mapped_qubits: dict[str, NDArray[np.bool_]] = {
+            "physical": np.zeros(self.n_nodes, dtype=np.bool_),
+            "logical": np.zeros(self.n_nodes, dtype=np.bool_),
+        }
+        """Dictionary with two boolean arrays stating for each physical and logical qubit
+        whether it has been mapped.
+        """
+        self.mapped_edges = {"fidelity": 0.0, "n_bad": 0.0}
+        """Dictionary with statistics of the interaction edges of which both qubits are
+        mapped. `fidelity` is the summed fidelity of the mapped edges that overlap with
+        an edge of the connection graph and `n_bad` is the number of mapped edges that
+        do not. These are updated incrementally on each mapping.
+        """
+        self._update_interaction_graph()
 
     def create_observation_space(self) -> spaces.Dict:
         """Create the corresponding observation space.
@@ -99,13 +151,26 @@ class InitialMappingState(State[Dict[str, NDArray[np.int_]], NDArray[np.int_]]):
             information:
 
             * :class:`~qgym.spaces.MultiDiscrete` space representing the mapping.
-            * :class:`~qgym.spaces.MultiBinary` representing the interaction matrix.
+            * :class:`~qgym.spaces.MultiBinary` representing the interaction matrix, or
+              :class:`~qgym.spaces.MultiDiscrete` representing the interaction edges if
+              the ``"edge_list"`` format is used.
         """
         mapping_space = spaces.MultiDiscrete(
             nvec=[self.n_nodes + 1] * self.n_nodes, rng=self.rng
         )
-        interaction_matrix_space = spaces.MultiBinary(self.n_nodes**2, rng=self.rng)
 
+        if self.interaction_format == "edge_list":
+            interaction_edges_space = spaces.MultiDiscrete(
+                nvec=[self.n_nodes + 1] * (2 * self.max_interaction_edges),
+                rng=self.rng,
+            )
+            return spaces.Dict(
+                rng=self.rng,
+                mapping=mapping_space,
+                interaction_edges=interaction_edges_space,
+            )
+
+        interaction_matrix_space = spaces.MultiBinary(self.n_nodes**2, rng=self.rng)
         return spaces.Dict(
             rng=self.rng,
             mapping=mapping_space,
@@ -117,6 +182,7 @@ class InitialMappingState(State[Dict[str, NDArray[np.int_]], NDArray[np.int_]]):
         *,
         seed: int | None = None,
         interaction_graph: nx.Graph | None = None,
+        interaction_edges: ArrayLike | None = None,
         **_kwargs: Any,
     ) -> InitialMappingState:
         """Reset the state and set a new interaction graph.
@@ -127,9 +193,19 @@ class InitialMappingState(State[Dict[str, NDArray[np.int_]], NDArray[np.int_]]):
             seed: Seed for the random number generator, should only be provided
                 (optionally) on the first reset call i.e., before any learning is done.
             interaction_graph: Interaction graph to be used for the next iteration, if
-            ``None`` a random interaction graph will be created.
+                ``None`` a random interaction graph will be created. The nodes are
+                numbered in the order of the graph to obtain the logical qubits.
+            interaction_edges: Array of shape ``(n_edges, 2)`` containing the edges of
+                the interaction graph to be used for the next iteration. This is a
+                cheaper alternative to `interaction_graph`. At most one of
+                `interaction_graph` and `interaction_edges` can be provided.
             _kwargs: Additional options to configure the reset.
 
+        Raises:
+            ValueError: If both `interaction_graph` and `interaction_edges` are
+                provided, if `interaction_graph` has too many nodes, or if
+                `interaction_edges` contains invalid qubits.
+
         Returns:
             (self) New initial state.
         """
@@ -137,24 +213,106 @@ class InitialMappingState(State[Dict[str, NDArray[np.int_]], NDArray[np.int_]]):
             self.seed(seed)
 
         # Reset the state
-        if interaction_graph is None:
-            self.graphs["interaction"]["graph"] = next(
-                self.graphs["interaction"]["generator"]
-            )
+        interaction = self.graphs["interaction"]
+        if interaction_graph is not None and interaction_edges is not None:
+            msg = "only one of 'interaction_graph' and 'interaction_edges' can be given"
+            raise ValueError(msg)
+        if interaction_graph is not None:
+            if interaction_graph.number_of_nodes() > self.n_nodes:
+                msg = f"'interaction_graph' should have at most {self.n_nodes} nodes"
+                raise ValueError(msg)
+            graph = nx.convert_node_labels_to_integers(interaction_graph)
+            interaction["graph"] = graph
+            edges = np.array(graph.edges(), dtype=np.int_)
+        elif interaction_edges is not None:
+            interaction["graph"] = None
+            edges = np.array(interaction_edges, dtype=np.int_)
+            if ((edges < 0) | (edges >= self.n_nodes)).any():
+                msg = "'interaction_edges' should only contain qubits smaller than "
+                msg += f"{self.n_nodes}"
+                raise ValueError(msg)
         else:
-            self.graphs["interaction"]["graph"] = deepcopy(interaction_graph)
-
-        self.graphs["interaction"]["matrix"] = nx.to_numpy_array(
-            self.graphs["interaction"]["graph"], dtype=np.int8
-        ).flatten()
+            interaction["graph"] = None
+            edges = interaction["generator"].generate_edges()
+        interaction["edges"] = edges.reshape(-1, 2)
+        self._update_interaction_graph()
 
         self.steps_done = 0
-        self.mapping = np.full(self.n_nodes, self.n_nodes)
-        self.mapping_dict = {}
-        self.mapped_qubits = {"physical": set(), "logical": set()}
+        self.mapping = np.full(self.n_nodes, self.n_nodes, dtype=np.int_)
+        self.inverse_mapping = np.full(self.n_nodes, self.n_nodes, dtype=np.int_)
+        self.mapped_qubits = {
+            "physical": np.zeros(self.n_nodes, dtype=np.bool_),
+            "logical": np.zeros(self.n_nodes, dtype=np.bool_),
+        }
+        self.mapped_edges = {"fidelity": 0.0, "n_bad": 0.0}
 
         return self
 
+    def _update_interaction_graph(self) -> None:
+        """Update the representations derived from the current interaction edges.
+
+        Depending on the `interaction_format`, either the flattened adjacency matrix or
+        the padded edge list observation is computed from the array of edges.
+        Furthermore, the neighbours of each logical qubit are stored in compressed
+        sparse row format as a tuple of the index pointers and the neighbour indices,
+        such that the neighbours of qubit `i` are ``indices[indptr[i]:indptr[i+1]]``.
+
+        Raises:
+            ValueError: If the interaction graph has more than `max_interaction_edges`
+                edges in ``"edge_list"`` format.
+        """
+        interaction = self.graphs["interaction"]
+        n_nodes = self.n_nodes
+        edges = interaction["edges"]
+
+        if self.interaction_format == "edge_list":
+            if len(edges) > self.max_interaction_edges:
+                msg = f"the interaction graph has {len(edges)} edges, which is more "
+                msg += f"than 'max_interaction_edges' ({self.max_interaction_edges})"
+                raise ValueError(msg)
+            padded_edges = np.full((2, self.max_interaction_edges), n_nodes)
+            padded_edges[:, : len(edges)] = edges.T
+            interaction["edge_list"] = padded_edges.flatten()
+        else:
+            matrix = np.zeros((n_nodes, n_nodes), dtype=np.int8)
+            matrix[edges[:, 0], edges[:, 1]] = 1
+            matrix[edges[:, 1], edges[:, 0]] = 1
+            interaction["matrix"] = matrix.flatten()
+
+        # Self loops are only stored in one direction
+        not_loop = edges[:, 0] != edges[:, 1]
+        rows = np.concatenate((edges[:, 0], edges[not_loop, 1]))
+        cols = np.concatenate((edges[:, 1], edges[not_loop, 0]))
+        indptr = np.zeros(n_nodes + 1, dtype=np.int_)
+        np.cumsum(np.bincount(rows, minlength=n_nodes), out=indptr[1:])
+        neighbours = cols[np.argsort(rows, kind="stable")]
+        interaction["neighbours"] = (indptr, neighbours)
+
+    def _update_mapped_edges(self, physical_qubit: int, logical_qubit: int) -> None:
+        """Update the mapped edge statistics after mapping a single qubit.
+
+        Only the interaction neighbours of `logical_qubit` are visited. This method
+        should be called after `logical_qubit` has been added to the mapping.
+
+        Args:
+            physical_qubit: Physical qubit that was mapped.
+            logical_qubit: Logical qubit that was mapped to `physical_qubit`.
+        """
+        indptr, neighbours = self.graphs["interaction"]["neighbours"]
+        neighbours = neighbours[indptr[logical_qubit] : indptr[logical_qubit + 1]]
+        mapped_neighbours = self.inverse_mapping[neighbours]
+        is_mapped = mapped_neighbours != self.n_nodes
+
+        # Edges are counted in both directions of the adjacency matrix, except for self
+        # loops, which are only counted once.
+        weights = np.where(neighbours[is_mapped] == logical_qubit, 0.5, 1.0)
+        fidelity = self.graphs["connection"]["matrix"][
+            physical_qubit, mapped_neighbours[is_mapped]
+        ]
+        is_bad = fidelity == 0
+        self.mapped_edges["n_bad"] += float(weights[is_bad].sum())
+        self.mapped_edges["fidelity"] += float(np.dot(weights, fidelity))
+
     def update_state(self, action: NDArray[np.int_]) -> InitialMappingState:
         """Update the state (in place) of this environment using the given action.
 
@@ -170,24 +328,56 @@ class InitialMappingState(State[Dict[str, NDArray[np.int_]], NDArray[np.int_]]):
         # update state based on the given action
         physical_qubit, logical_qubit = action
 
-        if (
-            physical_qubit in self.mapped_qubits["physical"]
-            or logical_qubit in self.mapped_qubits["logical"]
-        ):
+        if self.is_illegal(action):
             return self
 
         self.mapping[physical_qubit] = logical_qubit
-        self.mapping_dict[logical_qubit] = physical_qubit
-        self.mapped_qubits["physical"].add(physical_qubit)
-        self.mapped_qubits["logical"].add(logical_qubit)
+        self.inverse_mapping[logical_qubit] = physical_qubit
+        self.mapped_qubits["physical"][physical_qubit] = True
+        self.mapped_qubits["logical"][logical_qubit] = True
+        self._update_mapped_edges(physical_qubit, logical_qubit)
         return self
 
+    def is_illegal(self, action: NDArray[np.int_]) -> bool:
+        """Check if the given action is illegal.
+
+        An action is illegal if the physical or the logical qubit is already mapped.
+
+        Args:
+            action: Mapping action to check.
+
+        Returns:
+            Whether the action is illegal in the current state.
+        """
+        return bool(
+            self.mapped_qubits["physical"][action[0]]
+            or self.mapped_qubits["logical"][action[1]]
+        )
+
+    def action_masks(self) -> NDArray[np.bool_]:
+        """Compute the action masks of the current state.
+
+        Returns:
+            Boolean array of length ``2*n_nodes``. The first ``n_nodes`` entries state
+            which physical qubits are still unmapped and the last ``n_nodes`` entries
+            state which logical qubits are still unmapped. This is the format of
+            per-dimension masks of a :class:`~qgym.spaces.MultiDiscrete` action space.
+        """
+        return ~np.concatenate(
+            (self.mapped_qubits["physical"], self.mapped_qubits["logical"])
+        )
+
     def obtain_observation(self) -> dict[str, NDArray[np.int_]]:
         """Obtain an observation based on the current state.
 
         Returns:
             Observation based on the current state.
         """
+        if self.interaction_format == "edge_list":
+            return {
+                "mapping": self.mapping,
+                "interaction_edges": self.graphs["interaction"]["edge_list"],
+            }
         return {
             "mapping": self.mapping,
             "interaction_matrix": self.graphs["interaction"]["matrix"],
@@ -199,7 +389,7 @@ class InitialMappingState(State[Dict[str, NDArray[np.int_]], NDArray[np.int_]]):
         Returns:
             Boolean value stating whether we are in a final state.
         """
-        return bool(len(self.mapping_dict) == self.n_nodes)
+        return bool(self.mapped_qubits["logical"].all())
 
     def is_truncated(self) -> bool:
         """Determine if the episode should be truncated or not.
@@ -224,7 +414,72 @@ class InitialMappingState(State[Dict[str, NDArray[np.int_]], NDArray[np.int_]]):
             "Mapped Qubits": self.mapped_qubits,
         }
 
+    @property
+    def mapping_dict(self) -> Mapping[int, int]:
+        """Read-only dictionary view that maps logical qubits (keys) to physical qubits
+        (values).
+
+        The view is backed by :attr:`inverse_mapping`, so it is created without copying
+        and reflects later updates of the state.
+        """
+        return MappingView(self.inverse_mapping, self.n_nodes)
+
+    @property
+    def interaction_graph(self) -> nx.Graph:
+        """``networkx`` representation of the current interaction graph.
+
+        The graph is constructed from the interaction edges on first access, e.g., by
+        the visualiser, and cached until the next reset.
+        """
+        interaction = self.graphs["interaction"]
+        if interaction["graph"] is None:
+            graph = nx.empty_graph(self.n_nodes)
+            graph.add_edges_from(interaction["edges"].tolist())
+            interaction["graph"] = graph
+        return cast(nx.Graph, interaction["graph"])
+
     @property
     def n_nodes(self) -> int:
         """The number of physical qubits."""
         return cast(int, self.graphs["connection"]["graph"].number_of_nodes())
+
+
+class MappingView(Mapping[int, int]):
+    """Read-only dictionary view of a mapping stored in an array.
+
+    The keys of the view are the indices of the array of which the value differs from
+    the sentinel value.
+    """
+
+    __slots__ = ("_array", "_sentinel")
+
+    def __init__(self, array: NDArray[np.int_], sentinel: int) -> None:
+        """Init of the :class:`MappingView`.
+
+        Args:
+            array: Array of which the index represents a key and the value a value.
+            sentinel: Value in `array` that marks a missing key.
+        """
+        self._array = array
+        self._sentinel = sentinel
+
+    def __getitem__(self, key: int) -> int:
+        """Get the value belonging to `key`."""
+        if not isinstance(key, (int, np.integer)) or not 0 <= key < len(self._array):
+            raise KeyError(key)
+        value = int(self._array[key])
+        if value == self._sentinel:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the keys in increasing order."""
+        return iter(np.flatnonzero(self._array != self._sentinel).tolist())
+
+    def __len__(self) -> int:
+        """Number of keys in the view."""
+        return int(np.count_nonzero(self._array != self._sentinel))
+
+    def __repr__(self) -> str:
+        """String representation of the :class:`MappingView`."""
+        return f"MappingView({dict(self.items())})"
@@ -15,6 +15,7 @@ from numpy.typing import NDArray
 from qgym.envs.initial_mapping.initial_mapping_state import InitialMappingState
 from qgym.templates.visualiser import RenderData, Visualiser
 from qgym.utils.visualisation.colors import BLACK, BLUE, GRAY, GREEN, RED, WHITE
+from qgym.utils.visualisation.layout import get_layout
 from qgym.utils.visualisation.typing import Font, Surface
 from qgym.utils.visualisation.wrappers import draw_point, draw_wide_line
 
@@ -24,7 +25,9 @@ from qgym.utils.visualisation.wrappers import draw_point, draw_wide_line
 class InitialMappingVisualiser(Visualiser):
     """Visualiser class for the :class:`~qgym.envs.InitialMapping` environment."""
 
-    def __init__(self, render_mode: str, connection_graph: Graph) -> None:
+    def __init__(
+        self, render_mode: str, connection_graph: Graph, *, backend: str = "pygame"
+    ) -> None:
         # pylint: disable=line-too-long
         """Init of the :class:`~qgym.envs.initial_mapping.InitialMappingVisualiser`.
 
@@ -34,8 +37,12 @@ class InitialMappingVisualiser(Visualiser):
             render_mode: If 'human' open a ``pygame`` screen visualizing the step. If
                 'rgb_array', return an RGB array encoding of the rendered frame on each
                 render call.
+            backend: Render backend. Choose from ``"pygame"`` (default) and
+                ``"numpy"``, which only supports the ``"rgb_array"`` mode.
         """
         # pylint: enable=line-too-long
+        self.backend = backend
+
         # Rendering data
         colors = {
             "nodes": BLUE,
@@ -101,7 +108,9 @@ class InitialMappingVisualiser(Visualiser):
         subscreen3 = pygame.Rect(screen3_pos, large_screen_shape)
         return subscreen1, subscreen2, subscreen3
 
-    def render(self, state: InitialMappingState) -> None | NDArray[np.int_]:
+    def render(
+        self, state: InitialMappingState, out: NDArray[np.uint8] | None = None
+    ) -> None | NDArray[np.int_]:
         """Render the current state using ``pygame``.
 
         The upper left screen shows the connection graph. The lower left screen the
@@ -110,6 +119,8 @@ class InitialMappingVisualiser(Visualiser):
 
         Args:
             state: State to render.
+            out: Optional preallocated array to write the frame to in 'rgb_array'
+                mode, instead of allocating a new array.
 
         Raises:
             ValueError: When an invalid mode is provided.
@@ -119,25 +130,29 @@ class InitialMappingVisualiser(Visualiser):
             screen is open. In 'rgb_array' mode returns an RGB array encoding of the
             rendered image.
         """
-        self.screen.fill(self.colors["background"])
-
-        mapped_graph = self._get_mapped_graph(
-            state.mapping_dict, state.graphs["interaction"]["matrix"]
-        )
-        self._draw_connection_graph(self.screen)
-        self._draw_interaction_graph(
-            self.screen, state.steps_done, state.graphs["interaction"]["graph"]
-        )
+        background, is_new = self._get_layer("background", None)
+        if is_new:
+            self._draw_connection_graph(background)
+            self._draw_header("Connection Graph", self.subscreens[0], background)
+            self._draw_header("Interaction Graph", self.subscreens[1], background)
+            self._draw_header("Mapped Graph", self.subscreens[2], background)
+
+        # The interaction graph only changes between episodes
+        interaction_edges = state.graphs["interaction"]["edges"]
+        key = (interaction_edges.shape, interaction_edges.tobytes())
+        layer, is_new = self._get_layer("interaction", key)
+        if is_new:
+            layer.blit(background, (0, 0))
+            self._draw_interaction_graph(layer, state.interaction_graph)
+
+        mapped_graph = self._get_mapped_graph(state.inverse_mapping, interaction_edges)
+        self.screen.blit(layer, (0, 0))
         self._draw_mapped_graph(self.screen, mapped_graph)
 
-        self._draw_header("Connection Graph", self.subscreens[0], self.screen)
-        self._draw_header("Interaction Graph", self.subscreens[1], self.screen)
-        self._draw_header("Mapped Graph", self.subscreens[2], self.screen)
-
-        return self._display()
+        return self._display(out)
 
     def _get_mapped_graph(
-        self, mapping: dict[int, int], interaction_graph_matrix: NDArray[np.float_]
+        self, inverse_mapping: NDArray[np.int_], interaction_edges: NDArray[np.int_]
     ) -> nx.Graph:
         """Construct a mapped graph.
 
@@ -145,19 +160,20 @@ class InitialMappingVisualiser(Visualiser):
         edges need at least on swap. This function is used during rendering.
 
         Args:
-            mapping: Mapping dictionary of the state to render.
-            interaction_graph_matrix: Interaction graph matrix of the
-                current interaction graph.
+            inverse_mapping: Array of the state to render, of which the index represents
+                a logical qubit and the value the physical qubit it is mapped to.
+            interaction_edges: Array of shape ``(n_edges, 2)`` containing the edges of
+                the current interaction graph.
 
         Returns:
             Mapped graph.
         """
         # Make the adjacency matrix of the mapped graph
-        n_nodes = len(self.graphs["connection"]["nodes"])
         mapped_matrix = np.zeros_like(self.graphs["connection"]["matrix"])
-        for map_i, i in mapping.items():
-            for map_j, j in mapping.items():
-                mapped_matrix[i, j] = interaction_graph_matrix[n_nodes * map_i + map_j]
+        mapped_edges = inverse_mapping[interaction_edges]
+        mapped_edges = mapped_edges[(mapped_edges != len(inverse_mapping)).all(axis=1)]
+        mapped_matrix[mapped_edges[:, 0], mapped_edges[:, 1]] = 1
+        mapped_matrix[mapped_edges[:, 1], mapped_edges[:, 0]] = 1
 
         # Make a networkx graph of the mapped graph
         graph = nx.Graph()
@@ -214,23 +230,20 @@ class InitialMappingVisualiser(Visualiser):
             draw_point(screen, pos, self.colors["nodes"])
 
     def _draw_interaction_graph(
-        self, screen: Surface, step: int, interaction_graph: nx.Graph
+        self, screen: Surface, interaction_graph: nx.Graph
     ) -> None:
         """Draw the interaction graph on subscreen2.
 
+        New node positions are computed for each interaction graph.
+
         Args:
             screen: Screen to draw the interaction graph on.
-            step: Current step number.
             interaction_graph: ``networkx.Graph`` representation of the interaction
                 graph to draw.
         """
-        # If we don't have node positions for the interaction graph for some reason,
-        # compute them. If we are at step 0 we should have a new interaction graph, and
-        # we should also compute new positions.
-        if step == 0 or len(self.graphs["interaction"]["render_positions"]) == 0:
-            self.graphs["interaction"]["render_positions"] = self._get_render_positions(
-                interaction_graph, self.subscreens[1]
-            )
+        self.graphs["interaction"]["render_positions"] = self._get_render_positions(
+            interaction_graph, self.subscreens[1]
+        )
 
         for u, v in interaction_graph.edges():
             pos_u = self.graphs["interaction"]["render_positions"][u]
@@ -290,7 +303,7 @@ class InitialMappingVisualiser(Visualiser):
             the coordinates of these nodes.
         """
         node_positions: dict[Any, NDArray[np.float_]]
-        node_positions = nx.spring_layout(graph, threshold=1e-6)
+        node_positions = get_layout(graph)
 
         # Scale and move the node positions to be centered on the subscreen
         for node, position in node_positions.items():
@@ -299,13 +312,12 @@ class InitialMappingVisualiser(Visualiser):
         return node_positions
 
     def _start_font(self) -> dict[str, Font]:
-        """Start the pygame font.
+        """Start the font.
 
         Returns:
-            pygame fonts for the gate and axis font.
+            Font for the headers.
         """
-        pygame.font.init()
-        return {"header": pygame.font.SysFont("Arial", 30)}
+        return {"header": self._get_font(30)}
 
     @property
     def header_spacing(self) -> float:
@@ -71,6 +71,12 @@ Observation Space:
     * (Optional) `is_legal_surpass_booleans`: Array with boolean values stating whether
       a connection gate can be surpassed with the current mapping.
 
+    If the environment is created with ``flatten_observation=True``, the observation is
+    a single vector in a :class:`~qgym.spaces.Box` space. The entries are laid out in
+    the sorted order of the keys, i.e., `connection_graph` (if observed),
+    `interaction_gates_ahead`, `is_legal_surpass` (if observed) and `mapping`. The
+    offsets are available as ``env.observation_layout.offsets``.
+
 Action Space:
     A valid action is an integer in the domain [0, n_connections]. The values 0 to
     n_connections-1 represent an added SWAP gate. The value of n_connections indicates
@@ -127,6 +133,8 @@ class Routing(Environment[Dict[str, NDArray[np.int_]], int]):
         *,
         rewarder: Rewarder | None = None,
         render_mode: str | None = None,
+        flatten_observation: bool = False,
+        render_backend: str = "pygame",
     ) -> None:
         """Initialize the action space, observation space, and initial states.
 
@@ -161,6 +169,12 @@ class Routing(Environment[Dict[str, NDArray[np.int_]], int]):
             render_mode: If ``"human"`` open a ``pygame`` screen visualizing the step.
                 If ``"rgb_array"``, return an RGB array encoding of the rendered frame
                 on each render call.
+            flatten_observation: If ``True``, the observation is flattened into a
+                single vector, see the observation space description. Defaults to
+                ``False``.
+            render_backend: Backend used for rendering. Choose from ``"pygame"``
+                (default) and ``"numpy"``. The ``"numpy"`` backend draws the
+                ``"rgb_array"`` frames with NumPy, without initializing ``pygame``.
         """
         # Check user input and parse it to a uniform format
         connection_graph = parse_connection_graph(connection_graph)
@@ -203,7 +217,9 @@ class Routing(Environment[Dict[str, NDArray[np.int_]], int]):
             observe_legal_surpasses=observe_legal_surpasses,
             observe_connection_graph=observe_connection_graph,
         )
-        self.observation_space = self._state.create_observation_space()
+        self._set_observation_space(
+            check_bool(flatten_observation, "flatten_observation", safe=True)
+        )
 
         # Define attributes defined in parent class
         self.action_space = qgym.spaces.Discrete(
@@ -212,7 +228,7 @@ class Routing(Environment[Dict[str, NDArray[np.int_]], int]):
 
         self.metadata = {"render_modes": ["human", "rgb_array"]}
         self._visualiser = parse_visualiser(
-            render_mode, RoutingVisualiser, [connection_graph]
+            render_mode, RoutingVisualiser, [connection_graph], render_backend
         )
 
     def reset(
@@ -238,3 +254,15 @@ class Routing(Environment[Dict[str, NDArray[np.int_]], int]):
         """
         # call super method for dealing with the general stuff
         return super().reset(seed=seed, options=options)
+
+    def _static_objects(self) -> list[Any]:
+        """Objects which are not changed after the init of the environment.
+
+        Returns:
+            List with the connection graph, its list of edges and, if it is observed,
+            the connection matrix.
+        """
+        static_objects = [self._state.connection_graph, self._state.edges]
+        if hasattr(self._state, "connection_matrix"):
+            static_objects.append(self._state.connection_matrix)
+        return static_objects
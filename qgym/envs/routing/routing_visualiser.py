@@ -16,6 +16,7 @@ from numpy.typing import NDArray
 from qgym.envs.routing.routing_state import RoutingState
 from qgym.templates.visualiser import RenderData, Visualiser
 from qgym.utils.visualisation.colors import BLACK, BLUE, GRAY, RED, WHITE
+from qgym.utils.visualisation.layout import get_layout
 from qgym.utils.visualisation.typing import Font, Surface
 from qgym.utils.visualisation.wrappers import (
     draw_point,
@@ -28,7 +29,9 @@ from qgym.utils.visualisation.wrappers import (
 class RoutingVisualiser(Visualiser):
     """Visualiser class for the :class:`~qgym.envs.Routing` environment."""
 
-    def __init__(self, render_mode: str, connection_graph: Graph) -> None:
+    def __init__(
+        self, render_mode: str, connection_graph: Graph, *, backend: str = "pygame"
+    ) -> None:
         """Init of the :class:`RoutingVisualiser`.
 
         Args:
@@ -36,7 +39,11 @@ class RoutingVisualiser(Visualiser):
             render_mode: If 'human' open a ``pygame`` screen visualizing the step. If
                 'rgb_array', return an RGB array encoding of the rendered frame on each
                 render call.
+            backend: Render backend. Choose from ``"pygame"`` (default) and
+                ``"numpy"``, which only supports the ``"rgb_array"`` mode.
         """
+        self.backend = backend
+
         # Rendering data
         colors = {
             "node": BLUE,
@@ -59,6 +66,11 @@ class RoutingVisualiser(Visualiser):
         )
 
         self.subscreens = self._start_subscreens(self.screen)
+        self.progress = {"position": 0, "swap_idx": 0}
+        """Progress of the incrementally drawn circuit layers. Stores the last rendered
+        position and the index of the first swap gate that is not drawn yet."""
+        self.mapping = np.arange(connection_graph.number_of_nodes(), dtype=int)
+        """Mapping at the last drawn position of the circuit."""
 
         # Save everything we need to know about the connection graph
         self.graph = {
@@ -89,11 +101,25 @@ class RoutingVisualiser(Visualiser):
         subscreen_graph = screen.subsurface(rect_graph)
         return subscreen_circuit, subscreen_graph
 
-    def render(self, state: RoutingState) -> None | NDArray[np.int_]:
+    def reset(self, state: RoutingState) -> None:
+        """Discard the cached circuit layers of the previous episode.
+
+        Args:
+            state: State to render if `render_mode` is 'human'.
+        """
+        self.render_data.layers.pop("circuit", None)
+        self.render_data.layers.pop("mapping", None)
+        super().reset(state)
+
+    def render(
+        self, state: RoutingState, out: NDArray[np.uint8] | None = None
+    ) -> None | NDArray[np.int_]:
         """Render the current state using ``pygame``.
 
         Args:
             state: State to render.
+            out: Optional preallocated array to write the frame to in 'rgb_array'
+                mode, instead of allocating a new array.
 
         Raises:
             ValueError: When an invalid mode is provided.
@@ -103,19 +129,23 @@ class RoutingVisualiser(Visualiser):
             ``pygame`` screen. If `render_mode` is 'rgb_array' returns a RGB array
             encoding of the rendered image.
         """
-        self.screen.fill(self.colors["background"])
+        layer, is_new = self._get_layer("background", None)
+        if is_new:
+            self._draw_connection_graph(self._subsurface(layer, self.subscreens[1]))
+            self._draw_header("Interaction Circuit", self.subscreens[0], layer)
+            self._draw_header("Connection Graph", self.subscreens[1], layer)
 
-        self._draw_connection_graph(self.subscreens[1])
         self._draw_interaction_circuit(state, self.subscreens[0])
 
-        self._draw_header("Interaction Circuit", self.subscreens[0])
-        self._draw_header("Connection Graph", self.subscreens[1])
-
-        return self._display()
+        return self._display(out)
 
     def _draw_interaction_circuit(self, state: RoutingState, screen: Surface) -> None:
         """Draw the interaction circuit on the interaction circuit subscreen.
 
+        The circuit lines, the passed gates and the mappings of the passed positions do
+        not change during an episode. These are drawn incrementally on cached layers,
+        such that only the gates ahead and the observation reach are drawn each frame.
+
         Args:
             state: Current state.
             screen: (Sub)screen to draw the circuit on.
@@ -128,16 +158,51 @@ class RoutingVisualiser(Visualiser):
         dx_gates = (x_right - x_left) / len(state.interaction_circuit)
         x_gates = x_left + dx_gates * (0.5 + np.arange(len(state.interaction_circuit)))
 
-        self._draw_circuit_lines(
-            screen, x_text=x_text, x_left=x_left, x_right=x_right, y_lines=y_lines
+        key = state.interaction_circuit.tobytes()
+        circuit_layer, is_new = self._get_layer("circuit", key)
+        mapping_layer, _ = self._get_layer("mapping", key, transparent=True)
+        if is_new:
+            circuit_layer.blit(self._get_layer("background", None)[0], (0, 0))
+            self._draw_circuit_lines(
+                self._subsurface(circuit_layer, screen),
+                x_text=x_text,
+                x_left=x_left,
+                x_right=x_right,
+                y_lines=y_lines,
+            )
+            self.progress.update(position=0, swap_idx=0)
+            self.mapping = np.arange(state.n_qubits, dtype=int)
+
+        # Draw the newly passed positions on the cached layers
+        passed = range(self.progress["position"], state.position)
+        self._draw_interaction_gates(
+            self._subsurface(circuit_layer, screen),
+            state=state,
+            x_gates=x_gates,
+            y_lines=y_lines,
+            gates=passed,
         )
+        self._draw_mapping(
+            self._subsurface(mapping_layer, screen),
+            state=state,
+            x_gates=x_gates,
+            y_lines=y_lines,
+            positions=passed,
+        )
+        self.progress["position"] = state.position
+
+        self.screen.blit(circuit_layer, (0, 0))
         self._draw_interaction_gates(
-            screen, state=state, x_gates=x_gates, y_lines=y_lines
+            screen,
+            state=state,
+            x_gates=x_gates,
+            y_lines=y_lines,
+            gates=range(state.position, len(state.interaction_circuit)),
         )
         self._draw_observation_reach(
             screen, state=state, x_left=x_left, x_right=x_right
         )
-        self._draw_mapping(screen, state=state, x_gates=x_gates, y_lines=y_lines)
+        self.screen.blit(mapping_layer, (0, 0))
 
     def _draw_circuit_lines(  # pylint: disable=too-many-arguments
         self,
@@ -179,6 +244,7 @@ class RoutingVisualiser(Visualiser):
         state: RoutingState,
         x_gates: NDArray[np.float_],
         y_lines: NDArray[np.float_],
+        gates: range,
     ) -> None:
         """Draw the interaction gates on the 'circuit' screen.
 
@@ -187,8 +253,10 @@ class RoutingVisualiser(Visualiser):
             state: ``RoutingState`` to draw the interaction gates.
             x_gates: Array of x coordinates of the swap gates.
             y_lines: Array of y coordinates of the circuit lines.
+            gates: Range of the indices of the gates to draw.
         """
-        for i, (qubit1, qubit2) in enumerate(state.interaction_circuit):
+        for i in gates:
+            qubit1, qubit2 = state.interaction_circuit[i]
             physical_qubit1, physical_qubit2 = state.mapping[[qubit1, qubit2]]
             if i < state.position:
                 color = self.colors["passed gate"]
@@ -247,31 +315,34 @@ class RoutingVisualiser(Visualiser):
         state: RoutingState,
         x_gates: NDArray[np.float_],
         y_lines: NDArray[np.float_],
+        positions: range,
     ) -> None:
         """Draw the mapping on the 'circuit' screen.
 
+        The mapping is updated incrementally, so `positions` should start at the first
+        position that has not been drawn yet.
+
         Args:
             screen: (Sub)screen to draw the mapping on.
             state: ``RoutingState`` to draw the mapping of.
             x_gates: Array of x coordinates of the swap gates.
             y_lines: Array of y coordinates of the circuit lines.
+            positions: Range of the positions to draw the mapping of.
         """
-        dx_gates = x_gates[1] - x_gates[0]
-        mapping = np.arange(state.n_qubits, dtype=int)
-        starting_idx = 0
-        for i in range(state.position):
-            old_mapping = mapping.copy()
-            starting_idx, mapping, n_swaps = self._update_mapping(
-                mapping=mapping,
+        dx_gates = (x_gates[-1] - x_gates[0]) / max(len(x_gates) - 1, 1)
+        for i in positions:
+            old_mapping = self.mapping.copy()
+            self.progress["swap_idx"], self.mapping, n_swaps = self._update_mapping(
+                mapping=self.mapping,
                 swap_gates_inserted=state.swap_gates_inserted,
                 position=i,
-                starting_idx=starting_idx,
+                starting_idx=self.progress["swap_idx"],
             )
 
             # Draw the mapping
             x_mapping = x_gates[i] - 0.5 * dx_gates
             for physical_qubit, y_logical_qubit, is_changed in zip(
-                mapping, y_lines, old_mapping != mapping
+                self.mapping, y_lines, old_mapping != self.mapping
             ):
                 write_text(
                     screen,
@@ -312,17 +383,16 @@ class RoutingVisualiser(Visualiser):
             number of swap gates used since the last mapping.
         """
         n_swaps = 0
-        if starting_idx >= len(swap_gates_inserted):
-            return starting_idx, mapping, n_swaps
-
-        for i in range(starting_idx, len(swap_gates_inserted)):
-            swap_position, qubit1, qubit2 = swap_gates_inserted[i]
+        idx = starting_idx
+        while idx < len(swap_gates_inserted):
+            swap_position, qubit1, qubit2 = swap_gates_inserted[idx]
             if position != swap_position:
                 break
 
             n_swaps += 1
             mapping[[qubit1, qubit2]] = mapping[[qubit2, qubit1]]
-        return i, mapping, n_swaps
+            idx += 1
+        return idx, mapping, n_swaps
 
     def _draw_connection_graph(self, screen: Surface) -> None:
         """Draw the connection graph on the graph subscreen.
@@ -341,19 +411,33 @@ class RoutingVisualiser(Visualiser):
                 screen, self.font["graph"], str(label), pos, self.colors["node_labels"]
             )
 
-    def _draw_header(self, text: str, screen: Surface) -> None:
+    def _draw_header(self, text: str, screen: Surface, layer: Surface) -> None:
         """Draw a header above a subscreen.
 
         Args:
             text: Text of the header.
             screen: Subscreen to draw the header of.
+            layer: Layer with the size of the main screen to draw the header on.
         """
         pygame_text = self.font["header"].render(text, True, self.colors["text"])
         offset = screen.get_offset()
         rect = screen.get_rect(topleft=offset)
         text_center = (rect.center[0], rect.y - self.header_spacing / 2)
         text_position = pygame_text.get_rect(center=text_center)
-        self.screen.blit(pygame_text, text_position)
+        layer.blit(pygame_text, text_position)
+
+    @staticmethod
+    def _subsurface(layer: Surface, screen: Surface) -> Surface:
+        """Get the part of a layer that overlaps with a subscreen of the main screen.
+
+        Args:
+            layer: Layer with the size of the main screen.
+            screen: Subscreen of the main screen.
+
+        Returns:
+            Subsurface of `layer` with the same position and size as `screen`.
+        """
+        return layer.subsurface(screen.get_rect(topleft=screen.get_offset()))
 
     def _get_render_positions(
         self, graph: nx.Graph, padding: int = 20
@@ -369,7 +453,7 @@ class RoutingVisualiser(Visualiser):
             coordinates of these nodes.
         """
         node_positions: dict[Any, NDArray[np.float_]]
-        node_positions = nx.spring_layout(graph, threshold=1e-6)
+        node_positions = get_layout(graph)
 
         # Scale and move the node positions to be centered on the graph subscreen
         width_graph_screen = self.screen_width * 0.25 - 0.5 * padding
@@ -381,15 +465,14 @@ class RoutingVisualiser(Visualiser):
         return node_positions
 
     def _setup_fonts(self) -> dict[str, Font]:
-        """Setup the fonts for rendering with pygame."""
-        pygame.font.init()
+        """Setup the fonts for rendering."""
         return {
-            "header": pygame.font.SysFont("Arial", 30),
-            "circuit": pygame.font.SysFont("Arial", 24),
-            "mapping": pygame.font.SysFont("Arial", 22),
-            "mapping_emph": pygame.font.SysFont("Arial", 24, bold=True, italic=True),
-            "n_swaps": pygame.font.SysFont("Arial", 28),
-            "graph": pygame.font.SysFont("Arial", 24),
+            "header": self._get_font(30),
+            "circuit": self._get_font(24),
+            "mapping": self._get_font(22),
+            "mapping_emph": self._get_font(24, bold=True, italic=True),
+            "n_swaps": self._get_font(28),
+            "graph": self._get_font(24),
         }
 
     @property
@@ -2,6 +2,11 @@
 scheduling problem of OpenQL.
 """
 
+from qgym.envs.scheduling.baselines import (
+    alap_schedule,
+    asap_schedule,
+    critical_path_schedule,
+)
 from qgym.envs.scheduling.machine_properties import MachineProperties
 from qgym.envs.scheduling.rulebook import CommutationRulebook
 from qgym.envs.scheduling.scheduling import Scheduling
@@ -15,4 +20,7 @@ __all__ = [
     "CommutationRulebook",
     "BasicRewarder",
     "EpisodeRewarder",
+    "asap_schedule",
+    "alap_schedule",
+    "critical_path_schedule",
 ]
@@ -0,0 +1,147 @@
+"""This module contains list scheduling baselines for the
+:class:`~qgym.envs.Scheduling` environment.
+
+The baselines act directly on a :class:`~qgym.envs.scheduling.SchedulingState` by
+performing the same actions an agent could take. Hence, the produced schedules respect
+the commutation rules as well as the ``same_start`` and ``not_in_same_cycle``
+restrictions of the :class:`~qgym.envs.scheduling.MachineProperties`. The resulting
+``schedule`` array has the same format as the one produced by the environment.
+
+.. note::
+    The :class:`~qgym.envs.Scheduling` environment schedules circuits from right to
+    left. ASAP and ALAP refer to the forward (left to right) direction of the circuit,
+    i.e., :func:`asap_schedule` starts each gate as early as possible in the circuit.
+
+Usage:
+    .. code-block:: python
+
+        from qgym.envs import Scheduling
+        from qgym.envs.scheduling import critical_path_schedule
+
+        env = Scheduling(machine_properties)
+        env.reset()
+        schedule = critical_path_schedule(env.state)
+
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+
+from qgym.envs.scheduling.scheduling_state import SchedulingState
+
+
+def asap_schedule(state: SchedulingState) -> NDArray[np.int_]:
+    """Schedule the circuit of `state` with as soon as possible list scheduling.
+
+    Each gate starts as early as possible in the forward direction of the circuit.
+    Because the environment schedules from right to left, a gate is held back until the
+    cycle at which its critical path to the start of the circuit is about to end.
+
+    Args:
+        state: :class:`~qgym.envs.scheduling.SchedulingState` to schedule. The state
+            is updated in place.
+
+    Returns:
+        Array containing the cycle in which each gate is scheduled.
+    """
+    critical_path = _critical_path_lengths(state)
+    release = critical_path.max(initial=0) - critical_path
+    return _list_schedule(state, critical_path, release)
+
+
+def alap_schedule(state: SchedulingState) -> NDArray[np.int_]:
+    """Schedule the circuit of `state` with as late as possible list scheduling.
+
+    Each gate starts as late as possible in the forward direction of the circuit. Ties
+    are broken by the position of the gate in the circuit, starting at the end.
+
+    Args:
+        state: :class:`~qgym.envs.scheduling.SchedulingState` to schedule. The state
+            is updated in place.
+
+    Returns:
+        Array containing the cycle in which each gate is scheduled.
+    """
+    n_gates = len(state.circuit_info.encoded)
+    priority = np.arange(n_gates)
+    return _list_schedule(state, priority, np.zeros(n_gates, dtype=int))
+
+
+def critical_path_schedule(state: SchedulingState) -> NDArray[np.int_]:
+    """Schedule the circuit of `state` with critical path list scheduling.
+
+    Whenever multiple gates can be scheduled, the gate with the longest remaining path
+    (in cycles) through the gates it blocks is scheduled first.
+
+    Args:
+        state: :class:`~qgym.envs.scheduling.SchedulingState` to schedule. The state
+            is updated in place.
+
+    Returns:
+        Array containing the cycle in which each gate is scheduled.
+    """
+    critical_path = _critical_path_lengths(state)
+    release = np.zeros_like(critical_path)
+    return _list_schedule(state, critical_path, release)
+
+
+def _critical_path_lengths(state: SchedulingState) -> NDArray[np.int_]:
+    """Compute the length of the longest path starting at each gate.
+
+    The length of a path is the sum of the cycle lengths of the gates on it, where the
+    path follows the gates that are blocked by the current gate.
+
+    Args:
+        state: :class:`~qgym.envs.scheduling.SchedulingState` containing the circuit.
+
+    Returns:
+        Array with the critical path length of each gate.
+    """
+    circuit_info = state.circuit_info
+    n_gates = len(circuit_info.encoded)
+    durations = circuit_info.durations
+
+    # Blocked gates always have a lower index, so a single forward pass suffices
+    critical_path = np.zeros(n_gates, dtype=int)
+    for gate_idx in range(n_gates):
+        longest_tail = critical_path[circuit_info.blocks[gate_idx]].max(initial=0)
+        critical_path[gate_idx] = durations[gate_idx] + longest_tail
+    return critical_path
+
+
+def _list_schedule(
+    state: SchedulingState,
+    priority: NDArray[np.int_],
+    release: NDArray[np.int_],
+) -> NDArray[np.int_]:
+    """Generic list scheduler acting on a :class:`SchedulingState`.
+
+    In every cycle, the legal gate with the highest priority is scheduled until no gate
+    can be scheduled anymore, after which the cycle is incremented. Ties are broken in
+    favor of gates at the end of the circuit.
+
+    Args:
+        state: :class:`~qgym.envs.scheduling.SchedulingState` to schedule.
+        priority: Priority of each gate. Higher values are scheduled first.
+        release: First cycle in which each gate may be scheduled.
+
+    Returns:
+        Array containing the cycle in which each gate is scheduled.
+    """
+    n_gates = len(state.circuit_info.encoded)
+    action = np.zeros(2, dtype=int)
+
+    while not state.is_done():
+        candidates = np.flatnonzero(
+            state.circuit_info.legal[:n_gates] & (release <= state.cycle)
+        )[::-1]
+        if len(candidates) == 0:
+            action[1] = 1
+        else:
+            action[0] = candidates[np.argmax(priority[candidates])]
+            action[1] = 0
+        state.update_state(action)
+
+    return state.circuit_info.schedule.copy()
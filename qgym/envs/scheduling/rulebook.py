@@ -25,12 +25,12 @@ Example:
 
 from __future__ import annotations
 
-from typing import Callable
+from typing import Callable, Dict
 
 import numpy as np
 from numpy.typing import NDArray
 
-from qgym.custom_types import Gate
+from qgym.custom_types import Circuit, Gate
 
 
 class CommutationRulebook:
@@ -51,10 +51,14 @@ class CommutationRulebook:
         else:
             self._rules = []
 
-    def make_blocking_matrix(self, circuit: list[Gate]) -> NDArray[np.int_]:
+    def make_blocking_matrix(self, circuit: Circuit | list[Gate]) -> NDArray[np.int_]:
         """Make a square array of shape (len(circuit), len(circuit)), with dependencies
         based on the given commutation rules.
 
+        Rules with a vectorized counterpart (such as the default rules) are evaluated
+        for all pairs of gates at once. Other rules are only evaluated for the pairs of
+        gates that do not commute according to the vectorized rules.
+
         Args:
             circuit: Circuit to check dependencies for.
 
@@ -62,14 +66,22 @@ class CommutationRulebook:
             Dependencies matrix of the circuit based on the rules and scheduling from
             right to left.
         """
-        blocking_matrix = np.zeros((len(circuit), len(circuit)), dtype=bool)
+        if not isinstance(circuit, Circuit):
+            circuit = Circuit.from_gates(circuit)
 
-        for idx, gate in enumerate(circuit):
-            for idx_other in range(idx + 1, len(circuit)):
-                gate_other = circuit[idx_other]
+        blocking_matrix = np.triu(np.ones((len(circuit), len(circuit)), dtype=bool), 1)
+        python_rules = []
+        for rule in self._rules:
+            if rule in VECTORIZED_RULES:
+                blocking_matrix &= ~VECTORIZED_RULES[rule](circuit)
+            else:
+                python_rules.append(rule)
 
-                if not self.commutes(gate, gate_other):
-                    blocking_matrix[idx, idx_other] = True
+        if python_rules:
+            for idx, idx_other in zip(*np.nonzero(blocking_matrix)):
+                gate, gate_other = circuit[idx], circuit[idx_other]
+                if any(rule(gate, gate_other) for rule in python_rules):
+                    blocking_matrix[idx, idx_other] = False
 
         return blocking_matrix
 
@@ -98,6 +110,11 @@ class CommutationRulebook:
         """
         self._rules.append(rule)
 
+    @property
+    def rules(self) -> tuple[Callable[[Gate, Gate], bool], ...]:
+        """Tuple of the commutation rules in this rulebook."""
+        return tuple(self._rules)
+
     def __repr__(self) -> str:
         """Create a string representation of the :class:`CommutationRulebook`."""
         text = f"{self.__class__.__name__}(rules=["
@@ -139,3 +156,45 @@ def same_gate(gate1: Gate, gate2: Gate) -> bool:
         Boolean value stating whether the gates are equal.
     """
     return gate1 == gate2
+
+
+def disjoint_qubits_matrix(circuit: Circuit) -> NDArray[np.bool_]:
+    """Vectorized version of :func:`disjoint_qubits` for all pairs of gates.
+
+    Args:
+        circuit: Circuit to check.
+
+    Returns:
+        Square Boolean array stating for each pair of gates whether they are disjoint.
+    """
+    q1 = circuit.q1[:, np.newaxis]
+    q2 = circuit.q2[:, np.newaxis]
+    return np.asarray(
+        (q1 != circuit.q1)
+        & (q1 != circuit.q2)
+        & (q2 != circuit.q1)
+        & (q2 != circuit.q2)
+    )
+
+
+def same_gate_matrix(circuit: Circuit) -> NDArray[np.bool_]:
+    """Vectorized version of :func:`same_gate` for all pairs of gates.
+
+    Args:
+        circuit: Circuit to check.
+
+    Returns:
+        Square Boolean array stating for each pair of gates whether they are equal.
+    """
+    return np.asarray(
+        (circuit.name[:, np.newaxis] == circuit.name)
+        & (circuit.q1[:, np.newaxis] == circuit.q1)
+        & (circuit.q2[:, np.newaxis] == circuit.q2)
+    )
+
+
+VECTORIZED_RULES: Dict[
+    Callable[[Gate, Gate], bool], Callable[[Circuit], NDArray[np.bool_]]
+] = {disjoint_qubits: disjoint_qubits_matrix, same_gate: same_gate_matrix}
+"""Mapping from commutation rules to their vectorized counterparts, which compute the
+rule for all pairs of gates of a circuit at once."""
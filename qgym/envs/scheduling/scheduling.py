@@ -26,6 +26,13 @@ Circuits:
         |q0>─────────────┴─────┤ X ├──
                                └───┘
 
+    For large circuits, the columnar :class:`~qgym.custom_types.Circuit` is more
+    efficient. It stores the gate names and qubits in arrays and is accepted everywhere
+    a list of gates is:
+
+    >>> from qgym.custom_types import Circuit
+    >>> circuit = Circuit(["x", "cnot", "x", "h"], [1, 0, 0, 1], [1, 1, 0, 1])
+
 
 Hardware specifications:
     Different operations defined by a quantum circuit have different operation times.
@@ -56,9 +63,9 @@ State space:
       and limitations.
     * `utils`: :class:`~qgym.envs.scheduling.scheduling_dataclasses.SchedulingUtils`
       dataclass with a circuit generator, commutation rulebook and a gate encoder.
-    * `gates`: Dictionary with gate names as keys and
-      :class:`~qgym.envs.scheduling.scheduling_dataclasses.GateInfo` dataclasses as
-      values.
+    * `gates`: :class:`~qgym.envs.scheduling.scheduling_dataclasses.GateInfo`
+      dataclass with arrays of the cycle lengths, machine restrictions and exclusion
+      counters of the gates, indexed by the integer encoded gate names.
     * `steps_done`: Number of steps done since the last reset.
     * `cycle`: Current 'machine' cycle.
     * `busy`: Used internally for the hardware limitations.
@@ -75,6 +82,17 @@ Observation space:
     * `legal_actions`: List of legal actions. If the value at index $i$ determines if
       gate number $i$ can be scheduled or not.
 
+    If the environment is created with ``flatten_observation=True``, the observation is
+    a single vector in a :class:`~qgym.spaces.Box` space, in which the entries are laid
+    out as follows ($g$ is `max_gates` and $d$ is `dependency_depth`):
+
+    * `legal_actions`: ``[0, g)``.
+    * `gate_names`: ``[g, 2g)``.
+    * `acts_on`: ``[2g, 4g)``.
+    * `dependencies`: ``[4g, (4 + d)g)``.
+
+    The offsets are also available as ``env.observation_layout.offsets``.
+
 Action Space:
     Performing a quantum operation takes a certain amount of time, which is measured in
     (machine) cycles. Therefore, this environment aims to produce a schedule in terms
@@ -89,6 +107,10 @@ Action Space:
     scheduled already), then the environment will do nothing, and the rewarder should
     give a penalty for this.
 
+    When the environment is created with ``auto_advance_cycle=True``, the cycle is
+    automatically advanced whenever no gate can be scheduled. The number of cycles that
+    were skipped this way is reported in the info under ``"Skipped cycles"``.
+
 Example 1:
     In this example we want to create an environment for a machine with the following
     properties:
@@ -158,13 +180,13 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from copy import deepcopy
-from typing import Any, Dict, Union, cast
+from typing import Any, Dict, Literal, Union, cast, overload
 
 import numpy as np
 from numpy.typing import NDArray
 
 import qgym.spaces
-from qgym.custom_types import Gate
+from qgym.custom_types import Circuit, Gate
 from qgym.envs.scheduling.machine_properties import MachineProperties
 from qgym.envs.scheduling.rulebook import CommutationRulebook
 from qgym.envs.scheduling.scheduling_rewarders import BasicRewarder
@@ -173,7 +195,12 @@ from qgym.envs.scheduling.scheduling_visualiser import SchedulingVisualiser
 from qgym.generators.circuit import BasicCircuitGenerator, CircuitGenerator
 from qgym.templates import Environment, Rewarder
 from qgym.utils.input_parsing import parse_rewarder, parse_visualiser
-from qgym.utils.input_validation import check_instance, check_int, check_string
+from qgym.utils.input_validation import (
+    check_bool,
+    check_instance,
+    check_int,
+    check_string,
+)
 
 
 class Scheduling(
@@ -191,6 +218,10 @@ class Scheduling(
         rulebook: CommutationRulebook | None = None,
         rewarder: Rewarder | None = None,
         render_mode: str | None = None,
+        auto_advance_cycle: bool = False,
+        circuit_cache_size: int = 0,
+        flatten_observation: bool = False,
+        render_backend: str = "pygame",
     ) -> None:
         """Initialize the action space, observation space, and initial states for the
         scheduling environment.
@@ -214,6 +245,20 @@ class Scheduling(
             render_mode: If ``"human"`` open a ``pygame`` screen visualizing the step.
                 If ``"rgb_array"``, return an RGB array encoding of the rendered frame
                 on each render call.
+            auto_advance_cycle: If ``True``, the cycle is automatically advanced
+                whenever no gate can be scheduled. The number of advanced cycles is
+                reported in the info under ``"Skipped cycles"``, such that rewarders
+                can still penalize them. Defaults to ``False``.
+            circuit_cache_size: Maximum number of preprocessed circuits to keep in a
+                least recently used cache, which makes resets to previously seen
+                circuits cheap. Useful when training or evaluating on a fixed set of
+                circuits. Defaults to 0, which disables the cache.
+            flatten_observation: If ``True``, the observation is flattened into a
+                single vector, see the observation space description. Defaults to
+                ``False``.
+            render_backend: Backend used for rendering. Choose from ``"pygame"``
+                (default) and ``"numpy"``. The ``"numpy"`` backend draws the
+                ``"rgb_array"`` frames with NumPy, without initializing ``pygame``.
         """
         self.metadata = {
             "render_modes": ["human", "rgb_array"],
@@ -247,12 +292,18 @@ class Scheduling(
             dependency_depth=dependency_depth,
             circuit_generator=circuit_generator,
             rulebook=rulebook,
+            auto_advance_cycle=check_bool(auto_advance_cycle, "auto_advance_cycle"),
+            circuit_cache_size=check_int(
+                circuit_cache_size, "circuit_cache_size", l_bound=0
+            ),
+        )
+        self._set_observation_space(
+            check_bool(flatten_observation, "flatten_observation", safe=True)
         )
-        self.observation_space = self._state.create_observation_space()
         self.action_space = qgym.spaces.MultiDiscrete([max_gates, 2], rng=self.rng)
 
         self._visualiser = parse_visualiser(
-            render_mode, SchedulingVisualiser, [self._state]
+            render_mode, SchedulingVisualiser, [self._state], render_backend
         )
 
     def reset(
@@ -280,29 +331,58 @@ class Scheduling(
         """
         return super().reset(seed=seed, options=options)
 
-    def get_circuit(self, mode: str = "human") -> list[Gate]:
+    @overload
+    def get_circuit(
+        self, mode: str = ..., *, columnar: Literal[False] = ...
+    ) -> list[Gate]: ...
+
+    @overload
+    def get_circuit(self, mode: str = ..., *, columnar: Literal[True]) -> Circuit: ...
+
+    def get_circuit(
+        self, mode: str = "human", *, columnar: bool = False
+    ) -> list[Gate] | Circuit:
         """Return the quantum circuit of this episode.
 
         Args:
             mode: Choose from be ``"human"`` or ``"encoded"``. Defaults to ``"human"``.
+            columnar: If ``True``, the circuit is returned as a columnar
+                :class:`~qgym.custom_types.Circuit`, which is converted in bulk and is
+                therefore much faster for large circuits. Otherwise, a list of ``Gate``
+                objects is returned. Defaults to ``False``.
 
         Raises:
             ValueError: If an unsupported mode is provided.
 
         Returns:
-            Human or encoded quantum circuit.
+            Copy of the human or encoded quantum circuit.
         """
         mode = check_string(mode, "mode", lower=True)
         state = cast(SchedulingState, self._state)
-        encoded_circuit = state.circuit_info.encoded
-        if mode == "encoded":
-            return deepcopy(encoded_circuit)
+        circuit = state.circuit_info.encoded
+        if mode not in ("human", "encoded"):
+            raise ValueError(f"mode must be 'human' or 'encoded', but was {mode}")
 
         if mode == "human":
-            gate_encoder = state.utils.gate_encoder
-            return gate_encoder.decode_gates(encoded_circuit)
+            circuit = state.utils.gate_encoder.decode_gates(circuit)
+        return circuit.copy() if columnar else circuit.to_gates()
 
-        raise ValueError(f"mode must be 'human' or 'encoded', but was {mode}")
+    def _static_objects(self) -> list[Any]:
+        """Objects which are not changed after the init of the environment.
+
+        Returns:
+            List with the machine properties, commutation rulebook, gate encoder and
+            the static gate information arrays.
+        """
+        state = self._state
+        return [
+            state.machine_properties,
+            state.utils.rulebook,
+            state.utils.gate_encoder,
+            state.gates.cycle_length,
+            state.gates.not_in_same_cycle,
+            state.gates.same_start,
+        ]
 
     @staticmethod
     def _parse_machine_properties(
@@ -4,12 +4,16 @@ environment.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass, field
+from typing import Any, Dict, Set, cast
 
 import numpy as np
 from numpy.typing import NDArray
 
-from qgym.custom_types import Gate
+from qgym.custom_types import Circuit, Gate
+from qgym.envs.scheduling.machine_properties import MachineProperties
 from qgym.envs.scheduling.rulebook import CommutationRulebook
 from qgym.generators.circuit import CircuitGenerator
 from qgym.utils.gate_encoder import GateEncoder
@@ -26,14 +30,55 @@ class SchedulingUtils:
 
 @dataclass
 class GateInfo:
+    """Info of the gates used in the :class:`~qgym.envs.Scheduling` environment.
+
+    All arrays are indexed by the integer encoding of the gate names. Index 0 is not
+    used by any gate and corresponds to the padding of the observations.
     """
-    Info of a specific gate used in the :class:`~qgym.envs.Scheduling` environment.
-    """
 
-    cycle_length: int
-    not_in_same_cycle: set[int]
-    exclude: int = 0
-    exclude_next_cycle: bool = False
+    cycle_length: NDArray[np.int_]
+    """Number of cycles each gate takes."""
+    not_in_same_cycle: NDArray[np.bool_]
+    """Square boolean matrix, where entry ``[i, j]`` states whether gates `i` and `j`
+    can not start in the same cycle."""
+    same_start: NDArray[np.bool_]
+    """Boolean mask of the gates that should start in the same cycle, or wait till the
+    previous one is done."""
+    exclude: NDArray[np.int_] = field(init=False)
+    """Number of cycles each gate is still excluded from being scheduled."""
+    exclude_next_cycle: NDArray[np.bool_] = field(init=False)
+    """Boolean mask of the gates that should be excluded from the next cycle onwards."""
+
+    def __post_init__(self) -> None:
+        """Initialize the exclusion counters."""
+        self.exclude = np.zeros_like(self.cycle_length)
+        self.exclude_next_cycle = np.zeros_like(self.same_start)
+
+    @classmethod
+    def from_machine_properties(cls, machine_properties: MachineProperties) -> GateInfo:
+        """Compile encoded machine properties into dense arrays.
+
+        Args:
+            machine_properties: :class:`~qgym.envs.scheduling.MachineProperties` of
+                which the gates are already encoded to integers.
+
+        Returns:
+            :class:`GateInfo` with the gate properties of `machine_properties`.
+        """
+        size = machine_properties.n_gates + 1
+        cycle_length = np.zeros(size, dtype=int)
+        not_in_same_cycle = np.zeros((size, size), dtype=bool)
+        same_start = np.zeros(size, dtype=bool)
+
+        gates = cast(Dict[int, int], machine_properties.gates)
+        for gate_name, n_cycles in gates.items():
+            cycle_length[gate_name] = n_cycles
+        restrictions = cast(Dict[int, Set[int]], machine_properties.not_in_same_cycle)
+        for gate_name, other_gates in restrictions.items():
+            not_in_same_cycle[gate_name, list(other_gates)] = True
+        same_start[list(machine_properties.same_start)] = True
+
+        return cls(cycle_length, not_in_same_cycle, same_start)
 
     def reset(self) -> GateInfo:
         """Reset the object.
@@ -44,10 +89,18 @@ class GateInfo:
         Returns:
             Self.
         """
-        self.exclude = 0
-        self.exclude_next_cycle = False
+        self.exclude[:] = 0
+        self.exclude_next_cycle[:] = False
         return self
 
+    def exclude_gates(self, gate_mask: NDArray[np.bool_]) -> None:
+        """Exclude gates from being scheduled for their own cycle length.
+
+        Args:
+            gate_mask: Boolean mask of the gates to exclude.
+        """
+        np.copyto(self.exclude, self.cycle_length, where=gate_mask)
+
 
 @dataclass
 class CircuitInfo:
@@ -55,15 +108,35 @@ class CircuitInfo:
     environment.
     """
 
-    encoded: list[Gate]
+    encoded: Circuit
     names: NDArray[np.int_]
     acts_on: NDArray[np.int_]
     legal: NDArray[np.int8]
     dependencies: NDArray[np.int_]
     schedule: NDArray[np.int_]
     blocking_matrix: NDArray[np.int_]
+    n_blocking: NDArray[np.int_] = field(init=False)
+    """Number of gates that still have to be scheduled before each gate can be
+    scheduled (i.e., the remaining predecessors in the dependency DAG)."""
+    blocks: list[NDArray[np.int_]] = field(init=False)
+    """For each gate, the indices of the gates it blocks (i.e., its successors in the
+    dependency DAG)."""
+    frontier: NDArray[np.bool_] = field(init=False)
+    """Boolean mask of length `max_gates` of the unscheduled gates without remaining
+    blocking gates."""
+    durations: NDArray[np.int_] = field(
+        init=False, default_factory=lambda: np.zeros(0, dtype=np.int_)
+    )
+    """Number of cycles each gate of the circuit takes. This is set by the
+    :class:`~qgym.envs.scheduling.SchedulingState` and is empty before."""
 
-    def reset(self, circuit: list[Gate] | None, utils: SchedulingUtils) -> CircuitInfo:
+    def __post_init__(self) -> None:
+        """Build the dependency DAG of the initial circuit."""
+        self.build_dependency_dag()
+
+    def reset(
+        self, circuit: Circuit | list[Gate] | None, utils: SchedulingUtils
+    ) -> CircuitInfo:
         """Reset the object.
 
         To be used in the reset function of the :class:`~qgym.envs.Scheduling`
@@ -74,8 +147,128 @@ class CircuitInfo:
         """
         if circuit is None:
             circuit = next(utils.circuit_generator)
+        if not isinstance(circuit, Circuit):
+            circuit = Circuit.from_gates(circuit)
 
         self.blocking_matrix = utils.rulebook.make_blocking_matrix(circuit)
         self.encoded = utils.gate_encoder.encode_gates(circuit)
         self.schedule = np.full(len(circuit), -1, dtype=int)
+        self.build_dependency_dag()
+        return self
+
+    def load_preprocessed(self, preprocessed: CircuitInfo) -> CircuitInfo:
+        """Load the episode constant attributes of a preprocessed circuit.
+
+        Attributes that are updated during an episode are copied, the others are shared
+        with `preprocessed`.
+
+        Args:
+            preprocessed: :class:`CircuitInfo` of a circuit that was preprocessed before
+                and for which no gates have been scheduled yet.
+
+        Returns:
+            Self.
+        """
+        self.encoded = preprocessed.encoded
+        self.names = preprocessed.names.copy()
+        self.acts_on = preprocessed.acts_on.copy()
+        self.dependencies = preprocessed.dependencies.copy()
+        self.schedule = np.full(len(preprocessed.encoded), -1, dtype=int)
+        self.blocking_matrix = preprocessed.blocking_matrix.copy()
+        self.n_blocking = preprocessed.n_blocking.copy()
+        self.blocks = preprocessed.blocks
+        self.frontier = preprocessed.frontier.copy()
+        return self
+
+    def build_dependency_dag(self) -> None:
+        """Build the dependency DAG from the blocking matrix.
+
+        Since the circuit is scheduled from right to left, gate `j` blocks gate `i` if
+        ``i < j`` and ``blocking_matrix[i, j]`` is ``True``.
+        """
+        n_gates = len(self.encoded)
+        self.n_blocking = np.count_nonzero(self.blocking_matrix, axis=1)
+        self.blocks = [
+            np.flatnonzero(self.blocking_matrix[:gate_idx, gate_idx])
+            for gate_idx in range(n_gates)
+        ]
+        self.frontier = np.zeros(len(self.legal), dtype=bool)
+        self.frontier[:n_gates] = self.n_blocking == 0
+
+    def remove_from_dag(self, gate_idx: int) -> NDArray[np.int_]:
+        """Remove a scheduled gate from the dependency DAG.
+
+        The blocking counters of the gates blocked by `gate_idx` are decreased and gates
+        without remaining blocking gates are added to the frontier. This takes time
+        linear in the number of gates blocked by `gate_idx`.
+
+        Args:
+            gate_idx: Index of the gate that was scheduled.
+
+        Returns:
+            Indices of the gates that were blocked by `gate_idx`.
+        """
+        self.frontier[gate_idx] = False
+        blocked_gates = self.blocks[gate_idx]
+        self.n_blocking[blocked_gates] -= 1
+        self.frontier[blocked_gates] = self.n_blocking[blocked_gates] == 0
+        return blocked_gates
+
+
+class CircuitCache:
+    """Bounded least recently used cache of preprocessed circuits used in the
+    :class:`~qgym.envs.Scheduling` environment.
+
+    The cache is shared between (deep) copies, since the cached entries are never
+    modified.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Init of the :class:`CircuitCache`.
+
+        Args:
+            maxsize: Maximum number of circuits to store. If 0, nothing is cached.
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, CircuitInfo] = OrderedDict()
+
+    def get(self, key: Hashable) -> CircuitInfo | None:
+        """Get a preprocessed circuit and mark it as most recently used.
+
+        Args:
+            key: Key of the circuit.
+
+        Returns:
+            The cached :class:`CircuitInfo`, or ``None`` if `key` is not in the cache.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Hashable, entry: CircuitInfo) -> None:
+        """Store a preprocessed circuit, evicting the least recently used circuit if the
+        cache is full.
+
+        Args:
+            key: Key of the circuit.
+            entry: :class:`CircuitInfo` of the preprocessed circuit.
+        """
+        if self.maxsize == 0:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all circuits from the cache."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of cached circuits."""
+        return len(self._entries)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> CircuitCache:
+        """Return self, such that copies of a state share the same cache."""
         return self
@@ -95,15 +95,19 @@ class BasicRewarder(Rewarder):
             The reward for this action. If the action is illegal, then the reward is
             `illegal_action_penalty`. If the action is legal, and increments the cycle,
             then the reward is `update_cycle_penalty`. Otherwise, the reward is
-            `schedule_gate_bonus`.
+            `schedule_gate_bonus`. For each cycle that was automatically skipped by the
+            state, `update_cycle_penalty` is added to the reward.
         """
         if action[1] != 0:
-            return self._update_cycle_penalty
-
-        if self._is_illegal(action, old_state):
-            return self._illegal_action_penalty
-
-        return self._schedule_gate_bonus
+            reward = self._update_cycle_penalty
+        elif self._is_illegal(action, old_state):
+            reward = self._illegal_action_penalty
+        else:
+            reward = self._schedule_gate_bonus
+
+        if new_state.skipped_cycles > 0:
+            reward += self._update_cycle_penalty * new_state.skipped_cycles
+        return reward
 
     @staticmethod
     def _is_illegal(action: NDArray[np.int_], old_state: SchedulingState) -> bool:
@@ -199,13 +203,9 @@ class EpisodeRewarder(Rewarder):
         if not new_state.is_done():
             return 0
 
-        reward = 0
-        for gate_idx, scheduled_cycle in enumerate(new_state.circuit_info.schedule):
-            gate = new_state.circuit_info.encoded[gate_idx]
-            finished = scheduled_cycle + new_state.gates[gate.name].cycle_length
-            reward = min(reward, self._update_cycle_penalty * finished)
-
-        return reward
+        circuit_info = new_state.circuit_info
+        finished = circuit_info.schedule + circuit_info.durations
+        return float(np.min(self._update_cycle_penalty * finished, initial=0))
 
     @staticmethod
     def _is_illegal(action: NDArray[np.int_], old_state: SchedulingState) -> bool:
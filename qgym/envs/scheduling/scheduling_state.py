@@ -6,16 +6,18 @@ This :class:`SchedulingState` represents the :class:`~qgym.templates.State` of t
 
 from __future__ import annotations
 
-from typing import Any, Dict, Set, Union, cast
+from copy import deepcopy
+from typing import Any, Dict, Union
 
 import numpy as np
 from numpy.typing import NDArray
 
 import qgym.spaces
-from qgym.custom_types import Gate
+from qgym.custom_types import Circuit, Gate
 from qgym.envs.scheduling.machine_properties import MachineProperties
 from qgym.envs.scheduling.rulebook import CommutationRulebook
 from qgym.envs.scheduling.scheduling_dataclasses import (
+    CircuitCache,
     CircuitInfo,
     GateInfo,
     SchedulingUtils,
@@ -37,6 +39,8 @@ class SchedulingState(
         dependency_depth: int,
         circuit_generator: CircuitGenerator,
         rulebook: CommutationRulebook,
+        auto_advance_cycle: bool = False,
+        circuit_cache_size: int = 0,
     ) -> None:
         """Init of the :class:`SchedulingState` class.
 
@@ -50,11 +54,27 @@ class SchedulingState(
             circuit_generator: Generator class for generating circuits for training.
             rulebook: :class:`~qgym.envs.scheduling.CommutationRulebook` describing the
                 commutation rules.
+            auto_advance_cycle: If ``True``, the cycle is automatically advanced
+                whenever no gate can be scheduled, until a gate can be scheduled again.
+                Defaults to ``False``.
+            circuit_cache_size: Maximum number of preprocessed circuits to keep in a
+                least recently used cache. Resetting to a cached circuit skips the
+                computation of the blocking matrix, encoding and dependencies. Defaults
+                to 0, which disables the cache.
         """
         self.steps_done = 0
         """Number of steps done since the last reset."""
         self.cycle = 0
         """Current 'machine' cycle."""
+        self.auto_advance_cycle = auto_advance_cycle
+        """Boolean value stating whether the cycle is automatically advanced when no
+        gate can be scheduled."""
+        self.skipped_cycles = 0
+        """Number of cycles that were automatically advanced during the last update or
+        reset."""
+        self.makespan = 0
+        """Number of cycles of the partial schedule, i.e., the latest cycle in which a
+        scheduled gate finishes."""
         self.machine_properties = machine_properties
         """:class:`~qgym.envs.scheduling.MachineProperties` class containing machine
         properties and limitations.
@@ -69,29 +89,25 @@ class SchedulingState(
         encoder.
         """
 
-        # At the start no gates should be excluded
-        gate_cycle_lengths = cast(Dict[int, int], machine_properties.gates)
-        not_in_same_cycle = cast(
-            Dict[int, Set[int]], machine_properties.not_in_same_cycle
-        )
-        self.gates = {
-            gate_name: GateInfo(
-                cycle_length=gate_cycle_lengths[gate_name],
-                not_in_same_cycle=not_in_same_cycle[gate_name],
-            )
-            for gate_name in gate_cycle_lengths
-        }
-        """Dictionary with gate names as keys and
-        :class:`~qgym.envs.scheduling.scheduling_dataclasses.GateInfo` dataclasses as
-        values.
+        self.gates = GateInfo.from_machine_properties(machine_properties)
+        """:class:`~qgym.envs.scheduling.scheduling_dataclasses.GateInfo` dataclass with
+        the cycle lengths, machine restrictions and exclusion counters of the gates,
+        indexed by the integer encoding of the gate names.
         """
         self.busy = np.zeros(machine_properties.n_qubits, dtype=int)
         """Amount of cycles that a qubit is still busy (zero if available). Used
         internally for the hardware limitations.
         """
 
+        self.circuit_cache = CircuitCache(circuit_cache_size)
+        """:class:`~qgym.envs.scheduling.scheduling_dataclasses.CircuitCache` with
+        preprocessed circuits, keyed by the circuit and the commutation rules.
+        """
+
         # Generate a circuit
         circuit = next(self.utils.circuit_generator)
+        if not isinstance(circuit, Circuit):
+            circuit = Circuit.from_gates(circuit)
 
         self.circuit_info = CircuitInfo(
             encoded=self.utils.gate_encoder.encode_gates(circuit),
@@ -108,62 +124,70 @@ class SchedulingState(
 
         self._update_dependencies()
         self._update_episode_constant_observations()
+        self._update_durations()
         self._update_legal_actions()
+        self._advance_cycle()
 
-    def _update_dependencies(self) -> None:
-        """Compute and update the dependencies array of the current state."""
-        self.circuit_info.dependencies = np.zeros_like(self.circuit_info.dependencies)
+    def _update_dependencies(
+        self, gate_indices: NDArray[np.int_] | None = None
+    ) -> None:
+        """Compute and update the dependencies array of the current state.
 
-        for gate_idx, blocking_row in enumerate(self.circuit_info.blocking_matrix):
-            blocking_gates = blocking_row[gate_idx:].nonzero()[0]
-            for depth in range(
-                min(self.circuit_info.dependencies.shape[0], blocking_gates.shape[0])
-            ):
-                self.circuit_info.dependencies[depth, gate_idx] = blocking_gates[depth]
+        Args:
+            gate_indices: Indices of the gates for which the dependencies should be
+                updated. If ``None`` (default), the dependencies of all gates are
+                recomputed.
+        """
+        if gate_indices is None:
+            self.circuit_info.dependencies = np.zeros_like(
+                self.circuit_info.dependencies
+            )
+            gate_indices = np.arange(len(self.circuit_info.encoded))
+
+        dependency_depth = self.circuit_info.dependencies.shape[0]
+        for gate_idx in gate_indices:
+            blocking_row = self.circuit_info.blocking_matrix[gate_idx]
+            blocking_gates = blocking_row[gate_idx:].nonzero()[0][:dependency_depth]
+            self.circuit_info.dependencies[:, gate_idx] = 0
+            self.circuit_info.dependencies[: len(blocking_gates), gate_idx] = (
+                blocking_gates
+            )
 
     def _update_episode_constant_observations(self) -> None:
         """Update episode constant observations `gate_names` and `acts_on`.
 
         Based on the circuit of the current episode.
         """
+        encoded = self.circuit_info.encoded
+        n_gates = len(encoded)
         self.circuit_info.names = np.zeros_like(self.circuit_info.names)
         self.circuit_info.acts_on = np.zeros_like(self.circuit_info.acts_on)
 
-        for gate_idx, gate in enumerate(self.circuit_info.encoded):
-            self.circuit_info.names[gate_idx] = gate.name
-            self.circuit_info.acts_on[0, gate_idx] = gate.q1
-            self.circuit_info.acts_on[1, gate_idx] = gate.q2
+        self.circuit_info.names[:n_gates] = encoded.name
+        self.circuit_info.acts_on[0, :n_gates] = encoded.q1
+        self.circuit_info.acts_on[1, :n_gates] = encoded.q2
+
+    def _update_durations(self) -> None:
+        """Update the number of cycles each gate of the circuit takes."""
+        n_gates = len(self.circuit_info.encoded)
+        names = self.circuit_info.names[:n_gates]
+        self.circuit_info.durations = self.gates.cycle_length[names]
 
     def _update_legal_actions(self) -> None:
         """Check which actions are legal based on the scheduled qubits.
 
         An action is legal if the gate could be scheduled based on the machine
-        properties and commutation rules.
+        properties and commutation rules. The gates allowed by the commutation rules
+        are given by the frontier of the dependency DAG, so only the hardware
+        limitations have to be checked here.
         """
-        self.circuit_info.legal = np.zeros_like(self.circuit_info.legal)
-        for gate_idx, (gate_name, qubit1, qubit2) in enumerate(
-            self.circuit_info.encoded
-        ):
-            # Set all gates, which have not been scheduled to True
-            if self.circuit_info.schedule[gate_idx] == -1:
-                self.circuit_info.legal[gate_idx] = True
-
-            # Check if there is a non-scheduled dependent gate
-
-            dependent_gates = self.circuit_info.dependencies[:, gate_idx]
-            if np.count_nonzero(dependent_gates) > 0:
-                self.circuit_info.legal[gate_idx] = False
-                continue
-
-            # Check if the qubits are busy
-            if self.busy[qubit1] > 0 or self.busy[qubit2] > 0:
-                self.circuit_info.legal[gate_idx] = False
-                continue
-
-            # Check if gates should be excluded
-            if self.gates[gate_name].exclude > 0:
-                self.circuit_info.legal[gate_idx] = False
-                continue
+        excluded = self.gates.exclude > 0
+        busy = self.busy > 0
+        legal = self.circuit_info.frontier.copy()
+        legal &= ~busy[self.circuit_info.acts_on[0]]
+        legal &= ~busy[self.circuit_info.acts_on[1]]
+        legal &= ~excluded[self.circuit_info.names]
+        self.circuit_info.legal = legal.astype(np.int8)
 
     def create_observation_space(self) -> qgym.spaces.Dict:
         """Create the corresponding observation space.
@@ -239,6 +263,7 @@ class SchedulingState(
         return {
             "Steps done": self.steps_done,
             "Cycle": self.cycle,
+            "Skipped cycles": self.skipped_cycles,
             "Schedule": self.circuit_info.schedule,
         }
 
@@ -254,23 +279,25 @@ class SchedulingState(
         """
         # Increase the step number
         self.steps_done += 1
+        self.skipped_cycles = 0
 
         # Increase the cycle if the action is given
         if action[1]:
             self._increment_cycle()
-            return self
+        else:
+            # Schedule the gate if it is allowed
+            gate_to_schedule = action[0]
+            if self.circuit_info.legal[gate_to_schedule]:
+                self._schedule_gate(gate_to_schedule)
 
-        # Schedule the gate if it is allowed
-        gate_to_schedule = action[0]
-        if self.circuit_info.legal[gate_to_schedule]:
-            self._schedule_gate(gate_to_schedule)
+        self._advance_cycle()
         return self
 
     def reset(
         self,
         *,
         seed: int | None = None,
-        circuit: list[Gate] | None = None,
+        circuit: Circuit | list[Gate] | None = None,
         **_kwargs: Any,
     ) -> SchedulingState:
         """Reset the state and load a new (random) initial state.
@@ -280,9 +307,9 @@ class SchedulingState(
         Args:
             seed: Seed for the random number generator, should only be provided
                 (optionally) on the first reset call, i.e., before any learning is done.
-            circuit: Optional list of a circuit for the next episode, each entry in the
-                list should be a ``Gate``. When a circuit is give, no random circuit
-                will be generated.
+            circuit: Optional circuit for the next episode, either as a columnar
+                :class:`~qgym.custom_types.Circuit` or as a list of ``Gate`` objects.
+                When a circuit is give, no random circuit will be generated.
             _kwargs: Additional options to configure the reset.
 
         Returns:
@@ -294,52 +321,102 @@ class SchedulingState(
         # Reset counters
         self.steps_done = 0
         self.cycle = 0
+        self.skipped_cycles = 0
+        self.makespan = 0
 
         # Amount of cycles that a qubit is still busy (zero if available)
         self.busy = np.zeros_like(self.busy)
 
         # At the start no gates should be excluded
-        for gate_info in self.gates.values():
-            gate_info.reset()
+        self.gates.reset()
 
         # Generate a circuit if None is given
-        self.circuit_info.reset(circuit, self.utils)
+        if circuit is None:
+            circuit = next(self.utils.circuit_generator)
+        self._load_circuit(circuit)
 
-        self._update_dependencies()
-        self._update_episode_constant_observations()
+        self._update_durations()
         self._update_legal_actions()
+        self._advance_cycle()
 
         return self
 
-    def _increment_cycle(self) -> None:
-        """Increment the cycle and update the state accordingly."""
-        self.cycle += 1
+    def _load_circuit(self, circuit: Circuit | list[Gate]) -> None:
+        """Load and preprocess a circuit, using the circuit cache if it is enabled.
+
+        Args:
+            circuit: Circuit to load.
+        """
+        if not isinstance(circuit, Circuit):
+            circuit = Circuit.from_gates(circuit)
+
+        if self.circuit_cache.maxsize == 0:
+            self.circuit_info.reset(circuit, self.utils)
+            self._update_dependencies()
+            self._update_episode_constant_observations()
+            return
+
+        key = (circuit, self.utils.rulebook.rules)
+        preprocessed = self.circuit_cache.get(key)
+        if preprocessed is not None:
+            self.circuit_info.load_preprocessed(preprocessed)
+            return
+
+        self.circuit_info.reset(circuit, self.utils)
+        self._update_dependencies()
+        self._update_episode_constant_observations()
+        self.circuit_cache.put(key, deepcopy(self.circuit_info))
+
+    def _increment_cycle(self, n_cycles: int = 1) -> None:
+        """Increment the cycle and update the state accordingly.
+
+        Args:
+            n_cycles: Number of cycles to increment. Defaults to 1.
+        """
+        self.cycle += n_cycles
 
         # Reduce the amount of cycles each qubit is busy
-        self.busy[self.busy > 0] -= 1
+        np.maximum(self.busy - n_cycles, 0, out=self.busy)
 
         # Exclude gates that should start at the same time
-        for gate_name, gate_info in self.gates.items():
-            if gate_info.exclude_next_cycle:
-                gate_info.exclude_next_cycle = False
-                self._exclude_gate(gate_name)
+        self.gates.exclude_gates(self.gates.exclude_next_cycle)
+        self.gates.exclude_next_cycle[:] = False
 
-        # Decrease the amount of cycles to exclude a gate and skip gates where the
-        # cycle becomes 0 (as it no longer should be excluded)
-        for gate_info in self.gates.values():
-            if gate_info.exclude > 0:
-                gate_info.exclude -= 1
+        # Decrease the amount of cycles to exclude a gate, stopping at 0 (as it no
+        # longer should be excluded)
+        np.maximum(self.gates.exclude - n_cycles, 0, out=self.gates.exclude)
 
         self._update_legal_actions()
 
-    def _exclude_gate(self, gate_name: int) -> None:
-        """Exclude a gate from the 'legal_actions' for 'gate_cycle_length' cycles.
+    def _advance_cycle(self) -> None:
+        """Advance the cycle to the first cycle in which a gate can be scheduled.
 
-        Args:
-            gate_name: integer encoding of the name of the gate.
+        Does nothing if `auto_advance_cycle` is ``False``, if a gate can already be
+        scheduled or if all gates have been scheduled. The cycles are advanced in a
+        single jump and the number of advanced cycles is added to `skipped_cycles`.
         """
-        gate_cycle_length = self.gates[gate_name].cycle_length
-        self.gates[gate_name].exclude = gate_cycle_length
+        if (
+            not self.auto_advance_cycle
+            or self.circuit_info.legal.any()
+            or self.is_done()
+        ):
+            return
+
+        # Number of cycles until each gate type is no longer excluded
+        excluded = np.where(
+            self.gates.exclude_next_cycle, self.gates.cycle_length, self.gates.exclude
+        )
+
+        # Number of cycles until each gate in the frontier can be scheduled
+        frontier = self.circuit_info.frontier.nonzero()[0]
+        names = self.circuit_info.names[frontier]
+        qubits1, qubits2 = self.circuit_info.acts_on[:, frontier]
+        wait = np.maximum(self.busy[qubits1], self.busy[qubits2])
+        wait = np.maximum(wait, excluded[names])
+
+        n_cycles = max(int(wait.min()), 1)
+        self.skipped_cycles += n_cycles
+        self._increment_cycle(n_cycles)
 
     def _schedule_gate(self, gate_idx: int) -> None:
         """Schedule a gate in the current cycle and update the state accordingly.
@@ -347,21 +424,24 @@ class SchedulingState(
         Args:
             gate_idx: Index of the gate to schedule.
         """
-        gate = self.circuit_info.encoded[gate_idx]
+        encoded = self.circuit_info.encoded
+        name = encoded.name[gate_idx]
 
         # add the gate to the schedule
         self.circuit_info.schedule[gate_idx] = self.cycle
+        finished = self.cycle + self.circuit_info.durations[gate_idx]
+        self.makespan = max(self.makespan, int(finished))
 
-        self.busy[gate.q1] = self.gates[gate.name].cycle_length
-        self.busy[gate.q2] = self.gates[gate.name].cycle_length
+        self.busy[encoded.q1[gate_idx]] = self.gates.cycle_length[name]
+        self.busy[encoded.q2[gate_idx]] = self.gates.cycle_length[name]
 
-        for gate_to_exclude in self.gates[gate.name].not_in_same_cycle:
-            self._exclude_gate(gate_to_exclude)
+        self.gates.exclude_gates(self.gates.not_in_same_cycle[name])
 
-        if gate.name in self.machine_properties.same_start:
-            self.gates[gate.name].exclude_next_cycle = True
+        if self.gates.same_start[name]:
+            self.gates.exclude_next_cycle[name] = True
 
-        # Update "dependencies" observation
+        # Update the dependency DAG and "dependencies" observation
         self.circuit_info.blocking_matrix[:gate_idx, gate_idx] = False
-        self._update_dependencies()
+        blocked_gates = self.circuit_info.remove_from_dag(gate_idx)
+        self._update_dependencies(blocked_gates)
         self._update_legal_actions()
@@ -1,27 +1,49 @@
 """This module contains a class used for rendering the :class:`~qgym.envs.Scheduling`
 environment.
+
+In ``"human"`` mode, the frames are drawn by a background thread at a limited frame
+rate, such that rendering does not slow down the environment. Steps that happen while a
+frame is being drawn are skipped, so the screen always shows a recent state. In
+``"rgb_array"`` mode, each render call draws and returns the frame immediately.
 """
 
 from __future__ import annotations
 
-from typing import Dict, cast
+import threading
+import time
+from typing import Dict, NamedTuple, cast
 
 import numpy as np
 import pygame
 from numpy.typing import NDArray
 
-from qgym.custom_types import Gate
+from qgym.custom_types import Circuit, Gate
 from qgym.envs.scheduling.scheduling_state import SchedulingState
 from qgym.templates.visualiser import RenderData, Visualiser
 from qgym.utils.visualisation.colors import BLACK, BLUE, DARK_BLUE, WHITE
-from qgym.utils.visualisation.typing import Font
-from qgym.utils.visualisation.wrappers import write_text
+from qgym.utils.visualisation.typing import Font, Surface
+from qgym.utils.visualisation.wrappers import draw_rect, write_text
+
+
+class _Frame(NamedTuple):
+    """Snapshot of the parts of a :class:`SchedulingState` that are rendered."""
+
+    cycle: int
+    schedule: NDArray[np.int_]
+    circuit: Circuit
 
 
 class SchedulingVisualiser(Visualiser):
     """Visualiser class for the :class:`~qgym.envs.Scheduling` environment."""
 
-    def __init__(self, render_mode: str, initial_state: SchedulingState) -> None:
+    def __init__(
+        self,
+        render_mode: str,
+        initial_state: SchedulingState,
+        *,
+        max_fps: float = 20,
+        backend: str = "pygame",
+    ) -> None:
         """Init of the :class:`SchedulingVisualiser`.
 
         Args:
@@ -30,7 +52,13 @@ class SchedulingVisualiser(Visualiser):
             render_mode: If ``"human"`` open a ``pygame`` screen visualizing the step.
                 If ``"rgb_array"``, return an RGB array encoding of the rendered frame
                 on each render call.
+            max_fps: Maximum number of frames per second drawn in ``"human"`` mode.
+                Defaults to 20.
+            backend: Render backend. Choose from ``"pygame"`` (default) and
+                ``"numpy"``, which only supports the ``"rgb_array"`` mode.
         """
+        self.backend = backend
+
         # Rendering data
         self.offset = {"x-axis": 100, "y-axis": 0}
         colors = {
@@ -58,15 +86,33 @@ class SchedulingVisualiser(Visualiser):
             longest_gate = max(longest_gate, n_cycles)
 
         self.gate_size_info = {"height": gate_height, "longest": longest_gate}
+        self.max_fps = max_fps
+        """Maximum number of frames per second drawn in ``"human"`` mode."""
+        self.frames_drawn = 0
+        """Number of frames drawn by the render thread."""
 
-        # define attributes that are set later
-        self._cycle_width = 0.0
+        self._machine_properties = initial_state.machine_properties
+        self._gate_encoder = initial_state.utils.gate_encoder
 
-    def render(self, state: SchedulingState) -> None | NDArray[np.int_]:
+        # The render thread draws on the back buffer and swaps it with the front buffer,
+        # which is shown on the screen by the main thread.
+        self._buffers = [self.screen.copy(), self.screen.copy()]
+        self._draw_lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._pending_frame: tuple[int, _Frame] | None = None
+        self._frame_indices = {"submitted": 0, "drawn": 0, "shown": 0}
+        self._stopped = False
+        self._render_thread: threading.Thread | None = None
+
+    def render(
+        self, state: SchedulingState, out: NDArray[np.uint8] | None = None
+    ) -> None | NDArray[np.int_]:
         """Render the current state using pygame.
 
         Args:
             state: State to render.
+            out: Optional preallocated array to write the frame to in 'rgb_array'
+                mode, instead of allocating a new array.
 
         Raises:
             ValueError: If an unsupported mode is provided.
@@ -74,35 +120,164 @@ class SchedulingVisualiser(Visualiser):
         Returns:
             Result of rendering, based on `render_mode`.
         """
-        pygame.time.delay(50)
+        with self._draw_lock:
+            self._draw(self._snapshot(state), self.screen)
+        with self._condition:
+            # Frames of the render thread are older than this one
+            self._frame_indices["shown"] = self._frame_indices["submitted"]
+        return self._display(out)
+
+    def step(self, state: SchedulingState) -> None:
+        """Hand the state to the render thread if `render_mode` is 'human'.
+
+        This does not wait for the frame to be drawn. If the render thread is still
+        busy with a previous frame, only the latest state is drawn.
+
+        Args:
+            state: State to render if `render_mode` is 'human'.
+        """
+        if self.render_data.render_mode != "human":
+            return
+
+        if self._render_thread is None:
+            self._render_thread = threading.Thread(
+                target=self._render_loop, name="SchedulingVisualiser", daemon=True
+            )
+            self._render_thread.start()
+
+        with self._condition:
+            self._frame_indices["submitted"] += 1
+            self._pending_frame = (
+                self._frame_indices["submitted"],
+                self._snapshot(state),
+            )
+            self._condition.notify_all()
+        self._present()
+        pygame.event.pump()
+
+    def reset(self, state: SchedulingState) -> None:
+        """Show the last frame of the previous episode and start rendering `state`.
+
+        Args:
+            state: State to render if `render_mode` is 'human'.
+        """
+        self._flush()
+        super().reset(state)
+
+    def close(self) -> None:
+        """Show the last submitted frame, stop the render thread and close the screen
+        used for rendering.
+        """
+        self._flush()
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._render_thread is not None:
+            self._render_thread.join()
+            self._render_thread = None
+        super().close()
 
-        self.screen.fill(self.colors["background"])
-        self._draw_y_axis(state.machine_properties.n_qubits)
+    def _render_loop(self) -> None:
+        """Draw the pending frames on the back buffer at a limited frame rate."""
+        next_frame_time = time.perf_counter()
+        while True:
+            with self._condition:
+                while self._pending_frame is None and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                (index, frame), self._pending_frame = self._pending_frame, None
 
-        self._cycle_width = (self.screen_width - self.offset["x-axis"]) / (
-            state.cycle + self.gate_size_info["longest"]
+            with self._draw_lock:
+                self._draw(frame, self._buffers[1])
+            with self._condition:
+                self._buffers.reverse()
+                self._frame_indices["drawn"] = index
+                self.frames_drawn += 1
+                self._condition.notify_all()
+
+            next_frame_time = max(
+                next_frame_time + 1 / self.max_fps, time.perf_counter()
+            )
+            time.sleep(max(0.0, next_frame_time - time.perf_counter()))
+
+    def _present(self) -> None:
+        """Show the latest frame drawn by the render thread, if it was not shown yet.
+
+        This should be called from the main thread.
+        """
+        with self._condition:
+            indices = self._frame_indices
+            if indices["drawn"] <= indices["shown"]:
+                return
+            indices["shown"] = indices["drawn"]
+            self.screen.blit(self._buffers[0], (0, 0))
+        pygame.display.flip()
+
+    def _flush(self) -> None:
+        """Wait until the render thread has drawn the last submitted frame and show it.
+
+        This should be called from the main thread.
+        """
+        if self._render_thread is None:
+            return
+        with self._condition:
+            while (
+                self._frame_indices["drawn"] < self._frame_indices["submitted"]
+                and self._render_thread.is_alive()
+            ):
+                self._condition.wait(timeout=0.1)
+        self._present()
+
+    @staticmethod
+    def _snapshot(state: SchedulingState) -> _Frame:
+        """Copy the parts of the state that are rendered.
+
+        Args:
+            state: State to copy.
+
+        Returns:
+            Snapshot of `state`, which is not changed by later steps.
+        """
+        return _Frame(
+            cycle=state.cycle,
+            schedule=state.circuit_info.schedule.copy(),
+            circuit=state.circuit_info.encoded,
         )
 
-        for gate_idx, scheduled_cycle in enumerate(state.circuit_info.schedule):
-            if scheduled_cycle != -1:
-                gate = state.circuit_info.encoded[gate_idx]
-                gate_cycle_length = cast(
-                    Dict[int, int], state.machine_properties.gates
-                )[gate.name]
-                gate_name = state.utils.gate_encoder.decode_gates(gate.name)
-                self._draw_scheduled_gate(
-                    gate, scheduled_cycle, gate_cycle_length, gate_name
-                )
+    def _draw(self, frame: _Frame, screen: Surface) -> None:
+        """Draw a frame.
 
-        return self._display()
+        Args:
+            frame: Snapshot of the state to draw.
+            screen: Screen to draw on.
+        """
+        screen.fill(self.colors["background"])
+        self._draw_y_axis(screen, self._machine_properties.n_qubits)
 
-    def _draw_y_axis(self, n_qubits: int) -> None:
+        cycle_width = (self.screen_width - self.offset["x-axis"]) / (
+            frame.cycle + self.gate_size_info["longest"]
+        )
+        gates = cast(Dict[int, int], self._machine_properties.gates)
+        for gate_idx in np.flatnonzero(frame.schedule != -1):
+            gate = frame.circuit[gate_idx]
+            gate_name = self._gate_encoder.decode_gates(gate.name)
+            self._draw_scheduled_gate(
+                screen,
+                gate,
+                frame.schedule[gate_idx],
+                gates[gate.name],
+                gate_name,
+                cycle_width,
+            )
+
+    def _draw_y_axis(self, screen: Surface, n_qubits: int) -> None:
         """Draw the y-axis of the display.
 
         Args:
+            screen: Screen to draw on.
             n_qubits: Number of qubits of the machine.
         """
-        screen = self.screen
         for i in range(n_qubits):
             pos = (
                 self.offset["x-axis"] / 2,
@@ -110,40 +285,59 @@ class SchedulingVisualiser(Visualiser):
             )
             write_text(screen, self.font["axis"], f"Q{i}", pos, self.colors["y-axis"])
 
-    def _draw_scheduled_gate(
-        self, gate: Gate, scheduled_cycle: int, gate_cycle_length: int, gate_name: str
+    def _draw_scheduled_gate(  # pylint: disable=too-many-arguments
+        self,
+        screen: Surface,
+        gate: Gate,
+        scheduled_cycle: int,
+        gate_cycle_length: int,
+        gate_name: str,
+        cycle_width: float,
     ) -> None:
         """Draw a gate on the screen.
 
         Args:
+            screen: Screen to draw on.
             gate: Gate to draw.
             scheduled_cycle: Cycle the gate is scheduled.
             gate_cycle_length: Length of the gate in terms of machine cycles.
             gate_name: Name of the gate.
+            cycle_width: Width of a single machine cycle on the screen.
         """
-        self._draw_gate_block(gate_name, gate_cycle_length, gate.q1, scheduled_cycle)
-        if gate.q1 != gate.q2:
+        for qubit in {gate.q1, gate.q2}:
             self._draw_gate_block(
-                gate_name, gate_cycle_length, gate.q2, scheduled_cycle
+                screen,
+                gate_name,
+                qubit,
+                scheduled_cycle,
+                gate_cycle_length,
+                cycle_width,
             )
 
-    def _draw_gate_block(
-        self, gate_name: str, gate_cycle_length: int, qubit: int, scheduled_cycle: int
+    def _draw_gate_block(  # pylint: disable=too-many-arguments
+        self,
+        screen: Surface,
+        gate_name: str,
+        qubit: int,
+        scheduled_cycle: int,
+        gate_cycle_length: int,
+        cycle_width: float,
     ) -> None:
         """Draw a single block of a gate (gates can consist of 1 or 2 blocks).
 
         Args:
+            screen: Screen to draw on.
             gate_name: Name of the gate.
-            gate_cycle_length: Length of the gate in terms of machine cycles.
             qubit: Qubit in which the gate acts.
             scheduled_cycle: Cycle in which the gate is scheduled.
+            gate_cycle_length: Length of the gate in terms of machine cycles.
+            cycle_width: Width of a single machine cycle on the screen.
         """
-        screen = self.screen
-        gate_width = self._cycle_width * gate_cycle_length
+        gate_width = cycle_width * gate_cycle_length
         gate_box_size = (0.98 * gate_width, 0.98 * self.gate_size_info["height"])
 
         box_pos = (
-            self.screen_width - scheduled_cycle * self._cycle_width - gate_width,
+            self.screen_width - scheduled_cycle * cycle_width - gate_width,
             self.screen_height
             - qubit * self.gate_size_info["height"]
             - self.offset["y-axis"]
@@ -151,8 +345,8 @@ class SchedulingVisualiser(Visualiser):
         )
         gate_box = pygame.Rect(box_pos, gate_box_size)
 
-        pygame.draw.rect(screen, self.colors["gate_fill"], gate_box, border_radius=5)
-        pygame.draw.rect(
+        draw_rect(screen, self.colors["gate_fill"], gate_box, border_radius=5)
+        draw_rect(
             screen, self.colors["gate_outline"], gate_box, width=2, border_radius=5
         )
         write_text(
@@ -164,13 +358,9 @@ class SchedulingVisualiser(Visualiser):
         )
 
     def _start_font(self) -> dict[str, Font]:
-        """Start the ``pygame`` fonts for the gate and axis font.
+        """Start the fonts for the gate and axis font.
 
         Returns:
-            ``pygame`` fonts for the gate and axis font.
+            Fonts for the gate and axis font.
         """
-        pygame.font.init()
-        return {
-            "gate": pygame.font.SysFont("Arial", 12),
-            "axis": pygame.font.SysFont("Arial", 30),
-        }
+        return {"gate": self._get_font(12), "axis": self._get_font(30)}
@@ -5,21 +5,36 @@ These data generators can be used during training, as well as during evaluation.
 
 from qgym.generators.circuit import (
     BasicCircuitGenerator,
+    CorpusCircuitGenerator,
     NullCircuitGenerator,
     WorkshopCircuitGenerator,
+    write_circuit_corpus,
+)
+from qgym.generators.graph import (
+    BasicGraphGenerator,
+    CorpusGraphGenerator,
+    NullGraphGenerator,
+    write_graph_corpus,
 )
-from qgym.generators.graph import BasicGraphGenerator, NullGraphGenerator
 from qgym.generators.interaction import (
     BasicInteractionGenerator,
+    CorpusInteractionGenerator,
     NullInteractionGenerator,
+    write_interaction_corpus,
 )
 
 __all__ = [
     "BasicCircuitGenerator",
+    "CorpusCircuitGenerator",
     "NullCircuitGenerator",
     "WorkshopCircuitGenerator",
+    "write_circuit_corpus",
     "BasicGraphGenerator",
+    "CorpusGraphGenerator",
     "NullGraphGenerator",
+    "write_graph_corpus",
     "BasicInteractionGenerator",
+    "CorpusInteractionGenerator",
     "NullInteractionGenerator",
+    "write_interaction_corpus",
 ]
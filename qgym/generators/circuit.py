@@ -3,17 +3,26 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import Any, Iterator, List, SupportsInt
+from collections.abc import Iterable, Sequence
+from typing import Any, Iterator, List, Literal, SupportsInt, Union, overload
 
 import numpy as np
 from numpy.random import Generator
-
-from qgym.custom_types import Gate
+from numpy.typing import NDArray
+
+from qgym.custom_types import Circuit, Gate
+from qgym.generators.corpus import (
+    Corpus,
+    CorpusSampler,
+    PathLike,
+    concatenate_records,
+    write_corpus,
+)
 from qgym.utils.input_parsing import parse_seed
-from qgym.utils.input_validation import check_int
+from qgym.utils.input_validation import check_bool, check_int
 
 
-class CircuitGenerator(Iterator[List[Gate]]):
+class CircuitGenerator(Iterator[Union[List[Gate], Circuit]]):
     """Abstract Base Class for circuit generation used for scheduling.
 
     All interaction circuit generators should inherit from :class:`CircuitGenerator`
@@ -24,14 +33,15 @@ class CircuitGenerator(Iterator[List[Gate]]):
     """Boolean value stating whether the generator is finite."""
 
     @abstractmethod
-    def __next__(self) -> list[Gate]:
+    def __next__(self) -> list[Gate] | Circuit:
         """Make a new circuit.
 
         The __next__ method of a :class:`CircuitGenerator` should generate a list of
-        Gates.
+        Gates or a columnar :class:`~qgym.custom_types.Circuit`.
 
         Example circuit:
             >>> circuit = [Gate("prep", 0,0), Gate("prep", 1,1), Gate("cnot", 0,1)]
+            >>> columnar_circuit = Circuit(["prep", "prep", "cnot"], [0, 1, 0], [0, 1, 1])
         """
 
     @abstractmethod
@@ -43,6 +53,20 @@ class CircuitGenerator(Iterator[List[Gate]]):
         :class:`~qgym.envs.scheduling.SchedulingState` are provided.
         """
 
+    def generate_batch(self, n_circuits: SupportsInt) -> list[list[Gate] | Circuit]:
+        """Generate a batch of circuits.
+
+        Generators that can generate circuits in bulk should override this method.
+
+        Args:
+            n_circuits: Number of circuits to generate.
+
+        Returns:
+            List of `n_circuits` circuits.
+        """
+        n_circuits = check_int(n_circuits, "n_circuits", l_bound=0)
+        return [next(self) for _ in range(n_circuits)]
+
 
 class BasicCircuitGenerator(CircuitGenerator):
     """:class:`BasicCircuitGenerator` is a basic random circuit generation
@@ -93,29 +117,59 @@ class BasicCircuitGenerator(CircuitGenerator):
         The length of the circuit is a random integer in the interval
         [`n_qubits`, `max_length`].
         """
-        n_gates = self.rng.integers(self.n_qubits, self.max_gates, endpoint=True)
-        gate_names = ["x", "y", "z", "cnot", "measure"]
-        probabilities = [0.16, 0.16, 0.16, 0.5, 0.02]
+        return self.generate_batch(1)[0]
 
-        circuit: list[Gate] = []
+    @overload
+    def generate_batch(
+        self, n_circuits: SupportsInt, *, columnar: Literal[False] = ...
+    ) -> list[list[Gate]]: ...
 
-        for qubit in range(self.n_qubits):
-            circuit.append(Gate("prep", qubit, qubit))
+    @overload
+    def generate_batch(
+        self, n_circuits: SupportsInt, *, columnar: Literal[True]
+    ) -> list[Circuit]: ...
 
-        for _ in range(self.n_qubits, n_gates):
-            name = self.rng.choice(gate_names, p=probabilities)
+    def generate_batch(
+        self, n_circuits: SupportsInt, *, columnar: bool = False
+    ) -> list[list[Gate]] | list[Circuit]:
+        """Generate a batch of random circuits, drawing all gates in bulk.
 
-            if name == "cnot":
-                qubit1, qubit2 = self.rng.choice(
-                    np.arange(self.n_qubits), size=2, replace=False
-                )
-            else:
-                qubit1 = self.rng.integers(self.n_qubits)
-                qubit2 = qubit1
+        Each circuit starts with a 'prep' gate on every qubit, followed by random gates.
+        The length of each circuit is a random integer in the interval
+        [`n_qubits`, `max_length`].
 
-            circuit.append(Gate(name, qubit1, qubit2))
+        Args:
+            n_circuits: Number of circuits to generate.
+            columnar: If ``True``, each circuit is returned as a columnar
+                :class:`~qgym.custom_types.Circuit` instead of a list of ``Gate``
+                objects. Defaults to ``False``.
 
-        return circuit
+        Returns:
+            List of `n_circuits` circuits.
+        """
+        n_circuits = check_int(n_circuits, "n_circuits", l_bound=0)
+        n_gates = self.rng.integers(
+            self.n_qubits, self.max_gates, endpoint=True, size=n_circuits
+        )
+        circuits = _sample_circuits(
+            self.rng,
+            self.n_qubits,
+            n_gates - self.n_qubits,
+            gate_names=["x", "y", "z", "cnot", "measure"],
+            probabilities=[0.16, 0.16, 0.16, 0.5, 0.02],
+        )
+
+        qubits = np.arange(self.n_qubits)
+        prep_names = np.full(self.n_qubits, "prep")
+        circuits = [
+            Circuit(
+                np.concatenate((prep_names, circuit.name)),
+                np.concatenate((qubits, circuit.q1)),
+                np.concatenate((qubits, circuit.q2)),
+            )
+            for circuit in circuits
+        ]
+        return _format_circuits(circuits, columnar)
 
 
 class WorkshopCircuitGenerator(CircuitGenerator):
@@ -166,26 +220,47 @@ class WorkshopCircuitGenerator(CircuitGenerator):
         The length of the circuit is a random integer in the interval
         [`n_qubits`, `max_length`].
         """
-        n_gates = self.rng.integers(self.n_qubits, self.max_gates, endpoint=True)
-        gate_names = ["x", "y", "cnot", "measure"]
-        probabilities = [0.2, 0.2, 0.5, 0.1]
+        return self.generate_batch(1)[0]
 
-        circuit: list[Gate] = []
+    @overload
+    def generate_batch(
+        self, n_circuits: SupportsInt, *, columnar: Literal[False] = ...
+    ) -> list[list[Gate]]: ...
 
-        for _ in range(n_gates):
-            name = self.rng.choice(gate_names, p=probabilities)
+    @overload
+    def generate_batch(
+        self, n_circuits: SupportsInt, *, columnar: Literal[True]
+    ) -> list[Circuit]: ...
 
-            if name == "cnot":
-                qubit1, qubit2 = self.rng.choice(
-                    np.arange(self.n_qubits), size=2, replace=False
-                )
-            else:
-                qubit1 = self.rng.integers(self.n_qubits)
-                qubit2 = qubit1
+    def generate_batch(
+        self, n_circuits: SupportsInt, *, columnar: bool = False
+    ) -> list[list[Gate]] | list[Circuit]:
+        """Generate a batch of random circuits, drawing all gates in bulk.
 
-            circuit.append(Gate(name, qubit1, qubit2))
+        The length of each circuit is a random integer in the interval
+        [`n_qubits`, `max_length`].
 
-        return circuit
+        Args:
+            n_circuits: Number of circuits to generate.
+            columnar: If ``True``, each circuit is returned as a columnar
+                :class:`~qgym.custom_types.Circuit` instead of a list of ``Gate``
+                objects. Defaults to ``False``.
+
+        Returns:
+            List of `n_circuits` circuits.
+        """
+        n_circuits = check_int(n_circuits, "n_circuits", l_bound=0)
+        n_gates = self.rng.integers(
+            self.n_qubits, self.max_gates, endpoint=True, size=n_circuits
+        )
+        circuits = _sample_circuits(
+            self.rng,
+            self.n_qubits,
+            n_gates,
+            gate_names=["x", "y", "cnot", "measure"],
+            probabilities=[0.2, 0.2, 0.5, 0.1],
+        )
+        return _format_circuits(circuits, columnar)
 
 
 class NullCircuitGenerator(CircuitGenerator):
@@ -213,3 +288,219 @@ class NullCircuitGenerator(CircuitGenerator):
         Args:
             kwargs: Keyword arguments.
         """
+
+
+class CorpusCircuitGenerator(CircuitGenerator):
+    """Generator class that serves circuits from an on-disk corpus.
+
+    The corpus should be written with :func:`write_circuit_corpus`. It is memory-mapped,
+    so it is not loaded into memory and it is shared between all processes that serve
+    circuits from it. Each worker can serve a disjoint shard of the corpus.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        path: PathLike,
+        *,
+        shuffle: bool = False,
+        finite: bool = False,
+        seed: Generator | SupportsInt | None = None,
+        worker_id: SupportsInt = 0,
+        n_workers: SupportsInt = 1,
+        columnar: bool = False,
+    ) -> None:
+        """Init of the :class:`CorpusCircuitGenerator`.
+
+        Args:
+            path: Directory containing the circuit corpus.
+            shuffle: Whether to serve the circuits in a random order, which is
+                reshuffled every epoch. Defaults to ``False``.
+            finite: If ``True``, stop after all circuits of the shard have been served
+                once. Defaults to ``False``.
+            seed: Seed to use for shuffling.
+            worker_id: Index of the shard to serve. Defaults to 0.
+            n_workers: Number of shards the corpus is divided in. Defaults to 1.
+            columnar: If ``True``, the circuits are served as columnar
+                :class:`~qgym.custom_types.Circuit` objects instead of lists of
+                ``Gate`` objects. Defaults to ``False``.
+        """
+        self.corpus = Corpus(path)
+        self.sampler = CorpusSampler(
+            len(self.corpus),
+            shuffle=shuffle,
+            finite=finite,
+            seed=seed,
+            worker_id=worker_id,
+            n_workers=n_workers,
+        )
+        self.finite = self.sampler.finite
+        self.columnar = check_bool(columnar, "columnar", safe=True)
+        self.gate_names: list[str] = self.corpus.arrays["gate_names"].tolist()
+
+    def __repr__(self) -> str:
+        """String representation of the :class:`CorpusCircuitGenerator`."""
+        return (
+            f"CorpusCircuitGenerator[corpus={self.corpus}, "
+            f"sampler={self.sampler}, "
+            f"columnar={self.columnar}, "
+            f"finite={self.finite}]"
+        )
+
+    def __next__(self) -> list[Gate] | Circuit:
+        """Serve the next circuit of the corpus."""
+        record = self.corpus.record(next(self.sampler))
+        if self.columnar:
+            names = self.corpus.arrays["gate_names"][record[:, 0]]
+            return Circuit(names, record[:, 1], record[:, 2])
+
+        rows = record.tolist()
+        gate_names = self.gate_names
+        return [Gate(gate_names[name], qubit1, qubit2) for name, qubit1, qubit2 in rows]
+
+    def set_state_attributes(
+        self, machine_properties: Any = None, **kwargs: Any
+    ) -> None:
+        """Check that the circuits of the corpus fit on the machine.
+
+        The number of qubits used by the corpus is stored when the corpus is written,
+        so the check does not read the circuits of the corpus.
+
+        Args:
+            machine_properties: :class:`~qgym.envs.scheduling.MachineProperties`
+                containing at least the number of qubits of the machine.
+            kwargs: Additional keyword arguments. These are not used.
+
+        Raises:
+            ValueError: If a gate of the corpus acts on a qubit that is not on the
+                machine.
+        """
+        if not hasattr(machine_properties, "n_qubits"):
+            raise AttributeError(
+                "'machine_properties' did not have the 'n_qubits' attribute"
+            )
+        if int(self.corpus.arrays["n_qubits"]) > machine_properties.n_qubits:
+            msg = "the corpus contains gates acting on qubits that are not on the "
+            msg += f"machine with {machine_properties.n_qubits} qubits"
+            raise ValueError(msg)
+
+
+def write_circuit_corpus(
+    path: PathLike, circuits: Iterable[Circuit | Sequence[Gate]]
+) -> None:
+    """Write circuits to an on-disk corpus for the :class:`CorpusCircuitGenerator`.
+
+    The gates of all circuits are stored as rows of an integer array with columns
+    ``(name, q1, q2)``, where the name is an index into a table of gate names. The
+    number of qubits used by the circuits is stored as well.
+
+    Args:
+        path: Directory to write the corpus to.
+        circuits: Circuits to store, either as columnar
+            :class:`~qgym.custom_types.Circuit` objects or as sequences of ``Gate``
+            objects.
+
+    Raises:
+        ValueError: If a gate acts on a negative qubit.
+    """
+    gate_names: dict[str, int] = {}
+    records: list[Any] = []
+    for circuit in circuits:
+        if isinstance(circuit, Circuit):
+            unique_names, inverse = np.unique(circuit.name, return_inverse=True)
+            name_indices = np.array(
+                [
+                    gate_names.setdefault(name, len(gate_names))
+                    for name in unique_names.tolist()
+                ],
+                dtype=np.int_,
+            )
+            records.append(
+                np.column_stack((name_indices[inverse], circuit.q1, circuit.q2))
+            )
+        else:
+            records.append(
+                [
+                    (
+                        gate_names.setdefault(gate.name, len(gate_names)),
+                        gate.q1,
+                        gate.q2,
+                    )
+                    for gate in circuit
+                ]
+            )
+    rows, offsets = concatenate_records(records, 3)
+    if (rows[:, 1:] < 0).any():
+        raise ValueError("the circuits should not contain negative qubits")
+    write_corpus(
+        path,
+        rows=rows,
+        offsets=offsets,
+        gate_names=np.array(list(gate_names), dtype=str),
+        n_qubits=np.array(rows[:, 1:].max(initial=-1) + 1),
+    )
+
+
+def _sample_circuits(
+    rng: Generator,
+    n_qubits: int,
+    n_gates: NDArray[np.int_],
+    *,
+    gate_names: Sequence[str],
+    probabilities: Sequence[float],
+) -> list[Circuit]:
+    """Sample the gates of multiple random circuits in bulk.
+
+    Single qubit gates act on a uniformly random qubit. The 'cnot' gates act on a
+    uniformly random pair of distinct qubits.
+
+    Args:
+        rng: Random number generator to use.
+        n_qubits: Number of qubits of the circuits.
+        n_gates: Array with the number of gates of each circuit.
+        gate_names: Names of the gates to sample from.
+        probabilities: Probability of each gate name.
+
+    Returns:
+        List of columnar circuits, one for each entry of `n_gates`.
+    """
+    if len(n_gates) == 0:
+        return []
+
+    total_gates = int(np.sum(n_gates))
+    names = rng.choice(gate_names, size=total_gates, p=probabilities)
+    qubit1 = rng.integers(n_qubits, size=total_gates)
+    qubit2 = qubit1.copy()
+
+    # Draw the second qubit of each cnot from the remaining qubits
+    is_cnot = names == "cnot"
+    n_cnots = np.count_nonzero(is_cnot)
+    if n_cnots > 0:
+        other_qubit = rng.integers(n_qubits - 1, size=n_cnots)
+        qubit2[is_cnot] = other_qubit + (other_qubit >= qubit1[is_cnot])
+
+    splits = np.cumsum(n_gates)[:-1]
+    return list(
+        map(
+            Circuit,
+            np.split(names, splits),
+            np.split(qubit1, splits),
+            np.split(qubit2, splits),
+        )
+    )
+
+
+def _format_circuits(
+    circuits: list[Circuit], columnar: bool
+) -> list[list[Gate]] | list[Circuit]:
+    """Convert columnar circuits to lists of ``Gate`` objects if requested.
+
+    Args:
+        circuits: Columnar circuits to format.
+        columnar: If ``True``, the circuits are returned as is.
+
+    Returns:
+        The formatted circuits.
+    """
+    if columnar:
+        return circuits
+    return [circuit.to_gates() for circuit in circuits]
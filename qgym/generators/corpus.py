@@ -0,0 +1,245 @@
+"""This module contains the building blocks for generators that serve data from an
+on-disk corpus.
+
+A corpus is a directory of ``.npy`` files. The records of a corpus (e.g., circuits) are
+concatenated into data arrays, and an offsets array marks where each record starts and
+ends, such that record `i` of a data array is ``data[offsets[i]:offsets[i+1]]``. The
+files are opened as read-only memory maps, so records are served by zero-copy slicing
+and the corpus is shared between all processes that open it.
+
+.. note::
+    Memory mapping is not possible for arrays inside (compressed) ``.npz`` archives.
+    Therefore, every array of a corpus is stored in a separate ``.npy`` file.
+
+Usage:
+    .. code-block:: python
+
+        import numpy as np
+        from qgym.generators.corpus import Corpus, concatenate_records, write_corpus
+
+        rows, offsets = concatenate_records([np.zeros((2, 2)), np.ones((3, 2))], 2)
+        write_corpus("my_corpus", rows=rows, offsets=offsets)
+        corpus = Corpus("my_corpus")
+        record = corpus.record(1)  # array of shape (3, 2)
+
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Dict, SupportsInt, Tuple, Union
+
+import numpy as np
+from numpy.random import Generator
+from numpy.typing import ArrayLike, DTypeLike, NDArray
+
+from qgym.utils.input_parsing import parse_seed
+from qgym.utils.input_validation import check_bool, check_int
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+def concatenate_records(
+    records: Iterable[ArrayLike], n_columns: int, dtype: DTypeLike = np.int_
+) -> Tuple[NDArray[Any], NDArray[np.int_]]:
+    """Concatenate records into a single data array and an offsets array.
+
+    Args:
+        records: Records to concatenate. Each record should be an array of shape
+            ``(n_rows, n_columns)``.
+        n_columns: Number of columns of each record.
+        dtype: Data type of the concatenated array. Defaults to ``int``.
+
+    Returns:
+        Tuple containing the concatenated data array of shape
+        ``(total_rows, n_columns)`` and the offsets array of length ``n_records + 1``.
+    """
+    arrays = [
+        np.asarray(record, dtype=dtype).reshape(-1, n_columns) for record in records
+    ]
+    offsets = np.zeros(len(arrays) + 1, dtype=np.int_)
+    np.cumsum([len(array) for array in arrays], out=offsets[1:])
+    if len(arrays) == 0:
+        return np.empty((0, n_columns), dtype=dtype), offsets
+    return np.concatenate(arrays), offsets
+
+
+def write_corpus(path: PathLike, **arrays: ArrayLike) -> None:
+    """Write the arrays of a corpus to the directory `path`.
+
+    Args:
+        path: Directory to write the corpus to. It is created if it does not exist.
+        arrays: Arrays of the corpus. Each array is stored as ``<name>.npy``. An array
+            named ``offsets`` should be present.
+
+    Raises:
+        ValueError: If no ``offsets`` array is provided.
+    """
+    if "offsets" not in arrays:
+        raise ValueError("a corpus should contain an 'offsets' array")
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, array in arrays.items():
+        np.save(directory / f"{name}.npy", np.asarray(array))
+
+
+class Corpus:
+    """Read-only, memory-mapped corpus of records stored in a directory.
+
+    Copies of a :class:`Corpus` share the memory maps. When pickled, only the path is
+    stored, such that worker processes reopen the memory maps instead of receiving a
+    copy of the data.
+    """
+
+    __slots__ = ("path", "arrays")
+
+    def __init__(self, path: PathLike) -> None:
+        """Init of the :class:`Corpus`.
+
+        Args:
+            path: Directory containing the ``.npy`` files of the corpus.
+
+        Raises:
+            ValueError: If the directory does not contain an ``offsets.npy`` file.
+        """
+        self.path = Path(path)
+        """Directory containing the corpus."""
+        self.arrays: Dict[str, NDArray[Any]] = {}
+        """Dictionary with the memory-mapped arrays of the corpus."""
+        self._open()
+
+    def _open(self) -> None:
+        """Open all arrays of the corpus as read-only memory maps."""
+        if not (self.path / "offsets.npy").is_file():
+            raise ValueError(f"'{self.path}' does not contain a corpus")
+        self.arrays = {
+            file.stem: np.load(file, mmap_mode="r")
+            for file in sorted(self.path.glob("*.npy"))
+        }
+
+    def __len__(self) -> int:
+        """Number of records in the corpus."""
+        return len(self.arrays["offsets"]) - 1
+
+    def record(
+        self, idx: int, name: str = "rows", offsets: str = "offsets"
+    ) -> NDArray[Any]:
+        """Get a single record of the data array `name` without copying.
+
+        Args:
+            idx: Index of the record.
+            name: Name of the data array. Defaults to ``"rows"``.
+            offsets: Name of the offsets array belonging to the data array. Defaults
+                to ``"offsets"``.
+
+        Returns:
+            Read-only view of the record.
+        """
+        start, stop = self.arrays[offsets][idx : idx + 2]
+        return self.arrays[name][start:stop]
+
+    def __deepcopy__(self, memo: Any) -> Corpus:
+        """The corpus is read-only, so copies share the memory maps."""
+        return self
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Only the path is pickled."""
+        return {"path": self.path}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Reopen the memory maps after unpickling."""
+        self.path = state["path"]
+        self._open()
+
+    def __repr__(self) -> str:
+        """String representation of the :class:`Corpus`."""
+        return f"Corpus[path={self.path}, n_records={len(self)}]"
+
+
+class CorpusSampler:
+    """Iterator over the record indices of a corpus.
+
+    The records are divided over `n_workers` workers in a round robin fashion, such
+    that every worker serves a disjoint shard. Each epoch visits all records of the
+    shard once, optionally in a random order that is reshuffled every epoch.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        n_records: int,
+        *,
+        shuffle: bool = False,
+        finite: bool = False,
+        seed: Generator | SupportsInt | None = None,
+        worker_id: SupportsInt = 0,
+        n_workers: SupportsInt = 1,
+    ) -> None:
+        """Init of the :class:`CorpusSampler`.
+
+        Args:
+            n_records: Number of records in the corpus.
+            shuffle: Whether to visit the records in a random order. Defaults to
+                ``False``.
+            finite: If ``True``, stop after a single epoch. Otherwise, start a new epoch
+                when all records have been visited. Defaults to ``False``.
+            seed: Seed to use for shuffling.
+            worker_id: Index of the shard to serve. Defaults to 0.
+            n_workers: Number of shards the corpus is divided in. Defaults to 1.
+
+        Raises:
+            ValueError: If the shard of this worker is empty.
+        """
+        self.shuffle = check_bool(shuffle, "shuffle", safe=True)
+        self.finite = check_bool(finite, "finite", safe=True)
+        self.rng = parse_seed(seed)
+        self.n_workers = check_int(n_workers, "n_workers", l_bound=1)
+        self.worker_id = check_int(
+            worker_id, "worker_id", l_bound=0, u_bound=self.n_workers - 1
+        )
+        self.indices = np.arange(self.worker_id, n_records, self.n_workers)
+        """Indices of the records in the shard of this worker."""
+        if len(self.indices) == 0:
+            raise ValueError(f"worker {self.worker_id} has no records to serve")
+        self.epoch = 0
+        """Number of completed epochs."""
+        self._order = self._new_order()
+        self._position = 0
+
+    def _new_order(self) -> NDArray[np.int_]:
+        """Order in which the records are visited in the next epoch."""
+        if self.shuffle:
+            return self.rng.permutation(self.indices)
+        return self.indices
+
+    def __iter__(self) -> CorpusSampler:
+        """Return self."""
+        return self
+
+    def __next__(self) -> int:
+        """Index of the next record.
+
+        Raises:
+            StopIteration: If the sampler is finite and the epoch is finished.
+        """
+        if self._position == len(self._order):
+            if self.finite:
+                raise StopIteration
+            self.epoch += 1
+            self._order = self._new_order()
+            self._position = 0
+
+        idx = int(self._order[self._position])
+        self._position += 1
+        return idx
+
+    def __repr__(self) -> str:
+        """String representation of the :class:`CorpusSampler`."""
+        return (
+            f"CorpusSampler[shuffle={self.shuffle}, "
+            f"finite={self.finite}, "
+            f"worker_id={self.worker_id}, "
+            f"n_workers={self.n_workers}, "
+            f"epoch={self.epoch}]"
+        )
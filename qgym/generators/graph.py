@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import Any, Iterator, SupportsFloat, SupportsInt
+from collections.abc import Iterable
+from typing import Any, Iterator, SupportsFloat, SupportsInt, Tuple
 
 import networkx as nx
+import numpy as np
 from numpy.random import Generator
+from numpy.typing import NDArray
 
+from qgym.generators.corpus import (
+    Corpus,
+    CorpusSampler,
+    PathLike,
+    concatenate_records,
+    write_corpus,
+)
 from qgym.utils.input_parsing import parse_seed
 from qgym.utils.input_validation import check_graph_is_valid_topology, check_real
 
@@ -32,6 +42,28 @@ class GraphGenerator(Iterator[nx.Graph]):
         to the number of nodes minus 1.
         """
 
+    def generate_edges(self) -> NDArray[np.int_]:
+        """Make a new interaction graph represented by an array of its edges.
+
+        By default, the edges of the graph produced by ``next(self)`` are returned.
+        Generators that can sample the edges directly should override this method,
+        such that no :class:~`networkx.Graph` has to be constructed.
+
+        Returns:
+            Array of shape ``(n_edges, 2)`` containing the edges of a new interaction
+            graph. Each undirected edge is present only once.
+        """
+        return np.array(next(self).edges(), dtype=np.int_).reshape(-1, 2)
+
+    def max_edges(self) -> int | None:
+        """Give the maximum number of edges of the generated interaction graphs.
+
+        Returns:
+            Upper bound on the number of edges of the generated graphs, or ``None`` if
+            the generator does not know such a bound (default).
+        """
+        return None
+
     @abstractmethod
     def set_state_attributes(self, **kwargs: Any) -> None:
         """Set attributes that the state can receive.
@@ -45,8 +77,9 @@ class GraphGenerator(Iterator[nx.Graph]):
 class BasicGraphGenerator(GraphGenerator):
     """:class:`BasicGraphGenerator` is a simple graph generation implementation.
 
-    It uses :func:`~networkx.generators.random_graphs.fast_gnp_random_graph` to generate
-    graphs.
+    It generates Erdős-Rényi graphs, in which each possible edge is present with a fixed
+    probability. The edges are sampled in a vectorized way on the upper triangle of the
+    adjacency matrix.
     """
 
     def __init__(
@@ -58,9 +91,7 @@ class BasicGraphGenerator(GraphGenerator):
 
         Args:
             interaction_graph_edge_probability: Probability to add an edge between two
-                nodes. See the documentation of
-                :func:`~networkx.generators.random_graphs.fast_gnp_random_graph` for
-                more information.
+                nodes.
             seed: Seed to use.
         """
         self.interaction_graph_edge_probability = check_real(
@@ -88,9 +119,31 @@ class BasicGraphGenerator(GraphGenerator):
 
     def __next__(self) -> nx.Graph:
         """Create a new randomly generated :class:~`networkx.Graph`."""
-        return nx.fast_gnp_random_graph(
-            n=self.n_nodes, p=self.interaction_graph_edge_probability, seed=self.rng
-        )
+        graph = nx.empty_graph(self.n_nodes)
+        graph.add_edges_from(self.generate_edges().tolist())
+        return graph
+
+    def generate_edges(self) -> NDArray[np.int_]:
+        """Sample the edges of a new random interaction graph.
+
+        Returns:
+            Array of shape ``(n_edges, 2)`` containing the sampled edges ``(i, j)``
+            with ``i < j``, sorted in lexicographical order.
+        """
+        rows, cols = np.triu_indices(self.n_nodes, k=1)
+        mask = self.rng.random(len(rows)) < self.interaction_graph_edge_probability
+        return np.column_stack((rows[mask], cols[mask]))
+
+    def max_edges(self) -> int:
+        """Give the maximum number of edges of the generated interaction graphs.
+
+        Returns:
+            Number of edges of the complete graph with `n_nodes` nodes, or 0 if the
+            edge probability is 0.
+        """
+        if self.interaction_graph_edge_probability == 0:
+            return 0
+        return self.n_nodes * (self.n_nodes - 1) // 2
 
     def set_state_attributes(
         self, *, connection_graph: nx.Graph | None = None, **kwargs: Any
@@ -126,9 +179,190 @@ class NullGraphGenerator(GraphGenerator):
         """String representation of the :class:`NullGraphGenerator`."""
         return f"NullGraphGenerator[finite={self.finite}]"
 
+    def max_edges(self) -> int:
+        """Give the maximum number of edges of the generated interaction graphs, which
+        is 0.
+        """
+        return 0
+
     def set_state_attributes(self, **kwargs: Any) -> None:
         """Receive state attributes, but do nothing with it.
 
         Args:
             kwargs: Keyword arguments.
         """
+
+
+class CorpusGraphGenerator(GraphGenerator):
+    """Generator class that serves interaction graphs from an on-disk corpus.
+
+    The corpus should be written with :func:`write_graph_corpus`. Each graph is stored
+    as a symmetric adjacency matrix in compressed sparse row (CSR) format, i.e., as
+    `indptr`, `indices` and `weights` arrays, which are memory-mapped. The
+    :class:`~qgym.envs.initial_mapping.InitialMappingState` obtains the edges of the
+    graphs through :func:`generate_edges`, so no ``networkx`` graphs are constructed.
+    Each worker can serve a disjoint shard of the corpus.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        path: PathLike,
+        *,
+        shuffle: bool = False,
+        finite: bool = False,
+        seed: Generator | SupportsInt | None = None,
+        worker_id: SupportsInt = 0,
+        n_workers: SupportsInt = 1,
+    ) -> None:
+        """Init of the :class:`CorpusGraphGenerator`.
+
+        Args:
+            path: Directory containing the graph corpus.
+            shuffle: If ``True``, serve the graphs in a random order, which is
+                reshuffled every epoch. Otherwise, serve the graphs sequentially.
+                Defaults to ``False``.
+            finite: If ``True``, stop after all graphs of the shard have been served
+                once. Defaults to ``False``.
+            seed: Seed to use for shuffling.
+            worker_id: Index of the shard to serve. Defaults to 0.
+            n_workers: Number of shards the corpus is divided in. Defaults to 1.
+        """
+        self.corpus = Corpus(path)
+        self.sampler = CorpusSampler(
+            len(self.corpus),
+            shuffle=shuffle,
+            finite=finite,
+            seed=seed,
+            worker_id=worker_id,
+            n_workers=n_workers,
+        )
+        self.finite = self.sampler.finite
+
+    def __repr__(self) -> str:
+        """String representation of the :class:`CorpusGraphGenerator`."""
+        return (
+            f"CorpusGraphGenerator[corpus={self.corpus}, "
+            f"sampler={self.sampler}, "
+            f"finite={self.finite}]"
+        )
+
+    def generate_csr(
+        self,
+    ) -> Tuple[NDArray[np.int_], NDArray[np.int_], NDArray[np.float_]]:
+        """Serve the next graph of the corpus in CSR format without copying.
+
+        Returns:
+            Tuple containing read-only views of the `indptr`, `indices` and `weights`
+            arrays of the symmetric adjacency matrix of the graph.
+        """
+        idx = next(self.sampler)
+        return (
+            self.corpus.record(idx, "indptr", "indptr_offsets"),
+            self.corpus.record(idx, "indices"),
+            self.corpus.record(idx, "weights"),
+        )
+
+    def generate_edges(self) -> NDArray[np.int_]:
+        """Serve the edges of the next graph of the corpus.
+
+        Returns:
+            Array of shape ``(n_edges, 2)`` containing the edges ``(i, j)`` with
+            ``i <= j`` of the next graph.
+        """
+        indptr, indices, _ = self.generate_csr()
+        rows, upper = _csr_upper_triangle(indptr, indices)
+        return np.column_stack((rows[upper], indices[upper]))
+
+    def __next__(self) -> nx.Graph:
+        """Serve the next graph of the corpus as a weighted :class:~`networkx.Graph`."""
+        indptr, indices, weights = self.generate_csr()
+        rows, upper = _csr_upper_triangle(indptr, indices)
+        graph = nx.empty_graph(len(indptr) - 1)
+        graph.add_weighted_edges_from(
+            zip(rows[upper].tolist(), indices[upper].tolist(), weights[upper].tolist())
+        )
+        return graph
+
+    def set_state_attributes(
+        self, *, connection_graph: nx.Graph | None = None, **kwargs: Any
+    ) -> None:
+        """Check that the graphs of the corpus fit on the connection graph.
+
+        Args:
+            connection_graph: A :class:`~networkx.Graph` representation of the
+                connection graph.
+            kwargs: Additional keyword arguments. These are not used.
+
+        Raises:
+            ValueError: If a graph of the corpus has more nodes than the connection
+                graph.
+        """
+        connection_graph = check_graph_is_valid_topology(
+            connection_graph, "connection_graph"
+        )
+        n_nodes = np.diff(self.corpus.arrays["indptr_offsets"]) - 1
+        if n_nodes.max(initial=0) > connection_graph.number_of_nodes():
+            msg = "the corpus contains graphs with more nodes than the connection graph"
+            raise ValueError(msg)
+
+
+def write_graph_corpus(path: PathLike, graphs: Iterable[nx.Graph]) -> None:
+    """Write interaction graphs to an on-disk corpus for the
+    :class:`CorpusGraphGenerator`.
+
+    Each graph is stored as the CSR representation of its symmetric adjacency matrix.
+    Edges without a ``"weight"`` attribute get weight 1.
+
+    Args:
+        path: Directory to write the corpus to.
+        graphs: Graphs to store. The nodes of each graph should have integer labels
+            starting from 0 and up to the number of nodes minus 1.
+    """
+    indptrs, indices, weights = [], [], []
+    for graph in graphs:
+        n_nodes = graph.number_of_nodes()
+        edges = np.array(list(graph.edges(data="weight", default=1)), dtype=np.float_)
+        edges = edges.reshape(-1, 3)
+        sources, targets = edges[:, 0].astype(np.int_), edges[:, 1].astype(np.int_)
+
+        # Self loops are only stored once
+        not_loop = sources != targets
+        rows = np.concatenate((sources, targets[not_loop]))
+        cols = np.concatenate((targets, sources[not_loop]))
+        data = np.concatenate((edges[:, 2], edges[not_loop, 2]))
+        order = np.lexsort((cols, rows))
+
+        indptr = np.zeros(n_nodes + 1, dtype=np.int_)
+        np.cumsum(np.bincount(rows, minlength=n_nodes), out=indptr[1:])
+        indptrs.append(indptr)
+        indices.append(cols[order])
+        weights.append(data[order])
+
+    indptr_rows, indptr_offsets = concatenate_records(indptrs, 1)
+    indices_rows, offsets = concatenate_records(indices, 1)
+    weights_rows, _ = concatenate_records(weights, 1, dtype=np.float_)
+    write_corpus(
+        path,
+        offsets=offsets,
+        indptr_offsets=indptr_offsets,
+        indptr=indptr_rows.ravel(),
+        indices=indices_rows.ravel(),
+        weights=weights_rows.ravel(),
+    )
+
+
+def _csr_upper_triangle(
+    indptr: NDArray[np.int_], indices: NDArray[np.int_]
+) -> Tuple[NDArray[np.int_], NDArray[np.bool_]]:
+    """Compute the row of each entry of a CSR matrix and which entries are in the upper
+    triangle (including the diagonal).
+
+    Args:
+        indptr: Index pointers of the CSR matrix.
+        indices: Column indices of the CSR matrix.
+
+    Returns:
+        Tuple containing the row of each entry and a mask of the upper triangle entries.
+    """
+    rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    return rows, rows <= indices
@@ -3,13 +3,21 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from collections.abc import Iterable
 from typing import Any, Iterator, SupportsInt
 
 import networkx as nx
 import numpy as np
 from numpy.random import Generator
-from numpy.typing import NDArray
-
+from numpy.typing import ArrayLike, NDArray
+
+from qgym.generators.corpus import (
+    Corpus,
+    CorpusSampler,
+    PathLike,
+    concatenate_records,
+    write_corpus,
+)
 from qgym.utils.input_parsing import parse_seed
 from qgym.utils.input_validation import check_graph_is_valid_topology, check_int
 
@@ -127,3 +135,109 @@ class NullInteractionGenerator(InteractionGenerator):
         Args:
             kwargs: Keyword arguments.
         """
+
+
+class CorpusInteractionGenerator(InteractionGenerator):
+    """Generator class that serves interaction circuits from an on-disk corpus.
+
+    The corpus should be written with :func:`write_interaction_corpus`. It is
+    memory-mapped, so the interaction circuits are served as read-only views without
+    copying. Each worker can serve a disjoint shard of the corpus.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        path: PathLike,
+        *,
+        shuffle: bool = False,
+        finite: bool = False,
+        seed: Generator | SupportsInt | None = None,
+        worker_id: SupportsInt = 0,
+        n_workers: SupportsInt = 1,
+    ) -> None:
+        """Init of the :class:`CorpusInteractionGenerator`.
+
+        Args:
+            path: Directory containing the interaction circuit corpus.
+            shuffle: Whether to serve the interaction circuits in a random order, which
+                is reshuffled every epoch. Defaults to ``False``.
+            finite: If ``True``, stop after all interaction circuits of the shard have
+                been served once. Defaults to ``False``.
+            seed: Seed to use for shuffling.
+            worker_id: Index of the shard to serve. Defaults to 0.
+            n_workers: Number of shards the corpus is divided in. Defaults to 1.
+        """
+        self.corpus = Corpus(path)
+        self.sampler = CorpusSampler(
+            len(self.corpus),
+            shuffle=shuffle,
+            finite=finite,
+            seed=seed,
+            worker_id=worker_id,
+            n_workers=n_workers,
+        )
+        self.finite = self.sampler.finite
+        super().__init__()
+
+    def __repr__(self) -> str:
+        """String representation of the :class:`CorpusInteractionGenerator`."""
+        return (
+            f"CorpusInteractionGenerator[corpus={self.corpus}, "
+            f"sampler={self.sampler}, "
+            f"finite={self.finite}]"
+        )
+
+    def __next__(self) -> NDArray[np.int_]:
+        """Serve the next interaction circuit of the corpus as a read-only view."""
+        return self.corpus.record(next(self.sampler))
+
+    def set_state_attributes(
+        self, *, connection_graph: nx.Graph | None = None, **kwargs: Any
+    ) -> None:
+        """Check that the interaction circuits of the corpus fit on the connection
+        graph.
+
+        The number of qubits used by the corpus is stored when the corpus is written,
+        so the check does not read the interaction circuits of the corpus.
+
+        Args:
+            connection_graph: A :class:`~networkx.Graph` representation of the
+                connection graph.
+            kwargs: Additional keyword arguments. These are not used.
+
+        Raises:
+            ValueError: If an interaction of the corpus acts on a qubit that is not in
+                the connection graph.
+        """
+        connection_graph = check_graph_is_valid_topology(
+            connection_graph, "connection_graph"
+        )
+        n_qubits = connection_graph.number_of_nodes()
+        if int(self.corpus.arrays["n_qubits"]) > n_qubits:
+            msg = "the corpus contains interactions with qubits that are not in the "
+            msg += f"connection graph with {n_qubits} nodes"
+            raise ValueError(msg)
+
+
+def write_interaction_corpus(
+    path: PathLike, interaction_circuits: Iterable[ArrayLike]
+) -> None:
+    """Write interaction circuits to an on-disk corpus for the
+    :class:`CorpusInteractionGenerator`.
+
+    The number of qubits used by the interaction circuits is stored as well.
+
+    Args:
+        path: Directory to write the corpus to.
+        interaction_circuits: Interaction circuits to store. Each interaction circuit
+            should be an array of shape (len_circuit, 2).
+
+    Raises:
+        ValueError: If an interaction acts on a negative qubit.
+    """
+    rows, offsets = concatenate_records(interaction_circuits, 2)
+    if (rows < 0).any():
+        raise ValueError("the interaction circuits should not contain negative qubits")
+    write_corpus(
+        path, rows=rows, offsets=offsets, n_qubits=np.array(rows.max(initial=-1) + 1)
+    )
@@ -8,6 +8,14 @@ Usage:
      [0 0 0]], [[20 20 20]
      [20 20 20]], (2, 3), int32)
 
+    A batch of samples is drawn at once by providing `n`, and the membership of every
+    sample in a batch is checked at once with ``contains_batch``:
+
+    >>> box = Box(low=0, high=20, shape=(2, 3), dtype=int)
+    >>> samples = box.sample(n=32)  # array of shape (32, 2, 3)
+    >>> bool(box.contains_batch(samples).all())
+    True
+
 """
 
 from __future__ import annotations
@@ -19,7 +27,9 @@ from typing import Any, SupportsFloat
 import gymnasium.spaces
 import numpy as np
 from numpy.random import Generator
-from numpy.typing import ArrayLike
+from numpy.typing import ArrayLike, NDArray
+
+from qgym.utils.input_validation import check_int
 
 
 class Box(gymnasium.spaces.Box):
@@ -49,9 +59,76 @@ class Box(gymnasium.spaces.Box):
             rng: Random number generator to be used in this space, if ``None`` a new one
                 will be constructed.
         """
-        if not isinstance(low, Integral):
+        if not isinstance(low, (Integral, np.ndarray)):
             low = low.__float__() if hasattr(low, "__float__") else np.asarray(low)
-        if not isinstance(high, Integral):
+        if not isinstance(high, (Integral, np.ndarray)):
             high = high.__float__() if hasattr(high, "__float__") else np.asarray(high)
         super().__init__(low, high, shape=shape, dtype=dtype)
         self._np_random = rng  # this overrides the default behaviour of the gym space
+
+    def sample(self, mask: None = None, *, n: int | None = None) -> NDArray[Any]:
+        """Generate a random sample, or a batch of `n` random samples, inside the Box.
+
+        Each coordinate is sampled in the same way as by the ``gymnasium`` ``Box``, but
+        a batch is drawn from the random number generator in one go.
+
+        Args:
+            mask: A mask for sampling values from the Box space, currently unsupported.
+            n: Number of samples to draw. If ``None`` (default), a single sample is
+                returned.
+
+        Returns:
+            A sample of shape ``shape``, or a batch of samples of shape
+            ``(n, *shape)`` if `n` is given.
+        """
+        if n is None or mask is not None:
+            return super().sample(mask)
+        n = check_int(n, "n", l_bound=0)
+
+        high = self.high if self.dtype.kind == "f" else self.high.astype("int64") + 1
+        sample = np.empty((n,) + self.shape)
+
+        # Masking arrays which classify the coordinates according to interval type
+        unbounded = ~self.bounded_below & ~self.bounded_above
+        upp_bounded = ~self.bounded_below & self.bounded_above
+        low_bounded = self.bounded_below & ~self.bounded_above
+        bounded = self.bounded_below & self.bounded_above
+
+        rng = self.np_random
+        sample[:, unbounded] = rng.normal(size=(n, np.count_nonzero(unbounded)))
+        sample[:, low_bounded] = self.low[low_bounded] + rng.exponential(
+            size=(n, np.count_nonzero(low_bounded))
+        )
+        sample[:, upp_bounded] = high[upp_bounded] - rng.exponential(
+            size=(n, np.count_nonzero(upp_bounded))
+        )
+        sample[:, bounded] = rng.uniform(
+            low=self.low[bounded],
+            high=high[bounded],
+            size=(n, np.count_nonzero(bounded)),
+        )
+
+        if self.dtype.kind in "iub":
+            sample = np.floor(sample)
+        return sample.astype(self.dtype)
+
+    def contains_batch(self, x: ArrayLike) -> NDArray[np.bool_]:
+        """Check for each element of a batch whether it is a member of this space.
+
+        Args:
+            x: Batch of elements with shape ``(n, *shape)``.
+
+        Raises:
+            ValueError: If `x` does not have a batch dimension.
+
+        Returns:
+            Boolean array of length `n`.
+        """
+        x = np.asarray(x)
+        if x.ndim == 0:
+            raise ValueError("'x' should have a batch dimension")
+        if x.shape[1:] != self.shape or not np.can_cast(x.dtype, self.dtype):
+            return np.zeros(len(x), dtype=bool)
+
+        in_bounds = (x >= self.low) & (x <= self.high)
+        return np.asarray(in_bounds.all(axis=tuple(range(1, x.ndim))))
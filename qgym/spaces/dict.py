@@ -13,15 +13,31 @@ Usage:
      [-5. -5.]], [[1. 1.]
      [1. 1.]
      [1. 1.]], (3, 2), float64))
+
+    A batch of samples is drawn at once by providing `n`. The result is a dictionary
+    with a batch of samples for each key:
+
+    >>> samples = Dict(box1=box1, box2=box2).sample(n=32)
+    >>> samples["box1"].shape
+    (32, 2, 3)
 """
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
 from typing import Any
 
 import gymnasium.spaces
+import numpy as np
 from numpy.random import Generator
+from numpy.typing import NDArray
+
+from qgym.spaces.box import Box
+from qgym.spaces.discrete import Discrete
+from qgym.spaces.multi_binary import MultiBinary
+from qgym.spaces.multi_discrete import MultiDiscrete
+from qgym.utils.input_validation import check_int
 
 
 class Dict(gymnasium.spaces.Dict):
@@ -52,3 +68,100 @@ class Dict(gymnasium.spaces.Dict):
         for space in self.spaces.values():
             # override the default behaviour of the gym space
             space._np_random = rng  # pylint: disable=protected-access
+
+    def sample(
+        self, mask: dict[str, Any] | None = None, *, n: int | None = None
+    ) -> dict[str, Any]:
+        """Generate a random sample, or a batch of `n` random samples, from this space.
+
+        Args:
+            mask: An optional mask for each of the subspaces, with the same keys as the
+                space.
+            n: Number of samples to draw. If ``None`` (default), a single sample is
+                returned.
+
+        Returns:
+            A dictionary with a sample of each subspace. If `n` is given, each value is
+            a batch of `n` samples stacked along the first axis.
+        """
+        if n is None:
+            return super().sample(mask)
+        n = check_int(n, "n", l_bound=0)
+
+        if mask is None:
+            mask = dict.fromkeys(self.spaces)
+        return OrderedDict(
+            (key, _sample_batch(space, mask[key], n))
+            for key, space in self.spaces.items()
+        )
+
+    def contains_batch(self, x: Mapping[str, Any]) -> NDArray[np.bool_]:
+        """Check for each element of a batch whether it is a member of this space.
+
+        Args:
+            x: Mapping with the same keys as the space, with a batch of `n` elements of
+                the corresponding subspace as values. The batch of a nested ``Dict``
+                subspace is again such a mapping.
+
+        Raises:
+            ValueError: If the batches of the subspaces have different lengths.
+
+        Returns:
+            Boolean array of length `n`.
+        """
+        n = _batch_length(x)
+        contains = np.ones(n, dtype=bool)
+        if x.keys() != self.spaces.keys():
+            return ~contains
+        for key, space in self.spaces.items():
+            batch = x[key]
+            if hasattr(space, "contains_batch"):
+                contains &= space.contains_batch(batch)
+                continue
+            if isinstance(batch, Mapping):
+                # Split the batch of a nested gymnasium Dict into single elements
+                batch = [{k: v[i] for k, v in batch.items()} for i in range(n)]
+            contains &= np.fromiter(map(space.contains, batch), bool, n)
+        return contains
+
+
+def _batch_length(batch: Any) -> int:
+    """Give the number of elements of a batch.
+
+    The batch of a ``Dict`` space is a mapping of batches, of which the length is found
+    recursively.
+
+    Args:
+        batch: Batch of elements.
+
+    Raises:
+        ValueError: If the batches in a mapping have different lengths.
+
+    Returns:
+        Number of elements of the batch.
+    """
+    if not isinstance(batch, Mapping):
+        return len(batch)
+    lengths = {_batch_length(value) for value in batch.values()}
+    if len(lengths) > 1:
+        raise ValueError("the batches of all keys should have the same length")
+    return lengths.pop() if lengths else 0
+
+
+def _sample_batch(space: gymnasium.Space[Any], mask: Any, n: int) -> Any:
+    """Draw a batch of `n` samples from `space`.
+
+    Spaces of ``qgym.spaces`` draw the batch at once, for other spaces the samples are
+    drawn one at a time and stacked.
+
+    Args:
+        space: Space to sample from.
+        mask: Mask to use for sampling.
+        n: Number of samples.
+
+    Returns:
+        Batch of samples.
+    """
+    if isinstance(space, (Box, Dict, Discrete, MultiBinary, MultiDiscrete)):
+        return space.sample(mask, n=n)
+    return np.array([space.sample(mask) for _ in range(n)])
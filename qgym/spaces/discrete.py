@@ -7,12 +7,22 @@ Usage:
     >>> Discrete(3)
     Discrete(3)
 
+    A batch of samples is drawn at once by providing `n`:
+
+    >>> samples = Discrete(3).sample(n=32)  # array of shape (32,)
+
 """
 
 from __future__ import annotations
 
+from typing import Any
+
 import gymnasium.spaces
+import numpy as np
 from numpy.random import Generator
+from numpy.typing import ArrayLike, NDArray
+
+from qgym.utils.input_validation import check_int
 
 
 class Discrete(gymnasium.spaces.Discrete):
@@ -35,3 +45,53 @@ class Discrete(gymnasium.spaces.Discrete):
         """
         super().__init__(n=n, start=start)
         self._np_random = rng  # this overrides the default behaviour of the gym space
+
+    def sample(
+        self, mask: NDArray[np.int8] | None = None, *, n: int | None = None
+    ) -> Any:
+        """Generate a random sample, or a batch of `n` random samples, from this space.
+
+        Args:
+            mask: An optional mask of shape ``(n,)`` and dtype ``np.int8``, where 1
+                represents a valid and 0 an invalid value. If no value is valid,
+                ``start`` is returned.
+            n: Number of samples to draw. If ``None`` (default), a single sample is
+                returned.
+
+        Returns:
+            A single sampled integer, or an integer array of length `n` if `n` is
+            given.
+        """
+        if n is None:
+            return super().sample(mask)
+        n = check_int(n, "n", l_bound=0)
+
+        if mask is None:
+            return self.start + self.np_random.integers(self.n, size=n)
+
+        mask = np.asarray(mask)
+        if mask.shape != (self.n,):
+            raise ValueError(f"the mask should have shape {(self.n,)}")
+        valid_values = np.flatnonzero(mask == 1)
+        if len(valid_values) == 0:
+            return np.full(n, self.start, dtype=np.int64)
+        return self.start + self.np_random.choice(valid_values, size=n)
+
+    def contains_batch(self, x: ArrayLike) -> NDArray[np.bool_]:
+        """Check for each element of a batch whether it is a member of this space.
+
+        Args:
+            x: One dimensional array of integers.
+
+        Raises:
+            ValueError: If `x` is not one dimensional.
+
+        Returns:
+            Boolean array of length ``len(x)``.
+        """
+        x = np.asarray(x)
+        if x.ndim != 1:
+            raise ValueError("'x' should be one dimensional")
+        if not np.issubdtype(x.dtype, np.integer):
+            return np.zeros(len(x), dtype=bool)
+        return np.asarray((self.start <= x) & (x < self.start + self.n))
@@ -5,6 +5,10 @@ Usage:
     >>> MultiBinary(10)
     MultiBinary(10)
 
+    A batch of samples is drawn at once by providing `n`:
+
+    >>> samples = MultiBinary(10).sample(n=32)  # array of shape (32, 10)
+
 """
 
 from __future__ import annotations
@@ -12,7 +16,9 @@ from __future__ import annotations
 import gymnasium.spaces
 import numpy as np
 from numpy.random import Generator
-from numpy.typing import ArrayLike
+from numpy.typing import ArrayLike, NDArray
+
+from qgym.utils.input_validation import check_int
 
 
 class MultiBinary(gymnasium.spaces.MultiBinary):
@@ -38,3 +44,55 @@ class MultiBinary(gymnasium.spaces.MultiBinary):
         else:
             super().__init__(np.asarray(n))
         self._np_random = rng  # this overrides the default behaviour of the gym space
+
+    def sample(
+        self, mask: NDArray[np.int8] | None = None, *, n: int | None = None
+    ) -> NDArray[np.int8]:
+        """Generate a random sample, or a batch of `n` random samples, from this space.
+
+        Args:
+            mask: An optional mask with the shape of the space and dtype ``np.int8``.
+                Where the mask is 0 or 1, the samples are 0 or 1 respectively. Where
+                the mask is 2, the samples are random.
+            n: Number of samples to draw. If ``None`` (default), a single sample is
+                returned.
+
+        Returns:
+            A sample with the shape of the space, or a batch of samples of shape
+            ``(n, *shape)`` if `n` is given.
+        """
+        if n is None:
+            return super().sample(mask)
+        n = check_int(n, "n", l_bound=0)
+
+        samples = self.np_random.integers(
+            low=0, high=2, size=(n,) + self.shape, dtype=self.dtype
+        )
+        if mask is None:
+            return samples
+
+        mask = np.asarray(mask)
+        if mask.shape != self.shape:
+            raise ValueError(f"the mask should have shape {self.shape}")
+        return np.where(mask == 2, samples, mask.astype(self.dtype))
+
+    def contains_batch(self, x: ArrayLike) -> NDArray[np.bool_]:
+        """Check for each element of a batch whether it is a member of this space.
+
+        Args:
+            x: Batch of elements with shape ``(n, *shape)``.
+
+        Raises:
+            ValueError: If `x` does not have a batch dimension.
+
+        Returns:
+            Boolean array of length `n`.
+        """
+        x = np.asarray(x)
+        if x.ndim == 0:
+            raise ValueError("'x' should have a batch dimension")
+        if x.shape[1:] != self.shape:
+            return np.zeros(len(x), dtype=bool)
+
+        is_binary = (x == 0) | (x == 1)
+        return np.asarray(is_binary.all(axis=tuple(range(1, x.ndim))))
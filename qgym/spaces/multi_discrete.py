@@ -6,6 +6,10 @@ Usage:
     >>> MultiDiscrete(nvec=[2,3,4])
     MultiDiscrete([2 3 4])
 
+    A batch of samples is drawn at once by providing `n`:
+
+    >>> samples = MultiDiscrete(nvec=[2,3,4]).sample(n=32)  # array of shape (32, 3)
+
 """
 
 from __future__ import annotations
@@ -15,7 +19,9 @@ from typing import Any
 import gymnasium.spaces
 import numpy as np
 from numpy.random import Generator
-from numpy.typing import ArrayLike
+from numpy.typing import ArrayLike, NDArray
+
+from qgym.utils.input_validation import check_int
 
 
 class MultiDiscrete(gymnasium.spaces.MultiDiscrete):
@@ -40,3 +46,54 @@ class MultiDiscrete(gymnasium.spaces.MultiDiscrete):
         """
         super().__init__(nvec=np.asarray(nvec), dtype=dtype)
         self._np_random = rng  # this overrides the default behaviour of the gym space
+
+    def sample(
+        self, mask: tuple[NDArray[np.int8], ...] | None = None, *, n: int | None = None
+    ) -> NDArray[np.integer[Any]]:
+        """Generate a random sample, or a batch of `n` random samples, from this space.
+
+        Args:
+            mask: An optional mask, see the ``gymnasium`` ``MultiDiscrete`` space. Masked
+                batches are sampled one at a time.
+            n: Number of samples to draw. If ``None`` (default), a single sample is
+                returned.
+
+        Returns:
+            A sample with the shape of the space, or a batch of samples of shape
+            ``(n, *shape)`` if `n` is given.
+        """
+        if n is None:
+            return super().sample(mask)
+        n = check_int(n, "n", l_bound=0)
+
+        start = getattr(self, "start", 0)
+        if mask is None:
+            samples = self.np_random.random((n,) + self.nvec.shape) * self.nvec
+            return samples.astype(self.dtype) + start
+
+        samples = np.empty((n,) + self.shape, dtype=self.dtype)
+        for sample in samples:
+            sample[...] = super().sample(mask)
+        return samples
+
+    def contains_batch(self, x: ArrayLike) -> NDArray[np.bool_]:
+        """Check for each element of a batch whether it is a member of this space.
+
+        Args:
+            x: Batch of elements with shape ``(n, *shape)``.
+
+        Raises:
+            ValueError: If `x` does not have a batch dimension.
+
+        Returns:
+            Boolean array of length `n`.
+        """
+        x = np.asarray(x)
+        if x.ndim == 0:
+            raise ValueError("'x' should have a batch dimension")
+        if x.shape[1:] != self.shape or x.dtype == object:
+            return np.zeros(len(x), dtype=bool)
+
+        start = getattr(self, "start", 0)
+        in_bounds = (start <= x) & (x - start < self.nvec)
+        return np.asarray(in_bounds.all(axis=tuple(range(1, x.ndim))))
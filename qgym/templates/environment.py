@@ -8,7 +8,7 @@ from __future__ import annotations
 from abc import abstractmethod
 from collections.abc import Mapping
 from copy import deepcopy
-from typing import Any
+from typing import Any, cast
 
 import gymnasium
 import numpy as np
@@ -19,6 +19,7 @@ from numpy.typing import NDArray
 from qgym.templates.rewarder import Rewarder
 from qgym.templates.state import ActionT, ObservationT, State
 from qgym.templates.visualiser import Visualiser
+from qgym.utils.observation_layout import FlatObservationLayout
 
 
 class Environment(gymnasium.Env[ObservationT, ActionT]):
@@ -43,6 +44,9 @@ class Environment(gymnasium.Env[ObservationT, ActionT]):
 
     # --- Other attributes ---
     _rng: Generator | None = None
+    observation_layout: FlatObservationLayout | None = None
+    """Layout of the flattened observations, or ``None`` if the observations are not
+    flattened."""
 
     def step(
         self, action: ActionT
@@ -71,7 +75,7 @@ class Environment(gymnasium.Env[ObservationT, ActionT]):
             self._visualiser.step(self._state)
 
         return (
-            self._state.obtain_observation(),
+            self._obtain_observation(),
             self._compute_reward(old_state, action),
             self._state.is_done(),
             self._state.is_truncated(),
@@ -100,17 +104,24 @@ class Environment(gymnasium.Env[ObservationT, ActionT]):
         options = {} if options is None else options
         self._state.reset(seed=seed, **options)
         if self._visualiser is not None:
-            self._visualiser.step(self._state)
-        return self._state.obtain_observation(), self._state.obtain_info()
+            self._visualiser.reset(self._state)
+        return self._obtain_observation(), self._state.obtain_info()
 
-    def render(self) -> None | NDArray[np.int_]:  # type: ignore[override]
+    def render(  # type: ignore[override]
+        self, out: NDArray[np.uint8] | None = None
+    ) -> None | NDArray[np.int_]:
         """Render the current state using pygame.
 
+        Args:
+            out: Optional preallocated array of shape ``(height, width, 3)`` and dtype
+                ``uint8`` to write the frame to in 'rgb_array' mode, instead of
+                allocating a new array.
+
         Returns:
-            Result of rendering.
+            Result of rendering, which is `out` if it is provided.
         """
         if self._visualiser is not None:
-            return self._visualiser.render(self._state)
+            return self._visualiser.render(self._state, out)
         return None
 
     def close(self) -> None:
@@ -119,6 +130,15 @@ class Environment(gymnasium.Env[ObservationT, ActionT]):
             self._visualiser.close()
         self._visualiser = None
 
+    @property
+    def state(self) -> State[ObservationT, ActionT]:
+        """Return the current state of this environment.
+
+        The state is updated in place by the environment. Acting on it directly, e.g.
+        with a baseline, also changes the environment.
+        """
+        return self._state
+
     @property
     def rewarder(self) -> Rewarder:
         """Return the rewarder that is set for this environment.
@@ -151,6 +171,46 @@ class Environment(gymnasium.Env[ObservationT, ActionT]):
         if hasattr(self, "_visualiser"):
             self.close()
 
+    def _set_observation_space(self, flatten_observation: bool) -> None:
+        """Set the observation space from the state.
+
+        Args:
+            flatten_observation: If ``True``, the ``Dict`` observations of the state are
+                flattened into a single vector with a
+                :class:`~qgym.utils.FlatObservationLayout`, and the observation space
+                is the corresponding ``Box`` space.
+        """
+        observation_space = self._state.create_observation_space()
+        if flatten_observation:
+            self.observation_layout = FlatObservationLayout(observation_space)
+            observation_space = self.observation_layout.space
+        self.observation_space = observation_space
+
+    def _static_objects(self) -> list[Any]:
+        """Objects which are not changed after the init of the environment.
+
+        These objects are shared between the environments created by an
+        :class:`~qgym.envs.EnvConfig` instead of being copied.
+
+        Returns:
+            List of objects that can be shared between copies of this environment.
+        """
+        return []
+
+    def _obtain_observation(self) -> ObservationT:
+        """Obtain the observation of the state, flattened if requested.
+
+        Returns:
+            Observation of the current state.
+        """
+        observation = self._state.obtain_observation()
+        if self.observation_layout is not None:
+            flat_observation = self.observation_layout.flatten(
+                cast(Mapping[str, Any], observation)
+            )
+            return cast(ObservationT, flat_observation)
+        return observation
+
     def _compute_reward(
         self,
         old_state: State[ObservationT, ActionT],
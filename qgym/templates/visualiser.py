@@ -5,20 +5,23 @@ All visualisers should inherit from ``Visualiser``.
 
 from __future__ import annotations
 
+import sys
 from abc import abstractmethod
+from collections.abc import Hashable
 from typing import Any
 
 import numpy as np
 import pygame
 from numpy.typing import NDArray
 
+from qgym.utils.visualisation.raster import ArraySurface, BitmapFont
 from qgym.utils.visualisation.typing import Color, Font, Surface
 
 
 class RenderData:
     """Class containing usefull data for rendering like screen, font and colors."""
 
-    __slots__ = ["screen", "font", "colors", "render_mode"]
+    __slots__ = ["screen", "font", "colors", "render_mode", "layers"]
 
     def __init__(
         self,
@@ -31,6 +34,8 @@ class RenderData:
         self.font = font
         self.colors = colors
         self.render_mode = render_mode
+        self.layers: dict[str, tuple[Hashable, Surface]] = {}
+        """Cached layers by name, together with the key they were drawn for."""
 
     @property
     def screen_width(self) -> int:
@@ -48,14 +53,27 @@ class Visualiser:
 
     # --- These attributes should be set in any subclass ---
     render_data: RenderData
+    backend: str = "pygame"
+    """Backend used for drawing. Either ``"pygame"`` or ``"numpy"``, which draws with
+    :mod:`~qgym.utils.visualisation.raster` without initializing ``pygame``."""
 
     @abstractmethod
-    def __init__(self, render_mode: str, *args: list[Any]) -> None:
+    def __init__(
+        self, render_mode: str, *args: list[Any], backend: str = "pygame"
+    ) -> None:
         raise NotImplementedError
 
     @abstractmethod
-    def render(self, state: Any) -> None | NDArray[np.int_]:
-        """Render the current state using ``pygame``."""
+    def render(
+        self, state: Any, out: NDArray[np.uint8] | None = None
+    ) -> None | NDArray[np.int_]:
+        """Render the current state using ``pygame``.
+
+        Args:
+            state: State to render.
+            out: Optional preallocated array to write the frame to in 'rgb_array'
+                mode, instead of allocating a new array.
+        """
         raise NotImplementedError
 
     def step(self, state: Any) -> None:
@@ -69,45 +87,135 @@ class Visualiser:
         if self.render_data.render_mode == "human":
             self.render(state)
 
-    def _display(self) -> None | NDArray[np.int_]:
+    def reset(self, state: Any) -> None:
+        """To be used during a reset of the environment.
+
+        Visualisers that cache drawings of an episode should discard them here. By
+        default, this is the same as :func:`step`.
+
+        Args:
+            state: State to render if `render_mode` is 'human'.
+        """
+        self.step(state)
+
+    def _display(self, out: NDArray[np.uint8] | None = None) -> None | NDArray[np.int_]:
         """Display the current state using ``pygame``.
 
         The render function should call this method at the end.
 
+        Args:
+            out: Optional preallocated array of shape
+                ``(screen_height, screen_width, 3)`` and dtype ``uint8`` to write the
+                frame to in 'rgb_array' mode, instead of allocating a new array.
+
         Raises:
-            ValueError: When an invalid mode is provided.
+            ValueError: When an invalid mode is provided, when `out` is provided in
+                'human' mode, or when `out` does not have the shape of the frame.
 
         Returns:
             If 'human' mode returns a boolean value encoding whether the ``pygame``
             screen is open. In 'rgb_array' mode returns an RGB array encoding of the
-            rendered image.
+            rendered image, which is `out` if it is provided.
         """
         if self.render_data.render_mode == "human":
+            if out is not None:
+                raise ValueError("'out' can only be used in 'rgb_array' mode")
             pygame.event.pump()
             pygame.display.flip()
             return None
 
         if self.render_data.render_mode == "rgb_array":
-            return np.transpose(
-                np.array(pygame.surfarray.pixels3d(self.screen)), axes=(1, 0, 2)
-            )
+            if out is None:
+                return self._screen_to_array()
+            shape = (self.screen_height, self.screen_width, 3)
+            if out.shape != shape:
+                msg = f"'out' should have shape {shape}, but has shape {out.shape}"
+                raise ValueError(msg)
+            if isinstance(self.screen, ArraySurface):
+                np.copyto(out, self.screen.array)
+            else:
+                out[...] = self._screen_to_array()
+            return out
 
         msg = f"You provided an invalid mode '{self.render_data.render_mode}', the only"
         msg += " supported modes are 'human' and 'rgb_array'."
         raise ValueError(msg)
 
+    def _screen_to_array(self) -> NDArray[np.uint8]:
+        """Copy the pixels of the screen to an RGB array.
+
+        Returns:
+            Array with shape ``(screen_height, screen_width, 3)``.
+        """
+        if isinstance(self.screen, ArraySurface):
+            return self.screen.array.copy()
+
+        if self.screen.get_bitsize() != 32:
+            return np.transpose(
+                np.array(pygame.surfarray.pixels3d(self.screen)), axes=(1, 0, 2)
+            )
+
+        # Copying the packed 32 bit pixels and selecting the color bytes afterwards is
+        # much faster than copying the strided view of pixels3d.
+        packed = pygame.surfarray.pixels2d(self.screen).T.copy()
+        channels = [shift // 8 for shift in self.screen.get_shifts()[:3]]
+        if sys.byteorder == "big":
+            channels = [3 - channel for channel in channels]
+        return packed.view(np.uint8).reshape(packed.shape + (4,))[:, :, channels]
+
+    def _get_layer(
+        self, name: str, key: Hashable, *, transparent: bool = False
+    ) -> tuple[Surface, bool]:
+        """Get a cached layer with the size of the screen.
+
+        Parts of a frame that change rarely are drawn once on a layer, which is then
+        blitted on every render call. A new blank layer is returned whenever `key`
+        differs from the key of the cached layer, in which case it should be drawn.
+
+        Args:
+            name: Name of the layer.
+            key: Key identifying the content of the layer, e.g., the circuit of the
+                current episode.
+            transparent: If ``True``, the layer has per pixel alpha and starts fully
+                transparent. Otherwise, it is filled with the background color.
+
+        Returns:
+            Tuple with the layer and a boolean stating whether the layer is new and
+            should be drawn.
+        """
+        cached = self.render_data.layers.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1], False
+
+        if cached is not None:
+            layer = cached[1]
+        elif isinstance(self.screen, ArraySurface):
+            layer = ArraySurface(self.screen.get_size(), transparent)
+        elif transparent:
+            layer = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+        else:
+            layer = pygame.Surface(self.screen.get_size())
+        layer.fill((0, 0, 0, 0) if transparent else self.colors["background"])
+        self.render_data.layers[name] = (key, layer)
+        return layer, True
+
     def _start_screen(
         self, screen_name: str, render_mode: str, screen_dimensions: tuple[int, int]
     ) -> Surface:
         """Start a pygame screen in the given mode.
 
+        With the ``"numpy"`` backend, an
+        :class:`~qgym.utils.visualisation.raster.ArraySurface` is returned and
+        ``pygame`` is not initialized.
+
         Args:
             screen_name: Name of the screen.
             render_mode: The render mode to use. Choose from 'human' or 'rgb_array'.
             screen_dimension: Width and height of the screen.
 
         Raises:
-            ValueError: When an invalid mode is provided.
+            ValueError: When an invalid mode or backend is provided, or when the
+                ``"numpy"`` backend is combined with the 'human' mode.
 
         Returns:
             The initialized screen.
@@ -117,6 +225,18 @@ class Visualiser:
                 f"'rendermode' of type {type(render_mode)} has no screen to start"
             )
 
+        if self.backend not in ("pygame", "numpy"):
+            raise ValueError(
+                f"You provided an invalid render backend '{self.backend}', the only "
+                "supported backends are 'pygame' and 'numpy'."
+            )
+        if self.backend == "numpy":
+            if render_mode != "rgb_array":
+                raise ValueError(
+                    "The 'numpy' render backend only supports the 'rgb_array' mode."
+                )
+            return ArraySurface(screen_dimensions)
+
         pygame.display.init()
         if render_mode == "human":
             screen = pygame.display.set_mode(screen_dimensions)
@@ -130,8 +250,28 @@ class Visualiser:
         pygame.display.set_caption(screen_name)
         return screen
 
+    def _get_font(self, size: int, *, bold: bool = False, italic: bool = False) -> Font:
+        """Get a font of the render backend.
+
+        Args:
+            size: Size of the font.
+            bold: If ``True``, the font is bold. Defaults to ``False``.
+            italic: If ``True``, the font is italic. Defaults to ``False``.
+
+        Returns:
+            Arial ``pygame`` font, or a
+            :class:`~qgym.utils.visualisation.raster.BitmapFont` for the ``"numpy"``
+            backend.
+        """
+        if self.backend == "numpy":
+            return BitmapFont(size, bold=bold, italic=italic)
+        pygame.font.init()
+        return pygame.font.SysFont("Arial", size, bold=bold, italic=italic)
+
     def close(self) -> None:
         """Close the screen used for rendering."""
+        if self.backend == "numpy":
+            return
         # Sometimes when we try to quit pygame we get a TypeError and the environment
         # crashes. This is a botch to prevent that.
         try:
@@ -1,5 +1,6 @@
 """Generic utils for the Reinforcement Learning QGym."""
 
 from qgym.utils.gate_encoder import GateEncoder
+from qgym.utils.observation_layout import FlatObservationLayout
 
-__all__ = ["GateEncoder"]
+__all__ = ["FlatObservationLayout", "GateEncoder"]
@@ -9,6 +9,14 @@ Usage:
     [1, 1, 5, 3]
     >>> encoder.decode_gates(encoded_list)
     ['x', 'x', 'measure', 'z']
+
+    Arrays of gate names are converted in bulk using lookup tables:
+
+    >>> import numpy as np
+    >>> encoder.encode_array(np.array(["x", "cnot"]))
+    array([1, 4])
+    >>> encoder.decode_array(np.array([1, 4]))
+    array(['x', 'cnot'], dtype='<U7')
 """
 
 from __future__ import annotations
@@ -17,7 +25,10 @@ import warnings
 from collections.abc import Iterable, Mapping, Sequence
 from typing import Any, TypeVar, cast, overload
 
-from qgym.custom_types import Gate
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from qgym.custom_types import Circuit, Gate
 
 T = TypeVar("T")
 
@@ -31,6 +42,7 @@ class GateEncoder:
         self._encoding_dct: dict[str, int] = {}
         self._decoding_dct: dict[int, str] = {}
         self._longest_name = 0
+        self._build_lookup_tables()
 
     def learn_gates(self, gates: Iterable[str]) -> GateEncoder:
         """Learns the gates names from an ``Iterable`` and creates a mapping from unique
@@ -53,14 +65,87 @@ class GateEncoder:
                 self._longest_name = max(self._longest_name, len(gate_name))
                 self.n_gates += 1
 
+        self._build_lookup_tables()
         return self
 
+    def _build_lookup_tables(self) -> None:
+        """Build the lookup tables used to encode and decode arrays of gate names.
+
+        Gate names are encoded by a binary search in the sorted array of learned names.
+        Encoded gates are decoded by indexing a table of names, which has an empty
+        string at the indices that do not correspond to a learned gate.
+        """
+        names = np.array(list(self._encoding_dct), dtype=str)
+        codes = np.array(list(self._encoding_dct.values()), dtype=np.int_)
+        order = np.argsort(names)
+        self._sorted_names = names[order]
+        self._sorted_codes = codes[order]
+
+        self._name_table = np.zeros(codes.max(initial=0) + 1, dtype=names.dtype)
+        self._name_table[codes] = names
+        self._is_code = np.zeros(len(self._name_table), dtype=bool)
+        self._is_code[codes] = True
+
+    def encode_array(self, gates: ArrayLike) -> NDArray[np.int_]:
+        """Encode an array of gate names in bulk, based on the gates seen in
+        ``learn_gates``.
+
+        Args:
+            gates: Array of gate names.
+
+        Raises:
+            KeyError: If `gates` contains names that have not been learned.
+
+        Returns:
+            Integer array of the same shape as `gates` with the encoded gate names.
+        """
+        gates = np.asarray(gates, dtype=str)
+        if gates.size == 0:
+            return np.zeros(gates.shape, dtype=np.int_)
+
+        idx = np.searchsorted(self._sorted_names, gates)
+        np.minimum(idx, len(self._sorted_names) - 1, out=idx)
+        if len(self._sorted_names) == 0 or not np.all(self._sorted_names[idx] == gates):
+            unknown = np.setdiff1d(gates, self._sorted_names)
+            raise KeyError(f"unknown gate names {unknown.tolist()}")
+        return self._sorted_codes[idx]
+
+    def decode_array(self, encoded_gates: ArrayLike) -> NDArray[np.str_]:
+        """Decode an integer array of encoded gate names in bulk, based on the gates
+        seen in ``learn_gates``.
+
+        Args:
+            encoded_gates: Integer array of encoded gate names.
+
+        Raises:
+            KeyError: If `encoded_gates` contains integers that do not encode a gate.
+
+        Returns:
+            String array of the same shape as `encoded_gates` with the gate names.
+        """
+        encoded_gates = np.asarray(encoded_gates, dtype=np.int_)
+        if encoded_gates.size > 0 and (
+            encoded_gates.min() < 0
+            or encoded_gates.max() >= len(self._name_table)
+            or not np.all(self._is_code[encoded_gates])
+        ):
+            valid_codes = np.flatnonzero(self._is_code)
+            unknown = np.setdiff1d(encoded_gates, valid_codes)
+            raise KeyError(f"unknown encoded gates {unknown.tolist()}")
+        return self._name_table[encoded_gates]
+
     @overload
     def encode_gates(self, gates: str) -> int: ...
 
     @overload
     def encode_gates(self, gates: Mapping[str, T]) -> dict[int, T]: ...
 
+    @overload
+    def encode_gates(self, gates: NDArray[np.str_]) -> NDArray[np.int_]: ...
+
+    @overload
+    def encode_gates(self, gates: Circuit) -> Circuit: ...
+
     @overload
     def encode_gates(self, gates: Sequence[Gate]) -> list[Gate]: ...
 
@@ -75,12 +160,22 @@ class GateEncoder:
         gates: (
             str
             | Mapping[str, Any]
+            | NDArray[np.str_]
+            | Circuit
             | Sequence[Gate]
             | set[str]
             | list[str]
             | tuple[str, ...]
         ),
-    ) -> int | dict[int, Any] | list[Gate] | set[int] | list[int]:
+    ) -> (
+        int
+        | dict[int, Any]
+        | NDArray[np.int_]
+        | Circuit
+        | list[Gate]
+        | set[int]
+        | list[int]
+    ):
         """Encode the gate names (of type ``str``) in `gates` to integers, based on the
         gates seen in ``learn_gates``.
 
@@ -101,6 +196,13 @@ class GateEncoder:
         if isinstance(gates, Mapping):
             return self._encode_mapping(gates)
 
+        if isinstance(gates, np.ndarray):
+            return self.encode_array(gates)
+
+        if isinstance(gates, Circuit):
+            encoded_names = self.encode_array(gates.name)
+            return Circuit(encoded_names, gates.q1, gates.q2, gates.metadata)
+
         if isinstance(gates, Sequence) and (
             len(gates) == 0 or isinstance(gates[0], Gate)
         ):
@@ -158,6 +260,12 @@ class GateEncoder:
     @overload
     def decode_gates(self, encoded_gates: Mapping[int, Any]) -> dict[str, Any]: ...
 
+    @overload
+    def decode_gates(self, encoded_gates: NDArray[np.int_]) -> NDArray[np.str_]: ...
+
+    @overload
+    def decode_gates(self, encoded_gates: Circuit) -> Circuit: ...
+
     @overload
     def decode_gates(self, encoded_gates: Sequence[Gate]) -> list[Gate]: ...
 
@@ -172,12 +280,22 @@ class GateEncoder:
         encoded_gates: (
             int
             | Mapping[int, Any]
+            | NDArray[np.int_]
+            | Circuit
             | Sequence[Gate]
             | set[int]
             | list[int]
             | tuple[int, ...]
         ),
-    ) -> str | dict[str, Any] | list[Gate] | set[str] | list[str]:
+    ) -> (
+        str
+        | dict[str, Any]
+        | NDArray[np.str_]
+        | Circuit
+        | list[Gate]
+        | set[str]
+        | list[str]
+    ):
         """Decode integer encoded gate names to the original gate names based on the
         gates seen in ``learn_gates``.
 
@@ -205,6 +323,18 @@ class GateEncoder:
                 decoded_dict[gate_name] = encoded_gates[gate_int]
             return decoded_dict
 
+        if isinstance(encoded_gates, np.ndarray):
+            return self.decode_array(encoded_gates)
+
+        if isinstance(encoded_gates, Circuit):
+            decoded_names = self.decode_array(encoded_gates.name)
+            return Circuit(
+                decoded_names,
+                encoded_gates.q1,
+                encoded_gates.q2,
+                encoded_gates.metadata,
+            )
+
         if isinstance(encoded_gates, Sequence) and isinstance(encoded_gates[0], Gate):
             # We assume that if the first element of encoded_gates is a Gate, then the
             # whole Sequence contains Gate objects.
@@ -42,7 +42,10 @@ def parse_rewarder(rewarder: Rewarder | None, default: type[Rewarder]) -> Reward
 
 
 def parse_visualiser(
-    render_mode: str | None, vis_type: type[Visualiser], args: list[Any]
+    render_mode: str | None,
+    vis_type: type[Visualiser],
+    args: list[Any],
+    backend: str = "pygame",
 ) -> None | Visualiser:
     """Parse a `Visualiser` by the render mode.
 
@@ -52,6 +55,8 @@ def parse_visualiser(
         vis_type: Type of ``Visualiser`` to make if `render_mode` is not ``None``.
         args: Additional argument to give to the init of the ``Visualiser`` if
             `vis_type` is not ``None``.
+        backend: Render backend of the ``Visualiser``. Choose from ``"pygame"``
+            (default) and ``"numpy"``.
 
     Returns:
         If `render_mode` is ``None`` return ``None``. Otherwise return a ``Visualiser``
@@ -61,7 +66,8 @@ def parse_visualiser(
         return None
 
     render_mode = check_string(render_mode, "render_mode", lower=True)
-    return vis_type(render_mode, *args)
+    backend = check_string(backend, "render_backend", lower=True)
+    return vis_type(render_mode, *args, backend=backend)
 
 
 def parse_connection_graph(
@@ -0,0 +1,156 @@
+"""This module contains the :class:`FlatObservationLayout` class, which flattens the
+``Dict`` observations of the environments into a single vector.
+
+Each key of the ``Dict`` observation space occupies a fixed slice of the vector. The
+slices are laid out contiguously in the order of the keys of the observation space. The
+offset table is available as the `offsets` attribute and is stable for a given
+observation space.
+
+Usage:
+    >>> from qgym.spaces import Dict, MultiBinary, MultiDiscrete
+    >>> from qgym.utils import FlatObservationLayout
+    >>> space = Dict(mapping=MultiDiscrete([4, 4, 4]), legal=MultiBinary(2))
+    >>> layout = FlatObservationLayout(space)
+    >>> layout.offsets
+    {'mapping': (0, 3), 'legal': (3, 5)}
+    >>> layout.flatten({"mapping": [3, 1, 0], "legal": [1, 0]})
+    array([3, 1, 0, 1, 0])
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+import gymnasium.spaces
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+import qgym.spaces
+
+
+class FlatObservationLayout:
+    """Layout of a ``Dict`` observation flattened into one vector."""
+
+    __slots__ = ("offsets", "shapes", "size", "space", "dtype")
+
+    def __init__(self, space: gymnasium.spaces.Dict) -> None:
+        """Init of the :class:`FlatObservationLayout`.
+
+        Args:
+            space: ``Dict`` observation space to flatten. The subspaces should be
+                ``Box``, ``Discrete``, ``MultiBinary`` or ``MultiDiscrete`` spaces.
+
+        Raises:
+            TypeError: If a subspace of `space` is not supported.
+        """
+        lows: list[NDArray[Any]] = []
+        highs: list[NDArray[Any]] = []
+        self.offsets: dict[str, tuple[int, int]] = {}
+        """Dictionary with the ``(start, stop)`` slice of each key in the vector."""
+        self.shapes: dict[str, tuple[int, ...]] = {}
+        """Dictionary with the shape of the observation of each key."""
+
+        start = 0
+        for key, subspace in space.spaces.items():
+            low, high = _bounds(key, subspace)
+            lows.append(low.ravel())
+            highs.append(high.ravel())
+            self.offsets[key] = (start, start + low.size)
+            self.shapes[key] = subspace.shape
+            start += low.size
+
+        self.size = start
+        """Length of the flattened observation."""
+        dtype = np.result_type(*(subspace.dtype for subspace in space.spaces.values()))
+        self.space = qgym.spaces.Box(
+            low=np.concatenate(lows, dtype=dtype) if lows else np.empty(0, dtype),
+            high=np.concatenate(highs, dtype=dtype) if highs else np.empty(0, dtype),
+            shape=(self.size,),
+            dtype=dtype.type,
+        )
+        """``Box`` observation space of the flattened observations."""
+        self.dtype = dtype
+        """Data type of the flattened observations."""
+
+    def flatten(
+        self,
+        observation: Mapping[str, ArrayLike],
+        out: NDArray[Any] | None = None,
+    ) -> NDArray[Any]:
+        """Flatten a ``Dict`` observation into one vector.
+
+        Args:
+            observation: Observation with the same keys as the ``Dict`` space.
+            out: Optional preallocated vector of length `size` to write the flattened
+                observation into, e.g., to reuse one buffer for many observations. If
+                ``None`` (default), a new vector is allocated.
+
+        Raises:
+            ValueError: If `out` does not have the shape ``(size,)``.
+
+        Returns:
+            Vector containing the flattened observation. This is `out` if it is given.
+        """
+        if out is None:
+            out = np.empty(self.size, dtype=self.dtype)
+        elif out.shape != (self.size,):
+            msg = f"out should have shape ({self.size},), but has shape {out.shape}"
+            raise ValueError(msg)
+        for key, (start, stop) in self.offsets.items():
+            out[start:stop] = np.ravel(observation[key])
+        return out
+
+    def unflatten(self, vector: NDArray[Any]) -> dict[str, NDArray[Any]]:
+        """Split a flattened observation into a ``Dict`` observation.
+
+        Args:
+            vector: Flattened observation, or a batch of flattened observations with
+                shape ``(..., size)``.
+
+        Returns:
+            Dictionary with a view of `vector` for each key, with the shape of the
+            observation of that key.
+        """
+        batch_shape = vector.shape[:-1]
+        return {
+            key: vector[..., start:stop].reshape(batch_shape + self.shapes[key])
+            for key, (start, stop) in self.offsets.items()
+        }
+
+    def __repr__(self) -> str:
+        """String representation of the :class:`FlatObservationLayout`."""
+        return (
+            f"{self.__class__.__name__}[size={self.size}, "
+            f"dtype={self.dtype}, "
+            f"offsets={self.offsets}]"
+        )
+
+
+def _bounds(
+    key: str, space: gymnasium.spaces.Space[Any]
+) -> tuple[NDArray[Any], NDArray[Any]]:
+    """Compute the element wise lower and upper bounds of a subspace.
+
+    Args:
+        key: Key of the subspace, used in the error message.
+        space: Subspace to compute the bounds of.
+
+    Raises:
+        TypeError: If the type of `space` is not supported.
+
+    Returns:
+        Arrays with the lower and upper bound of each element of the subspace.
+    """
+    if isinstance(space, gymnasium.spaces.Box):
+        return space.low, space.high
+    if isinstance(space, gymnasium.spaces.Discrete):
+        return np.array([space.start]), np.array([space.start + space.n - 1])
+    if isinstance(space, gymnasium.spaces.MultiBinary):
+        return np.zeros(space.shape, dtype=np.int8), np.ones(space.shape, dtype=np.int8)
+    if isinstance(space, gymnasium.spaces.MultiDiscrete):
+        start = getattr(space, "start", np.zeros_like(space.nvec))
+        return start + np.zeros_like(space.nvec), start + space.nvec - 1
+    msg = f"the space of '{key}' can not be flattened, got {type(space)}"
+    raise TypeError(msg)
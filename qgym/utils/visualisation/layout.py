@@ -0,0 +1,261 @@
+"""This module contains a cache for the layouts of graphs, which are used to compute the
+render positions of the nodes of graphs in the visualisers.
+
+Layouts are deterministic. Grids, e.g., connection graphs made from a grid
+specification, are laid out on a grid. Other graphs get a seeded spring layout. The
+layouts are cached in memory, keyed by the structure of the graph, and optionally on
+disk. The layouts are normalized to the square :math:`[-1,1]^2`, such that they can be
+scaled to any subscreen.
+
+Usage:
+    >>> import networkx as nx
+    >>> from qgym.utils.visualisation.layout import get_layout, set_layout_cache_dir
+    >>> layout = get_layout(nx.cycle_graph(5))
+
+    To also cache the layouts on disk, set a cache directory for the whole process:
+
+    >>> set_layout_cache_dir("layouts")  # doctest: +SKIP
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict
+
+import networkx as nx
+import numpy as np
+from numpy.typing import NDArray
+
+Layout = Dict[Any, NDArray[np.float_]]
+
+
+class LayoutCache:
+    """Least recently used cache of graph layouts, optionally backed by a directory."""
+
+    def __init__(
+        self, maxsize: int = 1024, directory: str | Path | None = None
+    ) -> None:
+        """Init of the :class:`LayoutCache`.
+
+        Args:
+            maxsize: Maximum number of layouts to keep in memory. Defaults to 1024.
+            directory: Optional directory in which the layouts are stored as ``.npy``
+                files, such that they are shared between processes and sessions. If
+                ``None`` (default), the layouts are only cached in memory.
+        """
+        self.maxsize = maxsize
+        """Maximum number of layouts kept in memory."""
+        self.directory = None if directory is None else Path(directory)
+        """Directory in which the layouts are stored, or ``None``."""
+        self._layouts: OrderedDict[str, NDArray[np.float_]] = OrderedDict()
+
+    def get(self, graph: nx.Graph) -> Layout:
+        """Get the layout of a graph, computing and caching it if necessary.
+
+        Args:
+            graph: Graph to get the layout of.
+
+        Returns:
+            Dictionary with the position of each node, normalized to :math:`[-1,1]^2`.
+        """
+        nodes, edges = _canonical_structure(graph)
+        key = hashlib.sha256(repr((nodes, edges)).encode()).hexdigest()
+
+        positions = self._layouts.get(key)
+        if positions is None:
+            positions = self._load(key)
+        if positions is None:
+            positions = compute_layout(nodes, edges)
+            self._store(key, positions)
+        self._layouts[key] = positions
+        self._layouts.move_to_end(key)
+        while len(self._layouts) > self.maxsize:
+            self._layouts.popitem(last=False)
+
+        return {node: positions[i].copy() for i, node in enumerate(nodes)}
+
+    def clear(self) -> None:
+        """Remove all layouts from memory. Layouts stored on disk are kept."""
+        self._layouts.clear()
+
+    def __len__(self) -> int:
+        """Number of layouts in memory."""
+        return len(self._layouts)
+
+    def _load(self, key: str) -> NDArray[np.float_] | None:
+        """Load a layout from disk, if it is stored there."""
+        if self.directory is None:
+            return None
+        path = self.directory / f"{key}.npy"
+        if not path.exists():
+            return None
+        return np.load(path)
+
+    def _store(self, key: str, positions: NDArray[np.float_]) -> None:
+        """Store a layout on disk, if a directory is set."""
+        if self.directory is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, such that other processes never read a
+        # partially written layout
+        tmp_path = self.directory / f"{key}.{os.getpid()}.tmp.npy"
+        np.save(tmp_path, positions)
+        os.replace(tmp_path, self.directory / f"{key}.npy")
+
+
+_CACHE = LayoutCache()
+
+
+def get_layout(graph: nx.Graph) -> Layout:
+    """Get the cached layout of a graph.
+
+    Args:
+        graph: Graph to get the layout of.
+
+    Returns:
+        Dictionary with the position of each node, normalized to :math:`[-1,1]^2`.
+    """
+    return _CACHE.get(graph)
+
+
+def set_layout_cache_dir(directory: str | Path | None) -> None:
+    """Set the directory in which the layouts are cached on disk.
+
+    Args:
+        directory: Directory to store the layouts in. If ``None``, the layouts are
+            only cached in memory.
+    """
+    _CACHE.directory = None if directory is None else Path(directory)
+
+
+def compute_layout(
+    nodes: tuple[Any, ...], edges: tuple[tuple[int, int], ...]
+) -> NDArray[np.float_]:
+    """Compute a deterministic layout of a graph.
+
+    Args:
+        nodes: Nodes of the graph.
+        edges: Edges of the graph, given by the indices of the nodes in `nodes`.
+
+    Returns:
+        Array of shape ``(n_nodes, 2)`` with the position of each node, normalized to
+        :math:`[-1,1]^2`.
+    """
+    positions = _grid_positions(nodes, edges)
+    if positions is None:
+        graph = nx.Graph()
+        graph.add_nodes_from(range(len(nodes)))
+        graph.add_edges_from(edges)
+        layout = nx.spring_layout(graph, threshold=1e-6, seed=0)
+        positions = np.array([layout[i] for i in range(len(nodes))], dtype=np.float_)
+    positions = positions.reshape(len(nodes), 2).astype(np.float_)
+    if len(nodes) > 1:
+        positions = nx.rescale_layout(positions)
+    return positions
+
+
+def _canonical_structure(
+    graph: nx.Graph,
+) -> tuple[tuple[Any, ...], tuple[tuple[int, int], ...]]:
+    """Give the structure of a graph independent of the insertion order.
+
+    Args:
+        graph: Graph to give the structure of.
+
+    Returns:
+        Tuple with the sorted nodes and the sorted edges, where the edges are given by
+        the indices of the nodes.
+    """
+    try:
+        nodes = tuple(sorted(graph.nodes))
+    except TypeError:
+        nodes = tuple(sorted(graph.nodes, key=repr))
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = tuple(
+        sorted(
+            (min(index[u], index[v]), max(index[u], index[v])) for u, v in graph.edges
+        )
+    )
+    return nodes, edges
+
+
+def _grid_positions(
+    nodes: tuple[Any, ...], edges: tuple[tuple[int, int], ...]
+) -> NDArray[np.float_] | None:
+    """Give grid positions if the graph is a grid.
+
+    Supported are graphs with 2-tuples of integers as nodes, of which exactly the
+    neighbouring nodes are connected, and graphs with integer nodes ``0,...,n-1`` that
+    are labeled row by row, like the connection graphs made from a grid specification.
+
+    Args:
+        nodes: Sorted nodes of the graph.
+        edges: Sorted edges of the graph, given by the indices of the nodes.
+
+    Returns:
+        Array of shape ``(n_nodes, 2)`` with the grid coordinates of each node, or
+        ``None`` if the graph is not a supported grid.
+    """
+    if len(nodes) == 0:
+        return None
+
+    if all(_is_int_pair(node) for node in nodes):
+        coordinates = np.array(nodes, dtype=int)
+        if _is_grid(coordinates, edges):
+            return coordinates.astype(np.float_)
+        return None
+
+    if nodes != tuple(range(len(nodes))):
+        return None
+    n_nodes = len(nodes)
+    for n_cols in range(1, n_nodes + 1):
+        if n_nodes % n_cols != 0:
+            continue
+        n_rows = n_nodes // n_cols
+        if len(edges) != n_rows * (n_cols - 1) + n_cols * (n_rows - 1):
+            continue
+        coordinates = np.stack(np.divmod(np.arange(n_nodes), n_cols), axis=1)
+        if _is_grid(coordinates, edges):
+            return coordinates.astype(np.float_)
+    return None
+
+
+def _is_grid(coordinates: NDArray[np.int_], edges: tuple[tuple[int, int], ...]) -> bool:
+    """Check whether exactly the neighbouring coordinates are connected.
+
+    Args:
+        coordinates: Array of shape ``(n_nodes, 2)`` with the coordinates of the nodes.
+        edges: Edges of the graph, given by the indices of the nodes.
+
+    Returns:
+        Boolean value stating whether the graph is a grid with the given coordinates.
+    """
+    if len(edges) == 0:
+        return len(coordinates) == 1
+    edge_array = np.array(edges)
+    distances = np.abs(coordinates[edge_array[:, 0]] - coordinates[edge_array[:, 1]])
+    if not (distances.sum(axis=1) == 1).all():
+        return False
+
+    # All neighbouring nodes should be connected
+    occupied = set(map(tuple, coordinates.tolist()))
+    n_neighbours = sum((x + 1, y) in occupied for x, y in occupied) + sum(
+        (x, y + 1) in occupied for x, y in occupied
+    )
+    return n_neighbours == len(edges)
+
+
+def _is_int_pair(node: Any) -> bool:
+    """Check whether a node is a 2-tuple of integers."""
+    return (
+        isinstance(node, tuple)
+        and len(node) == 2
+        and all(isinstance(value, (int, np.integer)) for value in node)
+    )
+
+
+__all__ = ["LayoutCache", "compute_layout", "get_layout", "set_layout_cache_dir"]
@@ -0,0 +1,511 @@
+"""This module contains a pure NumPy rasterizer, which is used as a headless backend for
+the ``"rgb_array"`` render mode.
+
+The :class:`ArraySurface` implements the small part of the ``pygame.Surface`` interface
+that is used by the visualisers, and draws into a NumPy frame buffer of shape
+``(height, width, 3)`` (or ``(height, width, 4)`` for surfaces with an alpha channel).
+Text is drawn with the :class:`BitmapFont`, which scales a built-in 5x7 pixel font.
+Neither needs ``pygame`` or SDL to be initialized, nor any system fonts.
+
+The backend is selected with the ``render_backend`` argument of the environments:
+
+    >>> from qgym.envs import Routing
+    >>> from qgym.utils.visualisation.raster import render_batch
+    >>> envs = [
+    ...     Routing((3, 3), render_mode="rgb_array", render_backend="numpy")
+    ...     for _ in range(8)
+    ... ]
+    >>> for env in envs:
+    ...     _ = env.reset()
+    >>> frames = render_batch(envs)  # array of shape (8, 700, 1600, 3)
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, Tuple, Union
+
+import numpy as np
+import pygame
+from numpy.typing import ArrayLike, NDArray
+
+RectLike = Union[pygame.Rect, Tuple[float, float, float, float]]
+
+# 5x7 pixel glyphs of the printable ASCII characters, stored as 5 columns per glyph.
+# Bit i of a column is set if row i (counted from the top) of the glyph is drawn.
+_GLYPH_DATA = (
+    "000000000000005F00000007000700147F147F14242A7F2A12231308646236495522500005030000"
+    "001C2241000041221C00082A1C2A0808083E08080050300000080808080800606000002010080402"
+    "3E5149453E00427F400042615149462141454B311814127F1027454545393C4A4949300171090503"
+    "3649494936064949291E003636000000563600000814224100141414141400412214080201510906"
+    "324979413E7E1111117E7F494949363E414141227F4141221C7F494949417F090901013E41415132"
+    "7F0808087F00417F41002040413F017F081422417F404040407F0204027F7F0408107F3E4141413E"
+    "7F090909063E4151215E7F09192946464949493101017F01013F4040403F1F2040201F7F2018207F"
+    "631408146303047804036151494543007F41410002040810200041417F0004020102044040404040"
+    "000102040020545454787F484444383844444420384444487F3854545418087E090102081454543C"
+    "7F0804047800447D40002040443D00007F10284400417F40007C041804787C080404783844444438"
+    "7C14141408081414187C7C080404084854545420043F4440203C4040207C1C2040201C3C4030403C"
+    "44281028440C5050503C4464544C44000836410000007F000000413608000804081008"
+)
+_FIRST_CHAR = 32
+_GLYPH_HEIGHT = 7
+_GLYPH_WIDTH = 5
+
+
+def _load_glyphs() -> NDArray[np.bool_]:
+    """Decode the glyph data to a boolean array of shape ``(n_glyphs, 7, 5)``."""
+    columns = np.frombuffer(bytes.fromhex(_GLYPH_DATA), dtype=np.uint8)
+    bits = np.unpackbits(
+        columns.reshape(-1, _GLYPH_WIDTH, 1), axis=2, bitorder="little"
+    )
+    return bits[:, :, :_GLYPH_HEIGHT].transpose(0, 2, 1).astype(bool)
+
+
+_GLYPHS = _load_glyphs()
+
+
+class ArraySurface:
+    """NumPy frame buffer with the ``pygame.Surface`` methods used by the visualisers."""
+
+    __slots__ = ("array", "_offset")
+
+    def __init__(
+        self,
+        size: tuple[int, int],
+        alpha: bool = False,
+        *,
+        buffer: NDArray[np.uint8] | None = None,
+    ) -> None:
+        """Init of the :class:`ArraySurface`.
+
+        Args:
+            size: Width and height of the surface.
+            alpha: If ``True``, the surface has an alpha channel and starts fully
+                transparent. Otherwise, it starts black. Defaults to ``False``.
+            buffer: Optional preallocated array of shape ``(height, width, 3)`` (or
+                ``(height, width, 4)`` if `alpha` is ``True``) and dtype ``uint8`` to
+                draw into.
+
+        Raises:
+            ValueError: If the shape or dtype of `buffer` does not match.
+        """
+        width, height = (int(value) for value in size)
+        shape = (height, width, 4 if alpha else 3)
+        if buffer is None:
+            buffer = np.zeros(shape, dtype=np.uint8)
+        elif buffer.shape != shape or buffer.dtype != np.uint8:
+            msg = f"buffer should have shape {shape} and dtype uint8, but has shape "
+            msg += f"{buffer.shape} and dtype {buffer.dtype}"
+            raise ValueError(msg)
+        self.array = buffer
+        """Array with the pixels of the surface, indexed by ``[y, x, channel]``."""
+        self._offset = (0, 0)
+
+    def get_size(self) -> tuple[int, int]:
+        """Width and height of the surface."""
+        return self.array.shape[1], self.array.shape[0]
+
+    def get_width(self) -> int:
+        """Width of the surface."""
+        return int(self.array.shape[1])
+
+    def get_height(self) -> int:
+        """Height of the surface."""
+        return int(self.array.shape[0])
+
+    def get_offset(self) -> tuple[int, int]:
+        """Offset of a subsurface inside its parent."""
+        return self._offset
+
+    def get_rect(self, **kwargs: Any) -> pygame.Rect:
+        """Get the rectangle of the surface, with the given rectangle attributes."""
+        rect = pygame.Rect((0, 0), self.get_size())
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+    @property
+    def has_alpha(self) -> bool:
+        """Boolean value stating whether the surface has an alpha channel."""
+        return self.array.shape[2] == 4
+
+    def fill(self, color: Sequence[int], rect: RectLike | None = None) -> None:
+        """Fill (part of) the surface with a solid color.
+
+        Args:
+            color: RGB or RGBA color to fill the surface with.
+            rect: Optional rectangle to fill. If ``None``, the whole surface is filled.
+        """
+        region = self.array if rect is None else self.array[self._clip(rect)]
+        if region.size == 0:
+            return
+        # Filling one row and copying it is much faster than broadcasting the pixel
+        region[0] = _to_pixel(color, self.has_alpha)
+        region[1:] = region[:1]
+
+    def blit(self, source: ArraySurface, dest: ArrayLike | pygame.Rect) -> None:
+        """Draw another surface on this surface.
+
+        Sources with an alpha channel are blended with the pixels of this surface.
+
+        Args:
+            source: Surface to draw.
+            dest: Position of the upper left corner of `source` on this surface.
+        """
+        if isinstance(dest, pygame.Rect):
+            dest = dest.topleft
+        x, y = (int(value) for value in np.asarray(dest)[:2])
+        width, height = source.get_size()
+        target = self._clip((x, y, width, height))
+        region = self.array[target]
+        if region.size == 0:
+            return
+        src = source.array[
+            target[0].start - y : target[0].stop - y,
+            target[1].start - x : target[1].stop - x,
+        ]
+        if not source.has_alpha:
+            region[..., :3] = src
+            if self.has_alpha:
+                region[..., 3] = 255
+            return
+
+        # Only blend the pixels that are not fully transparent. Most pixels of layers
+        # and text are either fully transparent or opaque.
+        visible = src[..., 3] != 0
+        visible_rows = np.flatnonzero(visible.any(axis=1))
+        if len(visible_rows) == 0:
+            return
+        first_row = visible_rows[0]
+        rows, cols = np.nonzero(visible[first_row : visible_rows[-1] + 1])
+        rows += first_row
+        src = src[rows, cols].astype(np.uint16)
+        dst = region[rows, cols].astype(np.uint16)
+        src_alpha = src[:, 3:]
+        blended = src[:, :3] * src_alpha + dst[:, :3] * (255 - src_alpha)
+        dst[:, :3] = (blended + 127) // 255
+        if self.has_alpha:
+            dst[:, 3:] = src_alpha + (dst[:, 3:] * (255 - src_alpha) + 127) // 255
+        region[rows, cols] = dst
+
+    def subsurface(self, rect: RectLike) -> ArraySurface:
+        """Get a surface that shares its pixels with a part of this surface.
+
+        Args:
+            rect: Rectangle of the subsurface.
+
+        Raises:
+            ValueError: If `rect` is not inside the surface.
+
+        Returns:
+            Subsurface of this surface.
+        """
+        rect = pygame.Rect(rect)
+        if not self.get_rect().contains(rect):
+            raise ValueError("subsurface rectangle outside surface area")
+        subsurface = ArraySurface.__new__(ArraySurface)
+        subsurface.array = self.array[rect.top : rect.bottom, rect.left : rect.right]
+        subsurface._offset = (self._offset[0] + rect.x, self._offset[1] + rect.y)
+        return subsurface
+
+    def copy(self) -> ArraySurface:
+        """Copy of the surface, with its own pixels."""
+        return ArraySurface(self.get_size(), self.has_alpha, buffer=self.array.copy())
+
+    def _clip(self, rect: RectLike) -> tuple[slice, slice]:
+        """Give the slices of the part of a rectangle that lies inside the surface."""
+        rect = pygame.Rect(rect).clip(self.get_rect())
+        return slice(rect.top, rect.bottom), slice(rect.left, rect.right)
+
+
+class BitmapFont:
+    """Font that draws a scaled built-in 5x7 pixel font.
+
+    The font size is converted to an integer scale of the glyphs, such that capital
+    letters have about the same height as in the Arial font of the same size.
+    """
+
+    def __init__(self, size: int, bold: bool = False, italic: bool = False) -> None:
+        """Init of the :class:`BitmapFont`.
+
+        Args:
+            size: Size of the font.
+            bold: If ``True``, the glyphs are drawn with thicker strokes.
+            italic: If ``True``, the glyphs are slanted.
+        """
+        self.scale = max(1, round(0.72 * size / _GLYPH_HEIGHT))
+        """Number of pixels per glyph pixel in each direction."""
+        self.bold = bold
+        """Boolean value stating whether the glyphs are drawn with thicker strokes."""
+        self.italic = italic
+        """Boolean value stating whether the glyphs are slanted."""
+
+    def render(  # pylint: disable=unused-argument
+        self, text: str, antialias: bool, color: Sequence[int]
+    ) -> ArraySurface:
+        """Draw text on a new transparent surface.
+
+        Args:
+            text: Text to draw. Characters that are not printable ASCII are drawn as
+                ``"?"``.
+            antialias: Unused, the text is never antialiased. Present for
+                compatibility with ``pygame.font.Font.render``.
+            color: Color of the text.
+
+        Returns:
+            Surface with an alpha channel, with the text drawn on it.
+        """
+        mask = self._text_mask(text)
+        surface = ArraySurface((mask.shape[1], mask.shape[0]), alpha=True)
+        surface.array[mask] = _to_pixel(color, True)
+        return surface
+
+    def size(self, text: str) -> tuple[int, int]:
+        """Width and height of the surface that :meth:`render` gives for `text`."""
+        mask = self._text_mask(text)
+        return mask.shape[1], mask.shape[0]
+
+    def _text_mask(self, text: str) -> NDArray[np.bool_]:
+        """Give a boolean array of the pixels that are drawn for a text."""
+        codes = np.array([ord(char) for char in text], dtype=int) - _FIRST_CHAR
+        codes[(codes < 0) | (codes >= len(_GLYPHS))] = ord("?") - _FIRST_CHAR
+
+        # Glyphs are separated by one empty column and surrounded by one empty row
+        cells = np.zeros((len(codes), _GLYPH_HEIGHT + 2, _GLYPH_WIDTH + 1), dtype=bool)
+        cells[:, 1:-1, 1:] = _GLYPHS[codes]
+        mask = cells.transpose(1, 0, 2).reshape(_GLYPH_HEIGHT + 2, -1)
+        mask = np.pad(mask, ((0, 0), (0, 1)))
+        mask = mask.repeat(self.scale, axis=0).repeat(self.scale, axis=1)
+
+        if self.bold:
+            mask[:, 1:] |= mask[:, :-1].copy()
+        if self.italic:
+            height = mask.shape[0]
+            slanted = np.zeros((height, mask.shape[1] + height // 4), dtype=bool)
+            for row in range(height):
+                shift = (height - 1 - row) // 4
+                slanted[row, shift : shift + mask.shape[1]] = mask[row]
+            mask = slanted
+        return mask
+
+
+def fill_circle(
+    surface: ArraySurface, center: ArrayLike, radius: int, color: Sequence[int]
+) -> None:
+    """Draw a filled circle.
+
+    Args:
+        surface: Surface to draw on.
+        center: x and y coordinates of the center of the circle.
+        radius: Radius of the circle (in pixels).
+        color: Color of the circle.
+    """
+    pos_x, pos_y = (int(value) for value in np.asarray(center, dtype=int))
+    rows, cols = surface._clip(  # pylint: disable=protected-access
+        (pos_x - radius, pos_y - radius, 2 * radius + 1, 2 * radius + 1)
+    )
+    y_grid, x_grid = np.ogrid[rows, cols]
+    mask = (x_grid - pos_x) ** 2 + (y_grid - pos_y) ** 2 <= radius**2
+    surface.array[rows, cols][mask] = _to_pixel(color, surface.has_alpha)
+
+
+def fill_polygon(
+    surface: ArraySurface, points: ArrayLike, color: Sequence[int]
+) -> None:
+    """Draw a filled convex polygon.
+
+    Args:
+        surface: Surface to draw on.
+        points: Array of shape ``(n_points, 2)`` with the corners of the polygon, in
+            clockwise or counterclockwise order. Like ``pygame.gfxdraw``, the
+            coordinates are truncated to integers.
+        color: Color of the polygon.
+    """
+    corners = np.asarray(points, dtype=np.float_).astype(int).astype(np.float_)
+    x_min, y_min = (int(value) for value in np.floor(corners.min(axis=0)))
+    x_max, y_max = (int(value) for value in np.ceil(corners.max(axis=0)))
+    rows, cols = surface._clip(  # pylint: disable=protected-access
+        (x_min, y_min, x_max - x_min + 1, y_max - y_min + 1)
+    )
+    y_grid, x_grid = np.ogrid[rows, cols]
+
+    # Each edge bounds the x coordinates of the pixels inside on one side, depending
+    # on the orientation of the polygon.
+    edges = np.roll(corners, -1, axis=0) - corners
+    orientation = np.sign(
+        np.sum(corners[:, 0] * edges[:, 1] - corners[:, 1] * edges[:, 0])
+    )
+    x_low = np.full(y_grid.shape, -np.inf)
+    x_high = np.full(y_grid.shape, np.inf)
+    for (corner_x, corner_y), (edge_x, edge_y) in zip(corners, edges):
+        if edge_y == 0:
+            outside = orientation * edge_x * (y_grid - corner_y) < -1e-9
+            x_high[outside] = -np.inf
+            continue
+        x_edge = corner_x + edge_x * (y_grid - corner_y) / edge_y
+        if orientation * edge_y > 0:
+            np.minimum(x_high, x_edge, out=x_high)
+        else:
+            np.maximum(x_low, x_edge, out=x_low)
+
+    mask = (x_grid >= x_low - 1e-9) & (x_grid <= x_high + 1e-9)
+    surface.array[rows, cols][mask] = _to_pixel(color, surface.has_alpha)
+
+
+def fill_rect(
+    surface: ArraySurface,
+    color: Sequence[int],
+    rect: RectLike,
+    *,
+    width: int = 0,
+    border_radius: int = 0,
+) -> None:
+    """Draw a (rounded) rectangle.
+
+    Args:
+        surface: Surface to draw on.
+        color: Color of the rectangle.
+        rect: Rectangle to draw.
+        width: Width of the outline. If 0 (default), the rectangle is filled.
+        border_radius: Radius of the rounded corners. Defaults to 0.
+    """
+    rect = pygame.Rect(rect)
+    inner = rect.inflate(-2 * width, -2 * width) if width > 0 else None
+    inner_radius = max(border_radius - width, 0)
+
+    # Only the rows with rounded corners are drawn with a mask, the rows in between are
+    # filled directly.
+    band = min(max(border_radius, width), (rect.height + 1) // 2)
+    middle = rect.inflate(0, -2 * band)
+    if middle.height > 0:
+        if inner is None:
+            surface.fill(color, middle)
+        else:
+            surface.fill(color, (middle.left, middle.top, width, middle.height))
+            surface.fill(color, (inner.right, middle.top, width, middle.height))
+
+    pixel = _to_pixel(color, surface.has_alpha)
+    for band_top in (rect.top, rect.bottom - band):
+        rows, cols = surface._clip(  # pylint: disable=protected-access
+            (rect.left, band_top, rect.width, band)
+        )
+        y_grid, x_grid = np.ogrid[rows, cols]
+        mask = _rounded_rect_mask(x_grid, y_grid, rect, border_radius)
+        if inner is not None:
+            mask &= ~_rounded_rect_mask(x_grid, y_grid, inner, inner_radius)
+        surface.array[rows, cols][mask] = pixel
+
+
+def blend_rect(
+    surface: ArraySurface, color: Sequence[int], rect: RectLike, alpha: int
+) -> None:
+    """Blend a color into a rectangular area.
+
+    Args:
+        surface: Surface to draw on.
+        color: Color to blend.
+        rect: Rectangle to blend the color into.
+        alpha: Opacity of the color, between 0 and 255.
+    """
+    region = surface.array[surface._clip(rect)]  # pylint: disable=protected-access
+    # Lookup table with the blended value of each channel for all 256 pixel values
+    values = np.arange(256, dtype=np.uint16) * (255 - alpha)
+    blend_table = values + np.array(color[:3], dtype=np.uint16)[:, None] * alpha + 127
+    blend_table = (blend_table // 255).astype(np.uint8)
+    for channel in range(3):
+        region[..., channel] = blend_table[channel][region[..., channel]]
+
+
+def render_batch(
+    envs: Sequence[Any], out: NDArray[np.uint8] | None = None
+) -> NDArray[np.uint8]:
+    """Render multiple environments into one array.
+
+    Each frame is written directly into its slice of the output array, so no array is
+    allocated per environment.
+
+    Args:
+        envs: Unwrapped qgym environments with render mode ``"rgb_array"`` and frames
+            of equal size.
+        out: Optional preallocated array of shape ``(len(envs), height, width, 3)`` to
+            write the frames to.
+
+    Raises:
+        ValueError: If no environments are given, or if the frames do not fit in `out`.
+
+    Returns:
+        Array of shape ``(len(envs), height, width, 3)`` with the rendered frames.
+    """
+    if len(envs) == 0:
+        raise ValueError("at least one environment should be given")
+    start = 0
+    if out is None:
+        # The size of the frames is only known after rendering the first one
+        frame = envs[0].render()
+        out = np.empty((len(envs),) + frame.shape, dtype=np.uint8)
+        out[0] = frame
+        start = 1
+    elif len(out) != len(envs):
+        msg = f"{len(envs)} frames do not fit in array of shape {out.shape}"
+        raise ValueError(msg)
+    for i in range(start, len(envs)):
+        envs[i].render(out=out[i])
+    return out
+
+
+def _rounded_rect_mask(
+    x_grid: NDArray[np.int_],
+    y_grid: NDArray[np.int_],
+    rect: pygame.Rect,
+    radius: int,
+) -> NDArray[np.bool_]:
+    """Give the pixels inside a rectangle with rounded corners.
+
+    Args:
+        x_grid: Array of shape ``(1, width)`` with the x coordinates of the pixels.
+        y_grid: Array of shape ``(height, 1)`` with the y coordinates of the pixels.
+        rect: Rectangle.
+        radius: Radius of the rounded corners.
+
+    Returns:
+        Boolean array of shape ``(height, width)``.
+    """
+    inside_x = (x_grid >= rect.left) & (x_grid < rect.right)
+    inside_y = (y_grid >= rect.top) & (y_grid < rect.bottom)
+    mask = inside_x & inside_y
+    radius = min(radius, rect.width // 2, rect.height // 2)
+    if radius <= 0:
+        return mask
+
+    # Distance to the rectangle that is shrunk by the radius, which is 0 inside it
+    center_x = np.clip(x_grid, rect.left + radius, rect.right - 1 - radius)
+    center_y = np.clip(y_grid, rect.top + radius, rect.bottom - 1 - radius)
+    return mask & ((x_grid - center_x) ** 2 + (y_grid - center_y) ** 2 <= radius**2)
+
+
+def _to_pixel(color: Sequence[int], alpha: bool) -> NDArray[np.uint8]:
+    """Convert a color to a pixel value.
+
+    Args:
+        color: RGB or RGBA color.
+        alpha: If ``True``, give an RGBA pixel. Otherwise, give an RGB pixel.
+
+    Returns:
+        Array with the values of the pixel.
+    """
+    pixel = list(color)[:4]
+    if alpha and len(pixel) == 3:
+        pixel.append(255)
+    return np.array(pixel[: 4 if alpha else 3], dtype=np.uint8)
+
+
+__all__ = [
+    "ArraySurface",
+    "BitmapFont",
+    "blend_rect",
+    "fill_circle",
+    "fill_polygon",
+    "fill_rect",
+    "render_batch",
+]
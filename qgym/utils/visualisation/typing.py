@@ -1,11 +1,13 @@
 """This module contains types and type aliases used during visualisation."""
 
-from typing import Tuple
+from typing import Tuple, Union
 
 import pygame
 
+from qgym.utils.visualisation.raster import ArraySurface, BitmapFont
+
 Color = Tuple[int, int, int]
-Font = pygame.font.Font
-Surface = pygame.surface.Surface
+Font = Union[pygame.font.Font, BitmapFont]
+Surface = Union[pygame.surface.Surface, ArraySurface]
 
 __all__ = ["Color", "Font", "Surface"]
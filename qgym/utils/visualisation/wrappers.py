@@ -1,10 +1,21 @@
-"""This module contains wrappers around some commonly used ``pygame`` functions."""
+"""This module contains wrappers around some commonly used ``pygame`` functions.
+
+The wrappers also draw on the :class:`~qgym.utils.visualisation.raster.ArraySurface` of
+the NumPy render backend.
+"""
 
 import numpy as np
 import pygame
 from numpy.typing import ArrayLike
 from pygame import gfxdraw
 
+from qgym.utils.visualisation.raster import (
+    ArraySurface,
+    blend_rect,
+    fill_circle,
+    fill_polygon,
+    fill_rect,
+)
 from qgym.utils.visualisation.typing import Color, Font, Surface
 
 # pylint: disable=invalid-name
@@ -20,6 +31,9 @@ def draw_point(screen: Surface, pos: ArrayLike, color: Color, r: int = 10) -> No
         r: Radius of the point (in pixels). Defaults to 10.
     """
     pos_x, pos_y = np.asarray(pos, dtype=int)
+    if isinstance(screen, ArraySurface):
+        fill_circle(screen, (pos_x, pos_y), r, color)
+        return
     gfxdraw.aacircle(screen, pos_x, pos_y, r, color)
     gfxdraw.filled_circle(screen, pos_x, pos_y, r, color)
 
@@ -53,6 +67,9 @@ def draw_wide_line(
     points = (p1 - sp, p1 + sp, p2 + sp, p2 - sp)
 
     # draw the polygon
+    if isinstance(screen, ArraySurface):
+        fill_polygon(screen, points, color)
+        return
     pygame.gfxdraw.aapolygon(screen, points, color)  # type: ignore[arg-type]
     pygame.gfxdraw.filled_polygon(screen, points, color)  # type: ignore[arg-type]
 
@@ -89,8 +106,34 @@ def shade_rect(
     """
     rect_width, rect_height = np.asarray(size, dtype=int)
     pos_x, pos_y = np.asarray(pos, dtype=int)
+    if isinstance(screen, ArraySurface):
+        blend_rect(screen, color, (pos_x, pos_y, rect_width, rect_height), alpha)
+        return
 
     surf = pygame.Surface((rect_width, rect_height))
     surf.set_alpha(alpha)
     surf.fill(color)
     screen.blit(surf, (pos_x, pos_y))
+
+
+def draw_rect(
+    screen: Surface,
+    color: Color,
+    rect: pygame.Rect,
+    *,
+    width: int = 0,
+    border_radius: int = 0,
+) -> None:
+    """Draw a (rounded) rectangle on the screen.
+
+    Args:
+        screen: Screen to draw the rectangle on.
+        color: Color of the rectangle.
+        rect: Rectangle to draw.
+        width: Width of the outline. If 0 (default), the rectangle is filled.
+        border_radius: Radius of the rounded corners. Defaults to 0.
+    """
+    if isinstance(screen, ArraySurface):
+        fill_rect(screen, color, rect, width=width, border_radius=border_radius)
+        return
+    pygame.draw.rect(screen, color, rect, width=width, border_radius=border_radius)
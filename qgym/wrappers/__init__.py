@@ -0,0 +1,7 @@
+"""Wrappers for the environments of this RL Gym. This package contains the
+:class:`FrameRecorder`, which records the rendered frames of an environment to disk.
+"""
+
+from qgym.wrappers.frame_recorder import FrameRecorder, load_episode
+
+__all__ = ["FrameRecorder", "load_episode"]
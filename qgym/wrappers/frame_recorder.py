@@ -0,0 +1,412 @@
+"""This module contains the :class:`FrameRecorder` wrapper, which records the rendered
+frames of an environment to disk while the environment is running.
+
+The frames are written by a background thread, so the rollout loop does not wait for
+compression or disk access. Only a bounded number of frames is kept in memory. Two
+file formats are supported:
+
+* ``"npz"``: Each episode is stored in compressed chunks of at most `chunk_size` frames,
+  named ``episode_<episode>_<chunk>.npz``. Within a chunk, each frame is stored as the
+  XOR with the previous frame. Consecutive frames differ in only a few pixels, so the
+  chunks compress very well.
+* ``"npy"``: Each episode is stored uncompressed as ``episode_<episode>.npy``, which can
+  be memory mapped.
+
+Usage:
+    >>> import tempfile
+    >>> from qgym.envs import Routing
+    >>> from qgym.wrappers import FrameRecorder, load_episode
+    >>> directory = tempfile.TemporaryDirectory()
+    >>> env = Routing((3, 3), render_mode="rgb_array")
+    >>> env = FrameRecorder(env, directory.name, policy="every_k_steps", k=10)
+    >>> _ = env.reset(seed=0)
+    >>> done = False
+    >>> while not done:
+    ...     _, _, terminated, truncated, _ = env.step(env.action_space.sample())
+    ...     done = terminated or truncated
+    >>> env.close()
+    >>> frames, steps = load_episode(directory.name, episode=0)
+    >>> int(steps[0]), len(frames) == len(steps)
+    (0, True)
+    >>> directory.cleanup()
+
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import struct
+import threading
+from pathlib import Path
+from typing import Any, SupportsFloat, Tuple, Union, cast
+
+import gymnasium
+import numpy as np
+from numpy.typing import NDArray
+
+from qgym.utils.input_validation import check_int, check_string
+
+_FrameItem = Tuple[int, int, NDArray[np.uint8]]
+_EndItem = Tuple[int]
+_Item = Union[_FrameItem, _EndItem, None]
+
+# Size of the header of the npy files, which leaves room for any frame count
+_NPY_HEADER_SIZE = 128
+
+
+class FrameRecorder(gymnasium.Wrapper):  # type: ignore[type-arg]
+    """Wrapper that records the rendered frames of an environment to disk.
+
+    The wrapped environment should use the ``"rgb_array"`` render mode.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        env: gymnasium.Env[Any, Any],
+        directory: str | os.PathLike[str],
+        *,
+        policy: str = "every_k_steps",
+        k: int = 1,
+        file_format: str = "npz",
+        chunk_size: int = 16,
+        max_queued_frames: int = 16,
+    ) -> None:
+        """Init of the :class:`FrameRecorder`.
+
+        Args:
+            env: Environment to record, with render mode ``"rgb_array"``.
+            directory: Directory to write the frames to. It is created if it does not
+                exist.
+            policy: Which frames to record. With ``"every_k_steps"`` (default), the
+                frame after the reset and after every `k`-th step is recorded, as well
+                as the last frame of each episode. With ``"episode_end"``, only the
+                last frame of each episode is recorded. An episode ends when it
+                terminates or is truncated, or at the next reset or close.
+            k: Number of steps between the recorded frames for the ``"every_k_steps"``
+                policy. Defaults to 1.
+            file_format: Either ``"npz"`` (default) for compressed chunks, or
+                ``"npy"`` for uncompressed files that can be memory mapped.
+            chunk_size: Maximum number of frames per chunk of the ``"npz"`` format.
+                Defaults to 16.
+            max_queued_frames: Maximum number of frames waiting to be written. If the
+                writer falls behind, recording a frame waits until there is room.
+                Defaults to 16.
+
+        Raises:
+            ValueError: If an unsupported `policy` or `file_format` is given.
+        """
+        super().__init__(env)
+        self.policy = check_string(policy, "policy", lower=True)
+        """Policy stating which frames are recorded."""
+        if self.policy not in ("every_k_steps", "episode_end"):
+            msg = f"unknown policy '{policy}', choose from 'every_k_steps' and "
+            msg += "'episode_end'"
+            raise ValueError(msg)
+        self.file_format = check_string(file_format, "file_format", lower=True)
+        """Format of the files the frames are written to."""
+        if self.file_format not in ("npz", "npy"):
+            msg = f"unknown file format '{file_format}', choose from 'npz' and 'npy'"
+            raise ValueError(msg)
+        self.k = check_int(k, "k", l_bound=1)
+        """Number of steps between the recorded frames."""
+        self.chunk_size = check_int(chunk_size, "chunk_size", l_bound=1)
+        """Maximum number of frames per chunk of the ``"npz"`` format."""
+        self.directory = Path(directory)
+        """Directory the frames are written to."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self.episode = -1
+        """Index of the current episode, or -1 before the first reset."""
+        self._episode_step = 0
+        self._last_recorded_step = -1
+        self._episode_open = False
+        max_queued_frames = check_int(max_queued_frames, "max_queued_frames", l_bound=1)
+        self._queue: queue.Queue[_Item] = queue.Queue(maxsize=max_queued_frames)
+        self._error: BaseException | None = None
+        self._writer: threading.Thread | None = threading.Thread(
+            target=self._write_loop, name="FrameRecorder", daemon=True
+        )
+        self._writer.start()
+
+    def reset(
+        self, *, seed: int | None = None, options: dict[str, Any] | None = None
+    ) -> tuple[Any, dict[str, Any]]:
+        """Reset the environment and start recording a new episode.
+
+        Args:
+            seed: Seed for the random number generator of the environment.
+            options: Dictionary containing keyword-argument pairs to configure the
+                reset.
+
+        Returns:
+            Initial observation and a dictionary containing debugging information.
+        """
+        self._end_episode()
+        observation, info = self.env.reset(seed=seed, options=options)
+        self.episode += 1
+        self._episode_step = 0
+        self._last_recorded_step = -1
+        if self.policy == "every_k_steps":
+            self._record()
+        self._episode_open = True
+        return observation, info
+
+    def step(
+        self, action: Any
+    ) -> tuple[Any, SupportsFloat, bool, bool, dict[str, Any]]:
+        """Perform a step in the environment and record the frame if required.
+
+        Args:
+            action: Action to perform.
+
+        Returns:
+            The observation, reward, terminated and truncated indicators and info of
+            the environment.
+        """
+        observation, reward, terminated, truncated, info = self.env.step(action)
+        self._episode_step += 1
+        if (
+            self._episode_open
+            and self.policy == "every_k_steps"
+            and self._episode_step % self.k == 0
+        ):
+            self._record()
+        if terminated or truncated:
+            self._end_episode()
+        return observation, reward, terminated, truncated, info
+
+    def close(self) -> None:
+        """Write the remaining frames, stop the writer and close the environment.
+
+        Raises:
+            Exception: Any exception raised while writing the frames.
+        """
+        try:
+            if self._writer is not None:
+                try:
+                    self._end_episode()
+                finally:
+                    self._stop_writer()
+        finally:
+            super().close()
+
+    def _stop_writer(self) -> None:
+        """Let the writer finish the queued frames and wait until it has stopped.
+
+        Raises:
+            Exception: Any exception raised by the writer.
+        """
+        try:
+            self._put(None)
+            cast(threading.Thread, self._writer).join()
+            self._raise_writer_error()
+        finally:
+            self._writer = None
+
+    def _record(self) -> None:
+        """Render the current frame and hand it to the writer.
+
+        Raises:
+            ValueError: If the environment does not render RGB arrays.
+        """
+        frame = self.env.render()
+        if not isinstance(frame, np.ndarray):
+            msg = "the recorded environment should have render mode 'rgb_array'"
+            raise ValueError(msg)
+        self._put((self.episode, self._episode_step, frame))
+        self._last_recorded_step = self._episode_step
+
+    def _end_episode(self) -> None:
+        """Record the last frame of the current episode, if it was not recorded yet,
+        and let the writer finish the files of the episode.
+        """
+        if self._episode_open:
+            self._episode_open = False
+            if self._last_recorded_step != self._episode_step:
+                self._record()
+            self._put((self.episode,))
+
+    def _put(self, item: _Item) -> None:
+        """Put an item in the queue of the writer, waiting while the queue is full.
+
+        Raises:
+            Exception: Any exception raised by the writer.
+            RuntimeError: If the writer is not running.
+        """
+        while True:
+            self._raise_writer_error()
+            if self._writer is None or not self._writer.is_alive():
+                # The writer may have stopped because of an error after the check above
+                self._raise_writer_error()
+                raise RuntimeError("the frame writer is not running")
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _raise_writer_error(self) -> None:
+        """Raise the exception of the writer, if it stopped because of one.
+
+        The exception is kept, so every later attempt to record a frame raises it as
+        well.
+        """
+        if self._error is not None:
+            raise self._error
+
+    def _write_loop(self) -> None:
+        """Write the queued frames until ``None`` is received."""
+        writer: _EpisodeWriter | None = None
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    return
+                if len(item) == 1:
+                    if writer is not None:
+                        writer.close()
+                    writer = None
+                    continue
+
+                episode, step, frame = item  # type: ignore[misc]
+                if writer is None:
+                    writer = _EpisodeWriter(self, episode, frame)
+                writer.add(step, frame)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            if writer is not None:
+                writer.abort()
+            self._error = error
+
+
+class _EpisodeWriter:
+    """Writer of the frames of a single episode."""
+
+    def __init__(
+        self, recorder: FrameRecorder, episode: int, frame: NDArray[np.uint8]
+    ) -> None:
+        self.path = recorder.directory / f"episode_{episode:06d}"
+        self.file_format = recorder.file_format
+        self.frame_shape = frame.shape
+        self.steps: list[int] = []
+        self.n_chunks = 0
+
+        if self.file_format == "npz":
+            self.chunk = np.empty((recorder.chunk_size,) + frame.shape, dtype=np.uint8)
+        else:
+            self.file = open(  # pylint: disable=consider-using-with
+                self.path.with_suffix(".npy"), "wb"
+            )
+            try:
+                self.file.write(_npy_header((0,) + frame.shape))
+            except BaseException:
+                self.file.close()
+                raise
+
+    def add(self, step: int, frame: NDArray[np.uint8]) -> None:
+        """Add a frame to the episode."""
+        if frame.shape != self.frame_shape:
+            msg = f"frame of shape {frame.shape} differs from the first frame of the "
+            msg += f"episode with shape {self.frame_shape}"
+            raise ValueError(msg)
+
+        if self.file_format == "npy":
+            self.file.write(np.ascontiguousarray(frame, dtype=np.uint8).tobytes())
+            self.steps.append(step)
+            return
+
+        self.chunk[len(self.steps)] = frame
+        self.steps.append(step)
+        if len(self.steps) == len(self.chunk):
+            self._write_chunk()
+
+    def close(self) -> None:
+        """Write the remaining frames and finish the files of the episode."""
+        if self.file_format == "npz":
+            if self.steps:
+                self._write_chunk()
+            return
+
+        # Fill in the number of frames in the header
+        with self.file:
+            self.file.seek(0)
+            self.file.write(_npy_header((len(self.steps),) + self.frame_shape))
+        np.save(f"{self.path}_steps.npy", np.array(self.steps, dtype=np.int_))
+
+    def abort(self) -> None:
+        """Close the open file of the episode without finishing it."""
+        if self.file_format == "npy":
+            self.file.close()
+
+    def _write_chunk(self) -> None:
+        """Write the buffered frames as a delta encoded compressed chunk."""
+        n_frames = len(self.steps)
+        frames = np.empty_like(self.chunk[:n_frames])
+        frames[0] = self.chunk[0]
+        np.bitwise_xor(
+            self.chunk[1:n_frames], self.chunk[: n_frames - 1], out=frames[1:]
+        )
+
+        path = Path(f"{self.path}_{self.n_chunks:04d}.npz")
+        # Write to a temporary file first, such that readers never see a partially
+        # written chunk
+        tmp_path = path.with_suffix(".tmp.npz")
+        np.savez_compressed(
+            tmp_path, frames=frames, steps=np.array(self.steps, dtype=np.int_)
+        )
+        os.replace(tmp_path, path)
+        self.n_chunks += 1
+        self.steps = []
+
+
+def load_episode(
+    directory: str | os.PathLike[str], episode: int, *, mmap_mode: str | None = "r"
+) -> tuple[NDArray[np.uint8], NDArray[np.int_]]:
+    """Load the frames of an episode that was recorded by a :class:`FrameRecorder`.
+
+    Args:
+        directory: Directory the frames were written to.
+        episode: Index of the episode to load.
+        mmap_mode: Memory map mode used for the ``"npy"`` format, see
+            :func:`numpy.load`. Defaults to ``"r"``.
+
+    Raises:
+        FileNotFoundError: If no frames of the episode were found.
+
+    Returns:
+        Tuple with an array of shape ``(n_frames, height, width, 3)`` with the frames,
+        and an array with the step of the episode at which each frame was recorded.
+    """
+    path = Path(directory) / f"episode_{episode:06d}"
+    if path.with_suffix(".npy").exists():
+        frames = np.load(path.with_suffix(".npy"), mmap_mode=mmap_mode)
+        steps_path = Path(f"{path}_steps.npy")
+        steps = np.load(steps_path) if steps_path.exists() else np.empty(0, dtype=int)
+        return frames, steps
+
+    chunk_paths = sorted(path.parent.glob(f"{path.name}_[0-9][0-9][0-9][0-9].npz"))
+    if not chunk_paths:
+        raise FileNotFoundError(f"no frames of episode {episode} in '{directory}'")
+    frames_list = []
+    steps_list = []
+    for chunk_path in chunk_paths:
+        with np.load(chunk_path) as chunk:
+            frames_list.append(np.bitwise_xor.accumulate(chunk["frames"], axis=0))
+            steps_list.append(chunk["steps"])
+    return np.concatenate(frames_list), np.concatenate(steps_list)
+
+
+def _npy_header(shape: tuple[int, ...]) -> bytes:
+    """Give a header of fixed size for a npy file with uint8 data of the given shape.
+
+    Args:
+        shape: Shape of the array.
+
+    Returns:
+        Header of a version 1.0 npy file, with a size of 128 bytes.
+    """
+    header = repr({"descr": "|u1", "fortran_order": False, "shape": shape})
+    magic = np.lib.format.magic(1, 0)
+    header_length = _NPY_HEADER_SIZE - len(magic) - 2
+    header = header.ljust(header_length - 1) + "\n"
+    return magic + struct.pack("<H", header_length) + header.encode("latin1")
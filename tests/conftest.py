@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+
+@pytest.fixture
+def mp_dict() -> dict[str, Any]:
+    return {
+        "n_qubits": 3,
+        "gates": {"prep": 1, "x": 2, "y": 2, "z": 2, "cnot": 4, "measure": 10},
+        "machine_restrictions": {
+            "same_start": {"measure"},
+            "not_in_same_cycle": {"x": ["y", "z"], "y": ["x", "z"], "z": ["x", "y"]},
+        },
+    }
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import networkx as nx
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from qgym.envs import InitialMapping
+from qgym.envs.initial_mapping import (
+    BasicRewarder,
+    InitialMappingState,
+    greedy_degree_mapping,
+    score_mappings,
+    simulated_annealing_mapping,
+    subgraph_isomorphism_mapping,
+)
+from qgym.generators.graph import BasicGraphGenerator, NullGraphGenerator
+
+
+def _sa_mapping(state: InitialMappingState) -> NDArray[np.int_]:
+    return simulated_annealing_mapping(state, n_iterations=200, seed=42)
+
+
+MAPPERS = [greedy_degree_mapping, _sa_mapping, subgraph_isomorphism_mapping]
+
+
+def _make_state(
+    connection_graph: nx.Graph, interaction_graph: nx.Graph
+) -> InitialMappingState:
+    state = InitialMappingState(connection_graph, NullGraphGenerator())
+    return state.reset(interaction_graph=interaction_graph)
+
+
+def _line_interaction_graph() -> nx.Graph:
+    interaction_graph = nx.empty_graph(9)
+    interaction_graph.add_edges_from([(0, 5), (5, 2), (2, 7), (7, 4)])
+    return interaction_graph
+
+
+@pytest.mark.parametrize("mapper", MAPPERS)
+def test_valid_mapping(
+    mapper: Callable[[InitialMappingState], NDArray[np.int_]],
+) -> None:
+    connection_graph = nx.convert_node_labels_to_integers(nx.grid_graph((3, 3)))
+    state = _make_state(connection_graph, _line_interaction_graph())
+    mapping = mapper(state)
+
+    assert state.is_done()
+    np.testing.assert_array_equal(mapping, state.mapping)
+    np.testing.assert_array_equal(np.sort(mapping), np.arange(9))
+
+
+@pytest.mark.parametrize("mapper", MAPPERS)
+def test_perfect_mapping(
+    mapper: Callable[[InitialMappingState], NDArray[np.int_]],
+) -> None:
+    connection_graph = nx.convert_node_labels_to_integers(nx.grid_graph((3, 3)))
+    state = _make_state(connection_graph, _line_interaction_graph())
+    mapper(state)
+
+    # A line of 5 qubits fits on a 3x3 grid, so every edge should be 'good'
+    assert state.mapped_edges["n_bad"] == 0
+    assert state.mapped_edges["fidelity"] == 4
+
+
+@pytest.mark.parametrize("mapper", MAPPERS)
+def test_environment_state(
+    mapper: Callable[[InitialMappingState], NDArray[np.int_]],
+) -> None:
+    env = InitialMapping((3, 3))
+    env.reset(options={"interaction_graph": _line_interaction_graph()})
+    mapping = mapper(env.state)
+
+    assert env.state.is_done()
+    np.testing.assert_array_equal(mapping, env.state.mapping)
+
+
+@pytest.mark.parametrize("mapper", MAPPERS)
+def test_mapped_state(
+    mapper: Callable[[InitialMappingState], NDArray[np.int_]],
+) -> None:
+    state = _make_state(nx.path_graph(3), nx.path_graph(3))
+    state.update_state(np.array([0, 0]))
+    with pytest.raises(ValueError):
+        mapper(state)
+
+
+def test_score_mappings() -> None:
+    connection_graph = nx.convert_node_labels_to_integers(nx.grid_graph((3, 3)))
+    generator = BasicGraphGenerator(seed=1)
+    generator.set_state_attributes(connection_graph=connection_graph)
+    state = InitialMappingState(connection_graph, generator)
+    rewarder = BasicRewarder()
+    rng = np.random.default_rng(1)
+
+    mappings = np.array([rng.permutation(9) for _ in range(10)])
+    scores = score_mappings(state, mappings)
+    assert scores.shape == (10,)
+
+    edges = state.graphs["interaction"]["edges"]
+    for mapping, score in zip(mappings, scores):
+        state.reset(interaction_edges=edges)
+        for logical_qubit, physical_qubit in enumerate(mapping):
+            state.update_state(np.array([physical_qubit, logical_qubit]))
+        assert score == pytest.approx(rewarder._compute_state_reward(state))
+
+
+def test_no_subgraph_isomorphism() -> None:
+    state = _make_state(nx.path_graph(4), nx.complete_graph(4))
+    with pytest.raises(ValueError):
+        subgraph_isomorphism_mapping(state)
+
+
+def test_simulated_annealing_deterministic() -> None:
+    connection_graph = nx.convert_node_labels_to_integers(nx.grid_graph((3, 3)))
+    interaction_graph = nx.gnp_random_graph(9, 0.3, seed=3)
+    mapping1 = _sa_mapping(_make_state(connection_graph, interaction_graph))
+    mapping2 = _sa_mapping(_make_state(connection_graph, interaction_graph))
+    np.testing.assert_array_equal(mapping1, mapping2)
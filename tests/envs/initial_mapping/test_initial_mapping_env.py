@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 import networkx as nx
 import numpy as np
 import pytest
@@ -14,6 +16,7 @@ from qgym.envs.initial_mapping import (
     InitialMappingState,
     SingleStepRewarder,
 )
+from qgym.generators.graph import NullGraphGenerator
 from qgym.templates import Rewarder
 
 
@@ -47,6 +50,40 @@ class TestEnvironment:
         assert is_done
         assert not truncated
 
+    def test_action_masks(self, small_env: InitialMapping) -> None:
+        np.testing.assert_array_equal(small_env.action_masks(), [1, 1, 1, 1])
+
+        small_env.step(np.array([0, 1]))
+        np.testing.assert_array_equal(small_env.action_masks(), [0, 1, 1, 0])
+
+        # Illegal actions do not change the masks
+        small_env.step(np.array([0, 0]))
+        np.testing.assert_array_equal(small_env.action_masks(), [0, 1, 1, 0])
+
+        small_env.step(np.array([1, 0]))
+        assert not small_env.action_masks().any()
+
+        small_env.reset()
+        assert small_env.action_masks().all()
+
+    def test_array_backed_mapping(self, small_env: InitialMapping) -> None:
+        state = small_env._state
+        small_env.step(np.array([1, 0]))
+        np.testing.assert_array_equal(state.mapping, [2, 0])
+        np.testing.assert_array_equal(state.inverse_mapping, [1, 2])
+
+        mapping_dict = state.mapping_dict
+        assert dict(mapping_dict) == {0: 1}
+        assert 1 not in mapping_dict
+        assert 5 not in mapping_dict
+        with pytest.raises(KeyError):
+            mapping_dict[1]
+
+        # The view reflects later updates of the state
+        small_env.step(np.array([0, 1]))
+        assert dict(mapping_dict) == {0: 1, 1: 0}
+        assert len(mapping_dict) == 2
+
     def test_truncation(self, small_env: InitialMapping) -> None:
         truncated = False
         for _ in range(10000):
@@ -122,3 +159,138 @@ def test_init_custom_rewarder(rewarder: Rewarder) -> None:
     assert env.rewarder == rewarder
     # Check that we made a copy for safety
     assert env.rewarder is not rewarder
+
+
+class TestEdgeListObservation:
+
+    @pytest.fixture(name="env")
+    def edge_list_env_fixture(self) -> InitialMapping:
+        return InitialMapping(connection_graph=(2, 2), interaction_format="edge_list")
+
+    def test_validity(self, env: InitialMapping) -> None:
+        check_env(env, warn=True)
+
+    def test_observation(self, env: InitialMapping) -> None:
+        interaction_graph = nx.Graph()
+        interaction_graph.add_nodes_from(range(4))
+        interaction_graph.add_edges_from([(0, 1), (1, 3)])
+        obs, _ = env.reset(options={"interaction_graph": interaction_graph})
+
+        assert "interaction_matrix" not in obs
+        assert obs in env.observation_space
+        edges = obs["interaction_edges"].reshape(2, -1)
+        assert edges.shape == (2, 10)
+        np.testing.assert_array_equal(edges[:, :2], [[0, 1], [1, 3]])
+        assert (edges[:, 2:] == 4).all()
+
+    def test_reward_matches_matrix_format(self) -> None:
+        interaction_graph = nx.cycle_graph(4)
+        rewards = []
+        for interaction_format in ["matrix", "edge_list"]:
+            env = InitialMapping((2, 2), interaction_format=interaction_format)
+            env.reset(options={"interaction_graph": interaction_graph})
+            for action in [(0, 0), (3, 1), (1, 2), (2, 3)]:
+                _, reward, _, _, _ = env.step(np.array(action))
+            rewards.append(reward)
+        assert rewards[0] == rewards[1]
+
+    def test_max_interaction_edges(self) -> None:
+        env = InitialMapping(
+            (2, 2),
+            NullGraphGenerator(),
+            interaction_format="edge_list",
+            max_interaction_edges=3,
+        )
+        assert env.observation_space["interaction_edges"].shape == (6,)
+        with pytest.raises(ValueError):
+            env.reset(options={"interaction_graph": nx.complete_graph(4)})
+
+    def test_max_interaction_edges_generator(self) -> None:
+        with pytest.raises(ValueError):
+            InitialMapping(
+                (2, 2), interaction_format="edge_list", max_interaction_edges=5
+            )
+        # The bound only applies to the edge list format
+        InitialMapping((2, 2), max_interaction_edges=5)
+        InitialMapping((2, 2), interaction_format="edge_list", max_interaction_edges=6)
+
+    def test_invalid_format(self) -> None:
+        with pytest.raises(ValueError):
+            InitialMapping((2, 2), interaction_format="sparse")
+
+
+@pytest.mark.parametrize("interaction_format", ["matrix", "edge_list"])
+def test_flatten_observation(interaction_format: str) -> None:
+    env = InitialMapping((2, 2), interaction_format=interaction_format)
+    flat_env = InitialMapping(
+        (2, 2), interaction_format=interaction_format, flatten_observation=True
+    )
+    check_env(flat_env, warn=True)
+    layout = flat_env.observation_layout
+    assert layout is not None
+    assert layout.offsets["mapping"] == (0, 4)
+
+    options = {"interaction_graph": nx.cycle_graph(4)}
+    obs, _ = env.reset(options=options)
+    flat_obs, _ = flat_env.reset(options=options)
+    for key, value in layout.unflatten(flat_obs).items():
+        np.testing.assert_array_equal(value, obs[key])
+
+    obs = env.step(np.array([0, 1]))[0]
+    flat_obs = flat_env.step(np.array([0, 1]))[0]
+    assert flat_obs in flat_env.observation_space
+    for key, value in layout.unflatten(flat_obs).items():
+        np.testing.assert_array_equal(value, obs[key])
+
+
+class TestInteractionEdges:
+
+    @pytest.fixture(name="env")
+    def env_fixture(self) -> InitialMapping:
+        return InitialMapping(connection_graph=(2, 2))
+
+    def test_lazy_interaction_graph(self, env: InitialMapping) -> None:
+        env.reset()
+        assert env._state.graphs["interaction"]["graph"] is None
+        graph = env._state.interaction_graph
+        assert len(graph) == 4
+        edges = env._state.graphs["interaction"]["edges"]
+        assert graph.number_of_edges() == len(edges)
+
+    def test_reset_with_edges(self, env: InitialMapping) -> None:
+        obs, _ = env.reset(options={"interaction_edges": [(0, 1), (1, 3)]})
+        expected_matrix = np.zeros((4, 4))
+        expected_matrix[[0, 1, 1, 3], [1, 0, 3, 1]] = 1
+        np.testing.assert_array_equal(obs["interaction_matrix"], expected_matrix.flat)
+
+        interaction_graph = nx.empty_graph(4)
+        interaction_graph.add_edges_from([(0, 1), (1, 3)])
+        graph_obs, _ = env.reset(options={"interaction_graph": interaction_graph})
+        np.testing.assert_array_equal(
+            graph_obs["interaction_matrix"], expected_matrix.flat
+        )
+
+    @pytest.mark.parametrize("interaction_format", ["matrix", "edge_list"])
+    def test_reset_with_node_labels(self, interaction_format: str) -> None:
+        env = InitialMapping((2, 2), interaction_format=interaction_format)
+        # The nodes are numbered in the order of the graph
+        labelled_graph = nx.Graph([(10, 11), (11, 13), ("a", 10)])
+        env.reset(options={"interaction_graph": labelled_graph})
+        np.testing.assert_array_equal(
+            env._state.graphs["interaction"]["edges"], [[0, 1], [0, 3], [1, 2]]
+        )
+        assert set(env._state.interaction_graph) == {0, 1, 2, 3}
+        for action in [(0, 0), (1, 1), (2, 2), (3, 3)]:
+            env.step(np.array(action))
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"interaction_edges": [(0, 4)]},
+            {"interaction_edges": [(0, 1)], "interaction_graph": nx.Graph([(0, 1)])},
+            {"interaction_graph": nx.path_graph(5)},
+        ],
+    )
+    def test_reset_errors(self, env: InitialMapping, options: dict[str, Any]) -> None:
+        with pytest.raises(ValueError):
+            env.reset(options=options)
@@ -248,3 +248,29 @@ def test_fidelity_episode_rewarder(
         )
 
         np.testing.assert_allclose(reward, rewards[i])
+
+
+def test_incremental_state_reward() -> None:
+    rng = np.random.default_rng(42)
+    connection_graph = nx.fast_gnp_random_graph(10, 0.4, seed=1)
+    for u, v in connection_graph.edges():
+        connection_graph.edges[u, v]["weight"] = rng.uniform(0.5, 1)
+    interaction_graph = nx.fast_gnp_random_graph(10, 0.5, seed=2)
+    state = InitialMappingState(connection_graph, NullGraphGenerator())
+    state.reset(interaction_graph=interaction_graph)
+    rewarder = BasicRewarder()
+
+    connection_matrix = nx.to_numpy_array(connection_graph)
+    for physical_qubit, logical_qubit in zip(rng.permutation(10), rng.permutation(10)):
+        state.update_state(np.array([physical_qubit, logical_qubit]))
+
+        expected_reward = 0.0
+        for logical_i, logical_j in interaction_graph.edges():
+            if logical_i in state.mapping_dict and logical_j in state.mapping_dict:
+                physical_i = state.mapping_dict[logical_i]
+                physical_j = state.mapping_dict[logical_j]
+                fidelity = connection_matrix[physical_i, physical_j]
+                expected_reward += 5 * fidelity if fidelity else -1
+
+        reward = rewarder._compute_state_reward(state)
+        np.testing.assert_allclose(reward, expected_reward)
@@ -3,9 +3,13 @@
 import time
 
 import networkx as nx
+import numpy as np
 import pytest
 
 from qgym.envs.initial_mapping import InitialMapping
+from qgym.envs.initial_mapping.initial_mapping_visualiser import (
+    InitialMappingVisualiser,
+)
 
 
 @pytest.mark.skip(reason="This needs to be manually inspected")
@@ -23,5 +27,25 @@ def test_initial_mapping_visualiser() -> None:
             break
 
 
+def test_cached_layers() -> None:
+    connection_graph = nx.cycle_graph(4)
+    env = InitialMapping(connection_graph, render_mode="rgb_array")
+    visualiser = env._visualiser
+    assert isinstance(visualiser, InitialMappingVisualiser)
+
+    for episode in range(2):
+        env.reset(options={"interaction_graph": nx.path_graph(4 - episode)})
+        done = False
+        while not done:
+            # A fresh visualiser has no cached layers, so it draws everything
+            fresh = InitialMappingVisualiser("rgb_array", connection_graph)
+            np.testing.assert_array_equal(env.render(), fresh.render(env._state))
+
+            mask = env.action_masks()
+            action = [np.flatnonzero(mask[:4])[-1], np.flatnonzero(mask[4:])[0]]
+            _, _, done, _, _ = env.step(np.array(action))
+    env.close()
+
+
 if __name__ == "__main__":
     test_initial_mapping_visualiser()
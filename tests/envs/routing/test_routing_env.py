@@ -29,3 +29,37 @@ class TestEnvironment:
         env = Routing(**kwargs)  # type: ignore[arg-type]
         obs = env.step(0)[0]
         np.testing.assert_array_equal(obs["mapping"], [2, 1, 0, 3])
+
+    def test_flatten_observation(
+        self, kwargs: dict[str, tuple[int, int] | bool]
+    ) -> None:
+        env = Routing(**kwargs)  # type: ignore[arg-type]
+        flat_env = Routing(**kwargs, flatten_observation=True)  # type: ignore[arg-type]
+        layout = flat_env.observation_layout
+        assert layout is not None
+
+        options = {"interaction_circuit": [[0, 1], [1, 2], [0, 3], [2, 3]]}
+        obs, _ = env.reset(options=options)
+        flat_obs, _ = flat_env.reset(options=options)
+        for key, value in layout.unflatten(flat_obs).items():
+            np.testing.assert_array_equal(value, obs[key])
+
+        obs = env.step(0)[0]
+        flat_obs = flat_env.step(0)[0]
+        assert flat_obs in flat_env.observation_space
+        for key, value in layout.unflatten(flat_obs).items():
+            np.testing.assert_array_equal(value, obs[key])
+        check_env(flat_env, warn=True)
+
+    def test_flat_observations_are_independent(
+        self, kwargs: dict[str, tuple[int, int] | bool]
+    ) -> None:
+        env = Routing(**kwargs, flatten_observation=True)  # type: ignore[arg-type]
+        options = {"interaction_circuit": [[0, 1], [1, 2], [0, 3], [2, 3]]}
+        obs0, _ = env.reset(options=options)
+        obs1 = env.step(0)[0]
+        obs2 = env.step(1)[0]
+        obs3, _ = env.reset(options=options)
+        assert not np.shares_memory(obs0, obs1)
+        assert not np.shares_memory(obs1, obs2)
+        assert not np.shares_memory(obs2, obs3)
@@ -1,9 +1,12 @@
 import time
+from collections import deque
 
 import networkx as nx
+import numpy as np
 import pytest
 
 from qgym.envs.routing import Routing
+from qgym.envs.routing.routing_visualiser import RoutingVisualiser
 
 
 @pytest.mark.skip(reason="This needs to be manually inspected")
@@ -21,5 +24,61 @@ def test_routing_visualiser() -> None:
             break
 
 
+def test_cached_layers() -> None:
+    env = Routing((2, 2), max_observation_reach=2, render_mode="rgb_array")
+    visualiser = env._visualiser
+    assert isinstance(visualiser, RoutingVisualiser)
+    rng = np.random.default_rng(0)
+    circuit = [[0, 1], [1, 2], [0, 3], [2, 3], [1, 3]]
+
+    for _ in range(2):
+        env.reset(options={"interaction_circuit": circuit})
+        for _ in range(20):
+            # A fresh visualiser has no cached layers, so it draws everything
+            fresh = RoutingVisualiser("rgb_array", env._state.connection_graph)
+            np.testing.assert_array_equal(env.render(), fresh.render(env._state))
+            _, _, done, _, _ = env.step(int(rng.integers(env.action_space.n)))
+            if done:
+                break
+    env.close()
+
+
+def test_rerun_rendered_later() -> None:
+    env = Routing((2, 2), max_observation_reach=2, render_mode="rgb_array")
+    surpass = env.action_space.n - 1
+    circuit = [[0, 1], [1, 2], [0, 3], [2, 3], [1, 3], [0, 2], [1, 3], [0, 1]]
+    # Render the rerun of the same circuit for the first time at a later step and
+    # position, with different swaps
+    for actions in (
+        [surpass, surpass, 0, surpass, surpass],
+        [surpass, 2] + [surpass] * 7,
+    ):
+        env.reset(options={"interaction_circuit": circuit})
+        for action in actions:
+            env.step(action)
+        fresh = RoutingVisualiser("rgb_array", env._state.connection_graph)
+        np.testing.assert_array_equal(env.render(), fresh.render(env._state))
+    env.close()
+
+
+def test_update_mapping() -> None:
+    visualiser = RoutingVisualiser("rgb_array", nx.cycle_graph(3))
+    swap_gates_inserted = deque([(0, 0, 1), (2, 1, 2), (2, 0, 1), (3, 0, 2)])
+    mapping = np.arange(3)
+    idx = 0
+    expected = [([1, 0, 2], 1), ([1, 0, 2], 0), ([2, 1, 0], 2), ([0, 1, 2], 1)]
+    for position, (expected_mapping, expected_swaps) in enumerate(expected):
+        idx, mapping, n_swaps = visualiser._update_mapping(
+            mapping=mapping,
+            swap_gates_inserted=swap_gates_inserted,
+            position=position,
+            starting_idx=idx,
+        )
+        np.testing.assert_array_equal(mapping, expected_mapping)
+        assert n_swaps == expected_swaps
+    assert idx == len(swap_gates_inserted)
+    visualiser.close()
+
+
 if __name__ == "__main__":
     test_routing_visualiser()
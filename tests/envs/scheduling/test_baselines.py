@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from copy import deepcopy
+
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from qgym.custom_types import Gate
+from qgym.envs.scheduling import (
+    CommutationRulebook,
+    MachineProperties,
+    Scheduling,
+    SchedulingState,
+    alap_schedule,
+    asap_schedule,
+    critical_path_schedule,
+)
+from qgym.generators import BasicCircuitGenerator, NullCircuitGenerator
+
+SCHEDULERS = [asap_schedule, alap_schedule, critical_path_schedule]
+
+
+@pytest.fixture(name="machine_properties")
+def _machine_properties() -> MachineProperties:
+    machine_properties = MachineProperties(4)
+    machine_properties.add_gates(
+        {"prep": 1, "x": 2, "y": 2, "z": 2, "cnot": 4, "measure": 10}
+    )
+    machine_properties.add_same_start(["measure"])
+    machine_properties.add_not_in_same_cycle([("x", "y"), ("x", "z"), ("y", "z")])
+    return machine_properties
+
+
+def _make_state(
+    machine_properties: MachineProperties, circuit: list[Gate]
+) -> SchedulingState:
+    state = SchedulingState(
+        machine_properties=deepcopy(machine_properties),
+        max_gates=50,
+        dependency_depth=1,
+        circuit_generator=NullCircuitGenerator(),
+        rulebook=CommutationRulebook(),
+    )
+    return state.reset(circuit=circuit)
+
+
+@pytest.mark.parametrize("scheduler", SCHEDULERS)
+def test_empty_circuit(
+    machine_properties: MachineProperties,
+    scheduler: Callable[[SchedulingState], NDArray[np.int_]],
+) -> None:
+    state = _make_state(machine_properties, [])
+    assert len(scheduler(state)) == 0
+
+
+@pytest.mark.parametrize(
+    "scheduler,expected_schedule",
+    [
+        (asap_schedule, [6, 2, 0, 5]),
+        (alap_schedule, [8, 4, 2, 0]),
+        (critical_path_schedule, [6, 2, 0, 2]),
+    ],
+)
+def test_schedules(
+    machine_properties: MachineProperties,
+    scheduler: Callable[[SchedulingState], NDArray[np.int_]],
+    expected_schedule: list[int],
+) -> None:
+    circuit = [
+        Gate("prep", 0, 0),
+        Gate("cnot", 0, 1),
+        Gate("x", 0, 0),
+        Gate("y", 2, 2),
+    ]
+    state = _make_state(machine_properties, circuit)
+    np.testing.assert_array_equal(scheduler(state), expected_schedule)
+
+
+@pytest.mark.parametrize("scheduler", SCHEDULERS)
+def test_random_circuits(
+    machine_properties: MachineProperties,
+    scheduler: Callable[[SchedulingState], NDArray[np.int_]],
+) -> None:
+    generator = BasicCircuitGenerator(seed=42)
+    generator.set_state_attributes(machine_properties=machine_properties, max_gates=50)
+
+    for _ in range(10):
+        circuit = next(generator)
+        state = _make_state(machine_properties, circuit)
+        schedule = scheduler(state)
+        assert state.is_done()
+        assert (schedule >= 0).all()
+
+        # Gates acting on the same qubit do not overlap
+        durations = {"prep": 1, "x": 2, "y": 2, "z": 2, "cnot": 4, "measure": 10}
+        for qubit in range(machine_properties.n_qubits):
+            intervals = sorted(
+                (schedule[idx], schedule[idx] + durations[gate.name])
+                for idx, gate in enumerate(circuit)
+                if qubit in (gate.q1, gate.q2)
+            )
+            for (_, end), (start, _) in zip(intervals, intervals[1:]):
+                assert end <= start
+
+
+def test_deterministic(machine_properties: MachineProperties) -> None:
+    generator = BasicCircuitGenerator(seed=1)
+    generator.set_state_attributes(machine_properties=machine_properties, max_gates=50)
+    circuit = next(generator)
+
+    schedule1 = critical_path_schedule(_make_state(machine_properties, circuit))
+    schedule2 = critical_path_schedule(_make_state(machine_properties, circuit))
+    np.testing.assert_array_equal(schedule1, schedule2)
+
+
+@pytest.mark.parametrize("scheduler", SCHEDULERS)
+def test_environment_state(
+    machine_properties: MachineProperties,
+    scheduler: Callable[[SchedulingState], NDArray[np.int_]],
+) -> None:
+    env = Scheduling(machine_properties)
+    env.reset(options={"circuit": [Gate("x", 0, 0), Gate("cnot", 0, 1)]})
+    schedule = scheduler(env.state)
+    assert env.state.is_done()
+    np.testing.assert_array_equal(schedule, env.state.circuit_info.schedule)
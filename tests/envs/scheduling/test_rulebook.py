@@ -6,7 +6,7 @@ import numpy as np
 import pytest
 from numpy.typing import ArrayLike
 
-from qgym.custom_types import Gate
+from qgym.custom_types import Circuit, Gate
 from qgym.envs.scheduling.rulebook import (
     CommutationRulebook,
     disjoint_qubits,
@@ -71,6 +71,24 @@ def test_make_blocking_matrix(
     blocking_matrix = default_rulebook.make_blocking_matrix(circuit)
     np.testing.assert_array_equal(blocking_matrix, expected_matrix)
 
+    columnar_circuit = Circuit.from_gates(circuit)
+    blocking_matrix = default_rulebook.make_blocking_matrix(columnar_circuit)
+    np.testing.assert_array_equal(blocking_matrix, expected_matrix)
+
+
+def test_make_blocking_matrix_custom_rule(
+    default_rulebook: CommutationRulebook,
+) -> None:
+    def cnot_commutation(gate1: Gate, gate2: Gate) -> bool:
+        return bool(gate1.name == gate2.name == "cnot" and gate1.q1 == gate2.q1)
+
+    default_rulebook.add_rule(cnot_commutation)
+    circuit = [Gate("cnot", 1, 2), Gate("cnot", 1, 3), Gate("x", 1, 1)]
+    expected_matrix = [[0, 0, 1], [0, 0, 1], [0, 0, 0]]
+    for circuit_type in (list, Circuit.from_gates):
+        blocking_matrix = default_rulebook.make_blocking_matrix(circuit_type(circuit))
+        np.testing.assert_array_equal(blocking_matrix, expected_matrix)
+
 
 def test_add_rule(default_rulebook: CommutationRulebook) -> None:
     def always_commute(gate_1: Gate, gate2: Gate) -> bool:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Collection
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 import numpy as np
 import pytest
@@ -9,9 +9,10 @@ from numpy.typing import NDArray
 from stable_baselines3.common.env_checker import check_env
 
 import qgym.spaces
-from qgym.custom_types import Gate
+from qgym.custom_types import Circuit, Gate
 from qgym.envs import Scheduling
 from qgym.envs.scheduling import SchedulingState
+from qgym.envs.scheduling.scheduling_dataclasses import CircuitInfo
 
 if TYPE_CHECKING:
     MP_DICT = dict[
@@ -142,6 +143,50 @@ def test_legal_actions(diamond_env: Scheduling) -> None:
     assert (obs["legal_actions"] == expected_legal_actions).all()
 
 
+def test_dependency_dag(diamond_env: Scheduling) -> None:
+    circuit = [Gate("cnot", 1, 2), Gate("x", 2, 2), Gate("cnot", 1, 3)]
+    diamond_env.reset(options={"circuit": circuit})
+    circuit_info = cast(SchedulingState, diamond_env._state).circuit_info
+
+    np.testing.assert_array_equal(circuit_info.n_blocking, [2, 0, 0])
+    np.testing.assert_array_equal(circuit_info.blocks[1], [0])
+    np.testing.assert_array_equal(circuit_info.blocks[2], [0])
+    assert set(np.flatnonzero(circuit_info.frontier)) == {1, 2}
+
+    diamond_env.step(np.array([2, 0]))
+    np.testing.assert_array_equal(circuit_info.n_blocking, [1, 0, 0])
+    assert set(np.flatnonzero(circuit_info.frontier)) == {1}
+
+    diamond_env.step(np.array([1, 0]))
+    np.testing.assert_array_equal(circuit_info.n_blocking, [0, 0, 0])
+    assert set(np.flatnonzero(circuit_info.frontier)) == {0}
+    assert not circuit_info.legal.any()
+
+
+def test_gate_info(diamond_env: Scheduling) -> None:
+    state = cast(SchedulingState, diamond_env._state)
+    encoder = state.utils.gate_encoder
+    x, y, z, measure = encoder.encode_gates(["x", "y", "z", "measure"])
+
+    assert state.gates.cycle_length[0] == 0
+    assert state.gates.cycle_length[measure] == 10
+    assert state.gates.cycle_length[x] == 2
+    assert set(np.flatnonzero(state.gates.not_in_same_cycle[x])) == {y, z}
+    assert np.flatnonzero(state.gates.same_start).tolist() == [measure]
+
+    circuit = [Gate("y", 1, 1), Gate("x", 0, 0)]
+    diamond_env.reset(options={"circuit": circuit})
+    diamond_env.step(np.array([1, 0]))
+    assert state.gates.exclude[y] == 2
+    assert state.gates.exclude[z] == 2
+    assert state.gates.exclude[x] == 0
+
+    diamond_env.step(np.array([0, 1]))
+    assert state.gates.exclude[y] == 1
+    diamond_env.step(np.array([0, 1]))
+    assert not state.gates.exclude.any()
+
+
 def test_validity(diamond_env: Scheduling) -> None:
     check_env(diamond_env, warn=True)  # todo: maybe switch this to the gym env checker
 
@@ -158,6 +203,35 @@ def test_full_cnot_circuit(diamond_env: Scheduling) -> None:
     assert (schedule == np.zeros(5)).all()
 
 
+def test_makespan(diamond_env: Scheduling) -> None:
+    circuit = [Gate("measure", 1, 1), Gate("y", 1, 1), Gate("cnot", 0, 2)]
+    diamond_env.reset(options={"circuit": circuit})
+    state = cast(SchedulingState, diamond_env._state)
+    np.testing.assert_array_equal(state.circuit_info.durations, [10, 2, 4])
+    assert state.makespan == 0
+
+    diamond_env.step(np.array([1, 0]))
+    assert state.makespan == 2
+
+    schedule = naive_schedule_algorithm(diamond_env, circuit)
+    assert state.makespan == max(schedule + state.circuit_info.durations) == 12
+
+
+def test_fresh_circuit_info(diamond_env: Scheduling) -> None:
+    info = cast(SchedulingState, diamond_env._state).circuit_info
+    fresh = CircuitInfo(
+        encoded=info.encoded,
+        names=info.names.copy(),
+        acts_on=info.acts_on.copy(),
+        legal=info.legal.copy(),
+        dependencies=info.dependencies.copy(),
+        schedule=info.schedule.copy(),
+        blocking_matrix=info.blocking_matrix.copy(),
+    )
+    assert fresh.durations.shape == (0,)
+    assert "durations" in repr(fresh)
+
+
 def test_same_start_machine_restriction(diamond_env: Scheduling) -> None:
     circuit = [Gate("measure", 1, 1), Gate("y", 1, 1), Gate("measure", 0, 0)]
     schedule = naive_schedule_algorithm(diamond_env, circuit=circuit)
@@ -170,6 +244,128 @@ def test_not_in_same_cycle_machine_restriction(diamond_env: Scheduling) -> None:
     assert (schedule == np.array([0, 2, 2, 4])).all()
 
 
+@pytest.mark.parametrize(
+    "circuit",
+    [
+        [Gate("measure", 1, 1), Gate("y", 1, 1), Gate("measure", 0, 0)],
+        [Gate("x", 0, 0), Gate("y", 1, 1), Gate("y", 3, 3), Gate("z", 2, 2)],
+        [Gate("cnot", 1, 2), Gate("x", 2, 2), Gate("cnot", 1, 3)],
+    ],
+)
+def test_auto_advance_cycle(diamond_mp_dict: MP_DICT, circuit: list[Gate]) -> None:
+    expected_schedule = naive_schedule_algorithm(Scheduling(diamond_mp_dict), circuit)
+
+    env = Scheduling(diamond_mp_dict, auto_advance_cycle=True)
+    obs, info = env.reset(options={"circuit": circuit})
+    assert info["Skipped cycles"] == 0
+
+    total_skipped = 0
+    for _ in range(len(circuit)):
+        assert obs["legal_actions"].any()
+        action = np.array([obs["legal_actions"].argmax(), 0])
+        obs, _, done, _, info = env.step(action)
+        total_skipped += info["Skipped cycles"]
+
+    assert done
+    state = cast(SchedulingState, env._state)
+    assert total_skipped == state.cycle
+    np.testing.assert_array_equal(state.circuit_info.schedule, expected_schedule)
+
+
+def test_circuit_cache(diamond_mp_dict: MP_DICT) -> None:
+    env = Scheduling(diamond_mp_dict, dependency_depth=2, circuit_cache_size=2)
+    state = cast(SchedulingState, env._state)
+    circuits = [
+        [Gate("cnot", 1, 2), Gate("x", 2, 2), Gate("cnot", 1, 3)],
+        [Gate("measure", 1, 1), Gate("y", 1, 1), Gate("measure", 0, 0)],
+        [Gate("x", 0, 0), Gate("y", 1, 1), Gate("y", 3, 3), Gate("z", 2, 2)],
+    ]
+
+    expected_schedules = []
+    for circuit in circuits:
+        expected_obs, _ = Scheduling(diamond_mp_dict, dependency_depth=2).reset(
+            options={"circuit": circuit}
+        )
+        obs, _ = env.reset(options={"circuit": circuit})
+        for key, value in expected_obs.items():
+            np.testing.assert_array_equal(obs[key], value)
+        expected_schedules.append(naive_schedule_algorithm(env, circuit).copy())
+    assert len(state.circuit_cache) == 2
+
+    # Cached circuits are not modified by scheduling
+    for circuit, expected_schedule in zip(circuits[::-1], expected_schedules[::-1]):
+        schedule = naive_schedule_algorithm(env, circuit)
+        np.testing.assert_array_equal(schedule, expected_schedule)
+    assert len(state.circuit_cache) == 2
+
+
+def test_columnar_circuit(diamond_mp_dict: MP_DICT) -> None:
+    env = Scheduling(diamond_mp_dict, dependency_depth=2, circuit_cache_size=2)
+    state = cast(SchedulingState, env._state)
+    circuit = [Gate("cnot", 1, 2), Gate("x", 2, 2), Gate("measure", 1, 1)]
+    columnar_circuit = Circuit.from_gates(circuit)
+
+    expected_obs, _ = Scheduling(diamond_mp_dict, dependency_depth=2).reset(
+        options={"circuit": circuit}
+    )
+    obs, _ = env.reset(options={"circuit": columnar_circuit})
+    for key, value in expected_obs.items():
+        np.testing.assert_array_equal(obs[key], value)
+    assert env.get_circuit("human") == circuit
+    assert env.get_circuit("human", columnar=True) == columnar_circuit
+    encoder = state.utils.gate_encoder
+    assert env.get_circuit("encoded", columnar=True) == Circuit(
+        encoder.encode_array(columnar_circuit.name), [1, 2, 1], [2, 2, 1]
+    )
+
+    # Both representations share a cache entry
+    env.reset(options={"circuit": circuit})
+    assert len(state.circuit_cache) == 1
+
+
+@pytest.mark.parametrize("mode", ["human", "encoded"])
+def test_get_circuit_is_a_copy(diamond_mp_dict: MP_DICT, mode: str) -> None:
+    env = Scheduling(diamond_mp_dict, dependency_depth=2, circuit_cache_size=2)
+    circuit = [Gate("cnot", 1, 2), Gate("x", 2, 2), Gate("measure", 1, 1)]
+    expected_obs, _ = env.reset(options={"circuit": circuit})
+    expected_circuit = env.get_circuit(mode, columnar=True)
+
+    columnar_circuit = env.get_circuit(mode, columnar=True)
+    columnar_circuit.name[:] = columnar_circuit.name[0]
+    columnar_circuit.q1[:] = 0
+    columnar_circuit.q2[:] = 0
+    assert env.get_circuit(mode, columnar=True) == expected_circuit
+
+    # The cached circuit is not modified either
+    obs, _ = env.reset(options={"circuit": circuit})
+    for key, value in expected_obs.items():
+        np.testing.assert_array_equal(obs[key], value)
+    assert env.get_circuit(mode, columnar=True) == expected_circuit
+
+
+def test_flatten_observation(diamond_mp_dict: MP_DICT) -> None:
+    env = Scheduling(diamond_mp_dict, max_gates=10, dependency_depth=2)
+    flat_env = Scheduling(
+        diamond_mp_dict, max_gates=10, dependency_depth=2, flatten_observation=True
+    )
+    check_env(flat_env, warn=True)
+    layout = flat_env.observation_layout
+    assert layout is not None
+    assert layout.offsets == {
+        "legal_actions": (0, 10),
+        "gate_names": (10, 20),
+        "acts_on": (20, 40),
+        "dependencies": (40, 60),
+    }
+
+    circuit = [Gate("cnot", 1, 2), Gate("x", 2, 2), Gate("measure", 1, 1)]
+    obs, _ = env.reset(options={"circuit": circuit})
+    flat_obs, _ = flat_env.reset(options={"circuit": circuit})
+    assert flat_obs in flat_env.observation_space
+    for key, value in layout.unflatten(flat_obs).items():
+        np.testing.assert_array_equal(value, obs[key])
+
+
 def test_parse_machine_properties() -> None:
     with pytest.raises(
         TypeError,
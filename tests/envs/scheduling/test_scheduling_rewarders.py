@@ -79,6 +79,31 @@ def test_basic_rewarder_rewards(
         assert reward == expected_reward[i]
 
 
+def test_basic_rewarder_skipped_cycles(basic_rewarder: BasicRewarder) -> None:
+    machine_properties = MachineProperties(2)
+    machine_properties.add_gates({"x": 1, "y": 1, "measure": 5, "cnot": 2})
+    state = SchedulingState(
+        machine_properties=machine_properties,
+        max_gates=10,
+        dependency_depth=1,
+        circuit_generator=NullCircuitGenerator(),
+        rulebook=CommutationRulebook(),
+        auto_advance_cycle=True,
+    )
+    state.reset(circuit=[Gate("x", 1, 1), Gate("measure", 1, 1)])
+
+    expected_rewards = [100 - 5, 100]
+    for expected_reward in expected_rewards:
+        action = np.array([np.flatnonzero(state.circuit_info.legal)[-1], 0])
+        old_state = deepcopy(state)
+        state.update_state(action)
+        reward = basic_rewarder.compute_reward(
+            old_state=old_state, action=action, new_state=state
+        )
+        assert reward == expected_reward
+    assert state.is_done()
+
+
 @pytest.fixture
 def episode_rewarder() -> EpisodeRewarder:
     return EpisodeRewarder(-float("inf"), -1)
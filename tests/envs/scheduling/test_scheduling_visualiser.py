@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import numpy as np
+import pygame
+import pytest
+
+from qgym.envs import Scheduling
+from qgym.envs.scheduling.scheduling_visualiser import SchedulingVisualiser
+
+
+def _run_episode(env: Scheduling, max_steps: int = 100) -> int:
+    obs, _ = env.reset(seed=0)
+    for step in range(max_steps):
+        action = np.array([obs["legal_actions"].argmax(), 0])
+        if not obs["legal_actions"].any():
+            action[1] = 1
+        obs, _, done, _, _ = env.step(action)
+        if done:
+            return step + 1
+    return max_steps
+
+
+def test_rgb_array_does_not_wait(
+    monkeypatch: pytest.MonkeyPatch, mp_dict: dict[str, Any]
+) -> None:
+    def fail(*_args: Any) -> None:
+        raise AssertionError("rendering should not wait")
+
+    monkeypatch.setattr(pygame.time, "delay", fail)
+    env = Scheduling(mp_dict, max_gates=20, render_mode="rgb_array")
+    _run_episode(env)
+    frame = env.render()
+    assert isinstance(frame, np.ndarray)
+    assert frame.shape == (800, 1500, 3)
+    env.close()
+
+
+def test_human_mode_does_not_block(
+    monkeypatch: pytest.MonkeyPatch, mp_dict: dict[str, Any]
+) -> None:
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    draw = SchedulingVisualiser._draw
+
+    def slow_draw(*args: Any) -> None:
+        time.sleep(0.02)
+        draw(*args)
+
+    monkeypatch.setattr(SchedulingVisualiser, "_draw", slow_draw)
+    env = Scheduling(mp_dict, max_gates=20, render_mode="human")
+    visualiser = env._visualiser
+    assert isinstance(visualiser, SchedulingVisualiser)
+
+    start = time.perf_counter()
+    n_steps = _run_episode(env, max_steps=100)
+    assert time.perf_counter() - start < n_steps * 0.02
+    assert visualiser._render_thread is not None
+
+    env.close()
+    assert visualiser._render_thread is None
+    assert 1 <= visualiser.frames_drawn <= n_steps + 1
+
+
+def test_human_mode_shows_last_frame(
+    monkeypatch: pytest.MonkeyPatch, mp_dict: dict[str, Any]
+) -> None:
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    env = Scheduling(mp_dict, max_gates=20, render_mode="human")
+    visualiser = env._visualiser
+    assert isinstance(visualiser, SchedulingVisualiser)
+    shown = []
+    flip = pygame.display.flip
+
+    def record_flip() -> None:
+        shown.append(pygame.surfarray.array3d(visualiser.screen))
+        flip()
+
+    monkeypatch.setattr(pygame.display, "flip", record_flip)
+
+    def expected_frame() -> np.ndarray:
+        surface = visualiser.screen.copy()
+        with visualiser._draw_lock:
+            visualiser._draw(visualiser._snapshot(env._state), surface)
+        return pygame.surfarray.array3d(surface)
+
+    # The terminal state of an episode is shown before the next episode starts
+    _run_episode(env)
+    expected = expected_frame()
+    env.reset()
+    assert any((frame == expected).all() for frame in shown)
+
+    # The terminal state of the run is shown on close
+    _run_episode(env)
+    expected = expected_frame()
+    env.close()
+    np.testing.assert_array_equal(shown[-1], expected)
+
+
+def test_snapshot_is_independent(mp_dict: dict[str, Any]) -> None:
+    env = Scheduling(mp_dict, max_gates=20, render_mode="rgb_array")
+    visualiser = env._visualiser
+    assert isinstance(visualiser, SchedulingVisualiser)
+    _run_episode(env, max_steps=5)
+    expected = env.render()
+
+    snapshot = visualiser._snapshot(env._state)
+    _run_episode(env, max_steps=10)
+    visualiser._draw(snapshot, visualiser.screen)
+    np.testing.assert_array_equal(visualiser._screen_to_array(), expected)
+    env.close()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from typing import Any
+
+import networkx as nx
+import numpy as np
+import pytest
+from stable_baselines3.common.env_checker import check_env
+
+from qgym.envs import EnvConfig, InitialMapping, Routing, Scheduling
+from qgym.templates import Environment
+
+
+@pytest.fixture(name="kwargs")
+def kwargs_fixture(
+    request: pytest.FixtureRequest, mp_dict: dict[str, Any]
+) -> dict[str, Any]:
+    # The machine properties placeholder is filled in with the shared mp_dict fixture
+    kwargs = dict(request.param)
+    if "machine_properties" in kwargs:
+        kwargs["machine_properties"] = mp_dict
+    return kwargs
+
+
+@pytest.mark.parametrize(
+    "env_type, kwargs",
+    [
+        (Routing, {"connection_graph": (2, 2)}),
+        (Routing, {"connection_graph": (2, 2), "observe_connection_graph": True}),
+        (InitialMapping, {"connection_graph": (2, 2)}),
+        (Scheduling, {"machine_properties": None, "max_gates": 10}),
+    ],
+    indirect=["kwargs"],
+)
+class TestMakeEnvs:
+    def test_validity(
+        self, env_type: type[Environment[Any, Any]], kwargs: dict[str, Any]
+    ) -> None:
+        config = EnvConfig(env_type, **kwargs)
+        env = config.make_env(seed=0)
+        assert isinstance(env, env_type)
+        check_env(env, warn=True)
+
+    def test_shared_static_objects(
+        self, env_type: type[Environment[Any, Any]], kwargs: dict[str, Any]
+    ) -> None:
+        env1, env2 = EnvConfig(env_type, **kwargs).make_envs(2, seed=0)
+        assert env1._state is not env2._state
+        assert env1.action_space is not env2.action_space
+        static_objects = env1._static_objects()
+        assert static_objects
+        for obj1, obj2 in zip(static_objects, env2._static_objects()):
+            assert obj1 is obj2
+
+    def test_independent_rng(
+        self, env_type: type[Environment[Any, Any]], kwargs: dict[str, Any]
+    ) -> None:
+        config = EnvConfig(env_type, **kwargs)
+        envs = config.make_envs(3, seed=1)
+        samples = [[env.action_space.sample() for _ in range(20)] for env in envs]
+        assert not np.array_equal(samples[0], samples[1])
+        assert not np.array_equal(samples[1], samples[2])
+
+        envs = config.make_envs(3, seed=1)
+        samples2 = [[env.action_space.sample() for _ in range(20)] for env in envs]
+        np.testing.assert_array_equal(samples, samples2)
+
+    def test_step_independent(
+        self, env_type: type[Environment[Any, Any]], kwargs: dict[str, Any]
+    ) -> None:
+        env1, env2 = EnvConfig(env_type, **kwargs).make_envs(2, seed=0)
+        env1.reset(seed=0)
+        env2.reset(seed=0)
+        steps_done = env2._state.steps_done
+        env1.step(env1.action_space.sample())
+        assert env1._state.steps_done == steps_done + 1
+        assert env2._state.steps_done == steps_done
+
+
+def test_equality(mp_dict: dict[str, Any]) -> None:
+    config = EnvConfig(Routing, connection_graph=(2, 2), max_observation_reach=3)
+    assert config == EnvConfig(
+        Routing, max_observation_reach=3, connection_graph=(2, 2)
+    )
+    assert config != EnvConfig(
+        Routing, connection_graph=(2, 2), max_observation_reach=4
+    )
+    assert config != EnvConfig(InitialMapping, connection_graph=(2, 2))
+    assert len({config, EnvConfig(Routing, connection_graph=(2, 2))}) == 2
+
+    config1 = EnvConfig(InitialMapping, connection_graph=nx.cycle_graph(4))
+    config2 = EnvConfig(InitialMapping, connection_graph=nx.cycle_graph(4))
+    assert config1 == config2
+    assert hash(config1) == hash(config2)
+
+    adjacency_matrix = np.array([[0, 1], [1, 0]])
+    config1 = EnvConfig(InitialMapping, connection_graph=adjacency_matrix)
+    config2 = EnvConfig(InitialMapping, connection_graph=adjacency_matrix.copy())
+    assert config1 == config2
+    assert hash(config1) == hash(config2)
+
+    config1 = EnvConfig(Scheduling, machine_properties=mp_dict)
+    config2 = EnvConfig(Scheduling, machine_properties=dict(mp_dict))
+    assert config1 == config2
+    assert hash(config1) == hash(config2)
+
+
+def test_frozen() -> None:
+    config = EnvConfig(Routing, connection_graph=(2, 2))
+    with pytest.raises(AttributeError):
+        config.env_type = InitialMapping  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        config.kwargs["connection_graph"] = (3, 3)  # type: ignore[index]
+
+
+def test_render_mode() -> None:
+    with pytest.raises(ValueError):
+        EnvConfig(Routing, connection_graph=(2, 2), render_mode="rgb_array")
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        EnvConfig(Routing, connection_graph=(2, 2), max_observation_reach=0)
@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
+from pathlib import Path
 
 import pytest
 
-from qgym.custom_types import Gate
-from qgym.envs.scheduling import MachineProperties
+from qgym.custom_types import Circuit, Gate
+from qgym.envs.scheduling import MachineProperties, Scheduling
 from qgym.generators.circuit import (
     BasicCircuitGenerator,
     CircuitGenerator,
+    CorpusCircuitGenerator,
     NullCircuitGenerator,
     WorkshopCircuitGenerator,
+    write_circuit_corpus,
 )
 
 
@@ -122,6 +125,27 @@ class TestBasicCircuitGenerator:
             else:
                 assert gate.q1 == gate.q2
 
+    def test_generate_batch(self, simple_generator: BasicCircuitGenerator) -> None:
+        circuits = simple_generator.generate_batch(10)
+        assert len(circuits) == 10
+        for circuit in circuits:
+            self._check_circuit(
+                circuit, simple_generator.n_qubits, simple_generator.max_gates
+            )
+
+    def test_generate_batch_columnar(
+        self, simple_generator: BasicCircuitGenerator
+    ) -> None:
+        circuits = simple_generator.generate_batch(10, columnar=True)
+        assert len(circuits) == 10
+        for circuit in circuits:
+            assert isinstance(circuit, Circuit)
+            self._check_circuit(
+                circuit.to_gates(),
+                simple_generator.n_qubits,
+                simple_generator.max_gates,
+            )
+
     def test_seed(self) -> None:
         generator1 = BasicCircuitGenerator(seed=1)
         generator2 = BasicCircuitGenerator(seed=1)
@@ -187,6 +211,15 @@ class TestWorkshopCircuitGenerator:
             if i > 100:
                 break
 
+    def test_generate_batch(self, simple_generator: WorkshopCircuitGenerator) -> None:
+        assert simple_generator.generate_batch(0) == []
+        circuits = simple_generator.generate_batch(10)
+        assert len(circuits) == 10
+        for circuit in circuits:
+            self._check_circuit(
+                circuit, simple_generator.n_qubits, simple_generator.max_gates
+            )
+
     def _check_circuit(
         self, circuit: list[Gate], n_qubits: int, max_gates: int
     ) -> None:
@@ -220,3 +253,85 @@ class TestWorkshopCircuitGenerator:
 
             assert curcuit1 == curcuit2
             assert curcuit1 != curcuit3
+
+
+class TestCorpusCircuitGenerator:
+
+    @pytest.fixture(name="circuits")
+    def circuits_fixture(self) -> list[list[Gate]]:
+        generator = BasicCircuitGenerator(seed=42)
+        generator.set_state_attributes(
+            machine_properties=MachineProperties(5), max_gates=50
+        )
+        return generator.generate_batch(10) + [[]]
+
+    @pytest.fixture(name="corpus_path")
+    def corpus_path_fixture(self, tmp_path: Path, circuits: list[list[Gate]]) -> Path:
+        write_circuit_corpus(tmp_path, circuits)
+        return tmp_path
+
+    def test_inheritance(self, corpus_path: Path) -> None:
+        generator = CorpusCircuitGenerator(corpus_path)
+        assert isinstance(generator, CircuitGenerator)
+        assert isinstance(generator, Iterator)
+        assert not generator.finite
+
+    def test_round_trip(self, corpus_path: Path, circuits: list[list[Gate]]) -> None:
+        generator = CorpusCircuitGenerator(corpus_path, finite=True)
+        assert generator.finite
+        assert list(generator) == circuits
+
+    def test_columnar(self, tmp_path: Path, circuits: list[list[Gate]]) -> None:
+        write_circuit_corpus(tmp_path, map(Circuit.from_gates, circuits))
+        generator = CorpusCircuitGenerator(tmp_path, finite=True, columnar=True)
+        served = list(generator)
+        assert all(isinstance(circuit, Circuit) for circuit in served)
+        assert [circuit.to_gates() for circuit in served] == circuits
+
+    def test_shuffle_and_shard(
+        self, corpus_path: Path, circuits: list[list[Gate]]
+    ) -> None:
+        served = []
+        for worker_id in range(2):
+            generator = CorpusCircuitGenerator(
+                corpus_path,
+                shuffle=True,
+                finite=True,
+                seed=1,
+                worker_id=worker_id,
+                n_workers=2,
+            )
+            served.extend(generator)
+        assert len(served) == len(circuits)
+        assert all(circuit in circuits for circuit in served)
+
+    def test_set_state_attributes(self, corpus_path: Path) -> None:
+        generator = CorpusCircuitGenerator(corpus_path)
+        generator.set_state_attributes(machine_properties=MachineProperties(5))
+        with pytest.raises(ValueError):
+            generator.set_state_attributes(machine_properties=MachineProperties(4))
+        with pytest.raises(AttributeError):
+            generator.set_state_attributes()
+
+    def test_set_state_attributes_lazy(self, corpus_path: Path) -> None:
+        generator = CorpusCircuitGenerator(corpus_path)
+        # The circuits are not read to check the qubits
+        del generator.corpus.arrays["rows"]
+        generator.set_state_attributes(machine_properties=MachineProperties(5))
+
+    def test_negative_qubits(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            write_circuit_corpus(tmp_path, [[Gate("x", -1, -1)]])
+
+    def test_scheduling(self, corpus_path: Path) -> None:
+        machine_properties = MachineProperties(5)
+        machine_properties.add_gates(
+            {"prep": 1, "x": 1, "y": 1, "z": 1, "cnot": 2, "measure": 3}
+        )
+        env = Scheduling(
+            machine_properties,
+            max_gates=50,
+            circuit_generator=CorpusCircuitGenerator(corpus_path, shuffle=True),
+        )
+        for _ in range(3):
+            env.reset()
@@ -0,0 +1,110 @@
+"""This module contains tests for the corpus module."""
+
+from __future__ import annotations
+
+import pickle
+from copy import deepcopy
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from qgym.generators.corpus import (
+    Corpus,
+    CorpusSampler,
+    concatenate_records,
+    write_corpus,
+)
+
+
+@pytest.fixture(name="corpus_path")
+def corpus_path_fixture(tmp_path: Path) -> Path:
+    records = [np.arange(i * 2).reshape(-1, 2) for i in range(5)]
+    rows, offsets = concatenate_records(records, 2)
+    write_corpus(tmp_path, rows=rows, offsets=offsets)
+    return tmp_path
+
+
+def test_concatenate_records() -> None:
+    rows, offsets = concatenate_records([[(1, 2)], [], [(3, 4), (5, 6)]], 2)
+    np.testing.assert_array_equal(rows, [[1, 2], [3, 4], [5, 6]])
+    np.testing.assert_array_equal(offsets, [0, 1, 1, 3])
+
+    rows, offsets = concatenate_records([], 3)
+    assert rows.shape == (0, 3)
+    np.testing.assert_array_equal(offsets, [0])
+
+
+def test_write_corpus_without_offsets(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        write_corpus(tmp_path, rows=np.zeros((2, 2)))
+
+
+class TestCorpus:
+
+    def test_record(self, corpus_path: Path) -> None:
+        corpus = Corpus(corpus_path)
+        assert len(corpus) == 5
+        for i in range(5):
+            record = corpus.record(i)
+            np.testing.assert_array_equal(record, np.arange(i * 2).reshape(-1, 2))
+            assert not record.flags.writeable
+
+    def test_no_corpus(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            Corpus(tmp_path)
+
+    def test_deepcopy(self, corpus_path: Path) -> None:
+        corpus = Corpus(corpus_path)
+        assert deepcopy(corpus) is corpus
+
+    def test_pickle(self, corpus_path: Path) -> None:
+        corpus = Corpus(corpus_path)
+        data = pickle.dumps(corpus)
+        assert len(data) < 1000
+        unpickled_corpus = pickle.loads(data)
+        np.testing.assert_array_equal(unpickled_corpus.record(4), corpus.record(4))
+
+
+class TestCorpusSampler:
+
+    def test_sequential(self) -> None:
+        sampler = CorpusSampler(3)
+        assert [next(sampler) for _ in range(7)] == [0, 1, 2, 0, 1, 2, 0]
+        assert sampler.epoch == 2
+
+    def test_finite(self) -> None:
+        sampler = CorpusSampler(3, finite=True)
+        assert list(sampler) == [0, 1, 2]
+
+    def test_shuffle(self) -> None:
+        sampler = CorpusSampler(100, shuffle=True, seed=42)
+        epoch1 = [next(sampler) for _ in range(100)]
+        epoch2 = [next(sampler) for _ in range(100)]
+        assert sorted(epoch1) == sorted(epoch2) == list(range(100))
+        assert epoch1 != epoch2
+        assert epoch1 != list(range(100))
+
+    def test_sharding(self) -> None:
+        shards = [
+            list(CorpusSampler(10, finite=True, worker_id=i, n_workers=3))
+            for i in range(3)
+        ]
+        assert sorted(sum(shards, [])) == list(range(10))
+        assert shards[1] == [1, 4, 7]
+
+    @pytest.mark.parametrize(
+        "kwargs,error_type",
+        [
+            ({"worker_id": 3, "n_workers": 3}, ValueError),
+            ({"n_workers": 0}, ValueError),
+            ({"shuffle": 1}, TypeError),
+        ],
+    )
+    def test_errors(self, kwargs: dict[str, int], error_type: type[Exception]) -> None:
+        with pytest.raises(error_type):
+            CorpusSampler(10, **kwargs)  # type: ignore[arg-type]
+
+    def test_empty_shard(self) -> None:
+        with pytest.raises(ValueError):
+            CorpusSampler(2, worker_id=2, n_workers=3)
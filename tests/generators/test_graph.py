@@ -1,14 +1,19 @@
 """This module contains tests for the graph generation module."""
 
 from collections.abc import Iterator
+from pathlib import Path
 
 import networkx as nx
+import numpy as np
 import pytest
 
+from qgym.envs import InitialMapping
 from qgym.generators.graph import (
     BasicGraphGenerator,
+    CorpusGraphGenerator,
     GraphGenerator,
     NullGraphGenerator,
+    write_graph_corpus,
 )
 
 
@@ -41,6 +46,10 @@ class TestNullGraphGenerator:
         assert isinstance(graph, nx.Graph)
         assert len(graph) == 0
 
+    def test_generate_edges(self, generator: NullGraphGenerator) -> None:
+        assert generator.generate_edges().shape == (0, 2)
+        assert generator.max_edges() == 0
+
     def test_iter(self, generator: NullGraphGenerator) -> None:
         for i, graph in enumerate(generator):
             assert isinstance(graph, nx.Graph)
@@ -100,6 +109,22 @@ class TestBasicGraphGenerator:
         assert len(graph) == 5
         assert nx.is_isomorphic(graph, nx.complete_graph(5))
 
+    def test_generate_edges(self, simple_generator: BasicGraphGenerator) -> None:
+        for _ in range(10):
+            edges = simple_generator.generate_edges()
+            assert edges.ndim == 2
+            assert edges.shape[1] == 2
+            assert (edges[:, 0] < edges[:, 1]).all()
+            assert (edges < 5).all()
+            assert len(np.unique(edges, axis=0)) == len(edges)
+
+    @pytest.mark.parametrize("probability,n_edges", [(0, 0), (1, 10)])
+    def test_generate_edges_probability(self, probability: float, n_edges: int) -> None:
+        generator = BasicGraphGenerator(probability)
+        generator.set_state_attributes(connection_graph=nx.empty_graph(5))
+        assert generator.generate_edges().shape == (n_edges, 2)
+        assert generator.max_edges() == n_edges
+
     def test_seed(self) -> None:
         connection_graph = nx.empty_graph(10)
 
@@ -118,3 +143,68 @@ class TestBasicGraphGenerator:
 
             assert nx.is_isomorphic(graph1, graph2)
             assert not nx.is_isomorphic(graph1, graph3)
+
+
+class TestCorpusGraphGenerator:
+
+    @pytest.fixture(name="graphs")
+    def graphs_fixture(self) -> list[nx.Graph]:
+        weighted_graph = nx.Graph()
+        weighted_graph.add_nodes_from(range(4))
+        weighted_graph.add_weighted_edges_from([(0, 3, 0.5), (1, 2, 2.0), (2, 2, 1.0)])
+        return [nx.path_graph(5), nx.empty_graph(3), weighted_graph]
+
+    @pytest.fixture(name="corpus_path")
+    def corpus_path_fixture(self, tmp_path: Path, graphs: list[nx.Graph]) -> Path:
+        write_graph_corpus(tmp_path, graphs)
+        return tmp_path
+
+    def test_inheritance(self, corpus_path: Path) -> None:
+        generator = CorpusGraphGenerator(corpus_path)
+        assert isinstance(generator, GraphGenerator)
+        assert isinstance(generator, Iterator)
+        assert not generator.finite
+
+    def test_next(self, corpus_path: Path, graphs: list[nx.Graph]) -> None:
+        generator = CorpusGraphGenerator(corpus_path, finite=True)
+        served = list(generator)
+        assert len(served) == len(graphs)
+        for graph, expected_graph in zip(served, graphs):
+            assert nx.utils.nodes_equal(graph.nodes, expected_graph.nodes)
+            assert nx.utils.edges_equal(graph.edges, expected_graph.edges)
+        assert served[2].edges[0, 3]["weight"] == 0.5
+
+    def test_generate_csr(self, corpus_path: Path) -> None:
+        generator = CorpusGraphGenerator(corpus_path)
+        indptr, indices, weights = generator.generate_csr()
+        np.testing.assert_array_equal(indptr, [0, 1, 3, 5, 7, 8])
+        np.testing.assert_array_equal(indices, [1, 0, 2, 1, 3, 2, 4, 3])
+        np.testing.assert_array_equal(weights, np.ones(8))
+        assert not indices.flags.writeable
+
+    def test_generate_edges(self, corpus_path: Path) -> None:
+        generator = CorpusGraphGenerator(corpus_path)
+        np.testing.assert_array_equal(
+            generator.generate_edges(), [[0, 1], [1, 2], [2, 3], [3, 4]]
+        )
+        assert generator.generate_edges().shape == (0, 2)
+        np.testing.assert_array_equal(
+            generator.generate_edges(), [[0, 3], [1, 2], [2, 2]]
+        )
+
+    def test_set_state_attributes(self, corpus_path: Path) -> None:
+        generator = CorpusGraphGenerator(corpus_path)
+        generator.set_state_attributes(connection_graph=nx.empty_graph(5))
+        with pytest.raises(ValueError):
+            generator.set_state_attributes(connection_graph=nx.empty_graph(4))
+
+    def test_initial_mapping(self, corpus_path: Path) -> None:
+        generator = CorpusGraphGenerator(corpus_path, shuffle=True, seed=42)
+        env = InitialMapping((2, 3), generator)
+        for _ in range(5):
+            env.reset()
+            assert env._state.graphs["interaction"]["graph"] is None
+            while not env._state.is_done():
+                physical_mask, logical_mask = env.action_masks().reshape(2, -1)
+                action = [np.argmax(physical_mask), np.argmax(logical_mask)]
+                env.step(np.array(action))
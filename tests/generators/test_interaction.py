@@ -1,15 +1,19 @@
 """This module contains tests for the iteration generation module."""
 
 from collections.abc import Iterator
+from pathlib import Path
 
 import networkx as nx
 import numpy as np
 import pytest
 
+from qgym.envs import Routing
 from qgym.generators.interaction import (
     BasicInteractionGenerator,
+    CorpusInteractionGenerator,
     InteractionGenerator,
     NullInteractionGenerator,
+    write_interaction_corpus,
 )
 
 
@@ -109,3 +113,54 @@ class TestBasicGraphGenerator:
             np.testing.assert_array_equal(circuit1, circuit2)
             if len(circuit1) == len(circuit3):
                 assert np.any(circuit1 != circuit3)
+
+
+class TestCorpusInteractionGenerator:
+
+    @pytest.fixture(name="corpus_path")
+    def corpus_path_fixture(self, tmp_path: Path) -> Path:
+        write_interaction_corpus(tmp_path, [[(0, 1), (1, 2)], [(2, 3)], []])
+        return tmp_path
+
+    def test_inheritance(self, corpus_path: Path) -> None:
+        generator = CorpusInteractionGenerator(corpus_path)
+        assert isinstance(generator, InteractionGenerator)
+        assert isinstance(generator, Iterator)
+        assert not generator.finite
+
+    def test_next(self, corpus_path: Path) -> None:
+        generator = CorpusInteractionGenerator(corpus_path, finite=True)
+        circuits = list(generator)
+        assert len(circuits) == 3
+        np.testing.assert_array_equal(circuits[0], [[0, 1], [1, 2]])
+        np.testing.assert_array_equal(circuits[1], [[2, 3]])
+        assert circuits[2].shape == (0, 2)
+        assert not circuits[0].flags.writeable
+
+    def test_set_state_attributes(self, corpus_path: Path) -> None:
+        generator = CorpusInteractionGenerator(corpus_path)
+        generator.set_state_attributes(connection_graph=nx.cycle_graph(4))
+        with pytest.raises(ValueError):
+            generator.set_state_attributes(connection_graph=nx.cycle_graph(3))
+
+    def test_set_state_attributes_lazy(self, corpus_path: Path) -> None:
+        generator = CorpusInteractionGenerator(corpus_path)
+        # The interaction circuits are not read to check the qubits
+        del generator.corpus.arrays["rows"]
+        generator.set_state_attributes(connection_graph=nx.cycle_graph(4))
+
+    def test_negative_qubits(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            write_interaction_corpus(tmp_path, [[(0, -1)]])
+
+    def test_routing(self, corpus_path: Path) -> None:
+        env = Routing(
+            (2, 2), interaction_generator=CorpusInteractionGenerator(corpus_path)
+        )
+        for _ in range(3):
+            env.reset()
+            done = env._state.is_done()
+            for _ in range(20):
+                if done:
+                    break
+                _, _, done, _, _ = env.step(env.action_space.sample())
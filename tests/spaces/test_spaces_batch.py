@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from typing import Any
+
+import gymnasium.spaces
+import numpy as np
+import pytest
+from gymnasium import Space
+
+from qgym.spaces import Box, Dict, Discrete, MultiBinary, MultiDiscrete
+
+INF = float("inf")
+
+
+@pytest.mark.parametrize(
+    "space",
+    [
+        Box(0, 10, (3, 4)),
+        Box(-5, 20, (2, 3), dtype=np.int_),
+        Box([-INF, 0, -INF, 0], [INF, INF, 1, 1]),
+        Discrete(10, start=-3),
+        MultiDiscrete([[2, 3], [4, 5]]),
+        MultiBinary((2, 5)),
+    ],
+)
+@pytest.mark.parametrize("n", [0, 1, 100])
+def test_sample_batch(space: Space[Any], n: int) -> None:
+    space.seed(0)
+    samples = space.sample(n=n)  # type: ignore[call-arg]
+    assert samples.shape == (n,) + space.shape
+    assert samples.dtype == np.asarray(space.sample()).dtype
+    assert all(sample in space for sample in samples)
+    assert space.contains_batch(samples).all()  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize(
+    "space",
+    [Box(0, 10, (3, 4)), Discrete(10), MultiDiscrete([2, 3]), MultiBinary(5)],
+)
+def test_sample_batch_seed(space: Space[Any]) -> None:
+    space.seed(0)
+    samples1 = space.sample(n=10)  # type: ignore[call-arg]
+    space.seed(0)
+    samples2 = space.sample(n=10)  # type: ignore[call-arg]
+    np.testing.assert_array_equal(samples1, samples2)
+
+
+def test_sample_batch_mask() -> None:
+    discrete = Discrete(5, rng=np.random.default_rng(0))
+    mask = np.array([0, 1, 0, 1, 0], dtype=np.int8)
+    assert set(discrete.sample(mask, n=100)) == {1, 3}
+    np.testing.assert_array_equal(
+        discrete.sample(np.zeros(5, dtype=np.int8), n=3), [0, 0, 0]
+    )
+
+    multi_binary = MultiBinary(3, rng=np.random.default_rng(0))
+    samples = multi_binary.sample(np.array([0, 1, 2], dtype=np.int8), n=100)
+    assert (samples[:, 0] == 0).all()
+    assert (samples[:, 1] == 1).all()
+    assert set(samples[:, 2]) == {0, 1}
+
+    multi_discrete = MultiDiscrete([2, 3], rng=np.random.default_rng(0))
+    mask_tuple = (np.array([0, 1], dtype=np.int8), np.array([1, 0, 0], dtype=np.int8))
+    samples = multi_discrete.sample(mask_tuple, n=10)
+    np.testing.assert_array_equal(samples, np.tile([1, 0], (10, 1)))
+
+
+@pytest.mark.parametrize(
+    "space, batch, expected",
+    [
+        (Box(0, 1, (2,)), [[0, 0.5], [1, 2], [-1, 0]], [True, False, False]),
+        (Box(0, 1, (2,), dtype=np.int_), [[0.0, 1.0]], [False]),
+        (Box(0, 1, (2,)), np.zeros((2, 3)), [False, False]),
+        (Discrete(3, start=1), [0, 1, 3, 4], [False, True, True, False]),
+        (Discrete(3), [0.0, 1.0], [False, False]),
+        (MultiDiscrete([2, 3]), [[1, 2], [2, 0], [0, -1]], [True, False, False]),
+        (MultiBinary(2), [[0, 1], [1, 2]], [True, False]),
+        (MultiBinary(2), np.zeros((2, 3)), [False, False]),
+    ],
+)
+def test_contains_batch(space: Space[Any], batch: Any, expected: list[bool]) -> None:
+    contains = space.contains_batch(batch)  # type: ignore[attr-defined]
+    np.testing.assert_array_equal(contains, expected)
+    np.testing.assert_array_equal(contains, [x in space for x in np.asarray(batch)])
+
+
+def test_contains_batch_no_batch_dimension() -> None:
+    with pytest.raises(ValueError):
+        Box(0, 1, ()).contains_batch(0.5)
+    with pytest.raises(ValueError):
+        Discrete(3).contains_batch(1)
+
+
+class TestDict:
+    @pytest.fixture(name="space")
+    def space_fixture(self) -> Dict:
+        return Dict(
+            box=Box(0, 10, (2, 3)),
+            discrete=Discrete(4),
+            multi_binary=MultiBinary(5),
+            rng=np.random.default_rng(0),
+        )
+
+    def test_sample(self, space: Dict) -> None:
+        samples = space.sample(n=20)
+        assert samples.keys() == space.spaces.keys()
+        assert samples["box"].shape == (20, 2, 3)
+        assert samples["discrete"].shape == (20,)
+        assert samples["multi_binary"].shape == (20, 5)
+        assert space.contains_batch(samples).all()
+
+    def test_sample_mask(self, space: Dict) -> None:
+        mask = {
+            "box": None,
+            "discrete": np.array([0, 0, 1, 0], dtype=np.int8),
+            "multi_binary": None,
+        }
+        samples = space.sample(mask, n=10)
+        assert (samples["discrete"] == 2).all()
+
+    def test_contains_batch(self, space: Dict) -> None:
+        samples = space.sample(n=3)
+        samples["discrete"][1] = 4
+        np.testing.assert_array_equal(space.contains_batch(samples), [1, 0, 1])
+
+        del samples["box"]
+        assert not space.contains_batch(samples).any()
+
+        samples["box"] = np.zeros((2, 2, 3))
+        with pytest.raises(ValueError):
+            space.contains_batch(samples)
+
+    @pytest.mark.parametrize("nested_type", [Dict, gymnasium.spaces.Dict])
+    def test_contains_batch_nested(
+        self, nested_type: type[gymnasium.spaces.Dict]
+    ) -> None:
+        nested = nested_type({"a": Discrete(3), "b": MultiBinary(2)})
+        space = Dict(inner=nested, outer=Discrete(2))
+        # The nested mapping has 2 keys, which differs from the batch size
+        batch = {
+            "inner": {"a": np.array([0, 1, 3]), "b": np.zeros((3, 2), dtype=np.int8)},
+            "outer": np.array([0, 1, 1]),
+        }
+        np.testing.assert_array_equal(space.contains_batch(batch), [1, 1, 0])
+
+        batch["inner"]["a"] = np.array([0, 1])
+        with pytest.raises(ValueError):
+            space.contains_batch(batch)
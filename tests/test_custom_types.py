@@ -0,0 +1,63 @@
+"""This module contains tests for the custom types."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from qgym.custom_types import Circuit, Gate
+
+
+@pytest.fixture(name="gates")
+def gates_fixture() -> list[Gate]:
+    return [Gate("prep", 0, 0), Gate("cnot", 0, 1), Gate("measure", 1, 1)]
+
+
+class TestCircuit:
+    def test_from_gates(self, gates: list[Gate]) -> None:
+        circuit = Circuit.from_gates(gates, metadata={"source": "test"})
+        np.testing.assert_array_equal(circuit.name, ["prep", "cnot", "measure"])
+        np.testing.assert_array_equal(circuit.q1, [0, 0, 1])
+        np.testing.assert_array_equal(circuit.q2, [0, 1, 1])
+        assert circuit.metadata == {"source": "test"}
+        assert circuit.to_gates() == gates
+
+    def test_empty(self) -> None:
+        circuit = Circuit.from_gates([])
+        assert len(circuit) == 0
+        assert circuit.to_gates() == []
+
+    def test_sequence_interface(self, gates: list[Gate]) -> None:
+        circuit = Circuit.from_gates(gates)
+        assert len(circuit) == 3
+        assert list(circuit) == gates
+        assert circuit[1] == Gate("cnot", 0, 1)
+        assert isinstance(circuit[1].q1, int)
+        assert circuit[1:].to_gates() == gates[1:]
+
+    def test_eq_and_hash(self, gates: list[Gate]) -> None:
+        circuit = Circuit.from_gates(gates)
+        wide_names = Circuit(
+            np.array(["prep", "cnot", "measure"], dtype="<U16"), [0, 0, 1], [0, 1, 1]
+        )
+        assert circuit == wide_names
+        assert hash(circuit) == hash(wide_names)
+        assert circuit != Circuit.from_gates(gates[:2])
+        assert circuit != Circuit([1, 2, 3], [0, 0, 1], [0, 1, 1])
+
+    def test_copy(self, gates: list[Gate]) -> None:
+        circuit = Circuit.from_gates(gates, metadata={"tags": ["test"]})
+        circuit_copy = circuit.copy()
+        assert circuit_copy == circuit
+        circuit_copy.q1[0] = 1
+        circuit_copy.metadata["tags"].append("copy")
+        assert circuit.to_gates() == gates
+        assert circuit.metadata == {"tags": ["test"]}
+
+    @pytest.mark.parametrize(
+        "name, q1, q2",
+        [(["x", "y"], [0], [0]), ([["x"]], [[0]], [[0]])],
+    )
+    def test_invalid(self, name: list[str], q1: list[int], q2: list[int]) -> None:
+        with pytest.raises(ValueError):
+            Circuit(name, q1, q2)
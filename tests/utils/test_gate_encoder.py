@@ -1,8 +1,9 @@
 from typing import Iterable
 
+import numpy as np
 import pytest
 
-from qgym.custom_types import Gate
+from qgym.custom_types import Circuit, Gate
 from qgym.utils import GateEncoder
 
 
@@ -49,6 +50,10 @@ def test_duplicate_gates_warning(empty_encoder: GateEncoder) -> None:
         ("x", 1),
         ({"cnot": 1, "z": 2}, {4: 1, 3: 2}),
         ([Gate("y", 1, 1), Gate("h", 1, 2)], [Gate(2, 1, 1), Gate(5, 1, 2)]),
+        (
+            Circuit(["y", "h", "y"], [1, 1, 0], [1, 2, 0]),
+            Circuit([2, 5, 2], [1, 1, 0], [1, 2, 0]),
+        ),
         (["x", "cnot", "y"], [1, 4, 2]),
     ],
 )
@@ -62,6 +67,10 @@ def test_encode_gates(trained_encoder: GateEncoder, gates, encoded_gates) -> Non
         ("x", 1),
         ({"cnot": 1, "z": 2}, {4: 1, 3: 2}),
         ([Gate("y", 1, 1), Gate("h", 1, 2)], [Gate(2, 1, 1), Gate(5, 1, 2)]),
+        (
+            Circuit(["y", "h", "y"], [1, 1, 0], [1, 2, 0]),
+            Circuit([2, 5, 2], [1, 1, 0], [1, 2, 0]),
+        ),
         (["x", "cnot", "y"], [1, 4, 2]),
     ],
 )
@@ -73,3 +82,42 @@ def test_type_error(trained_encoder: GateEncoder) -> None:
     with pytest.raises(TypeError):
         trained_encoder.encode_gates(None)  # type: ignore[call-overload]
         trained_encoder.decode_gates(None)  # type: ignore[call-overload]
+
+
+def test_encode_array(trained_encoder: GateEncoder) -> None:
+    gates = np.array([["x", "cnot"], ["h", "x"]])
+    encoded = trained_encoder.encode_array(gates)
+    np.testing.assert_array_equal(encoded, [[1, 4], [5, 1]])
+    np.testing.assert_array_equal(trained_encoder.encode_gates(gates), encoded)
+    assert trained_encoder.encode_array([]).shape == (0,)
+
+    with pytest.raises(KeyError, match="unknown gate names \\['a', 'measure'\\]"):
+        trained_encoder.encode_array(["x", "measure", "a"])
+
+
+def test_decode_array(trained_encoder: GateEncoder) -> None:
+    encoded = np.array([[1, 4], [5, 1]])
+    decoded = trained_encoder.decode_array(encoded)
+    np.testing.assert_array_equal(decoded, [["x", "cnot"], ["h", "x"]])
+    np.testing.assert_array_equal(trained_encoder.decode_gates(encoded), decoded)
+
+    for invalid in (0, 6, -1):
+        with pytest.raises(KeyError, match="unknown encoded gates"):
+            trained_encoder.decode_array([1, invalid])
+
+
+def test_array_round_trip(trained_encoder: GateEncoder) -> None:
+    rng = np.random.default_rng(42)
+    gates = rng.choice(["x", "y", "z", "cnot", "h"], size=100_000)
+    encoded = trained_encoder.encode_array(gates)
+    expected = [trained_encoder._encoding_dct[gate] for gate in gates.tolist()]
+    np.testing.assert_array_equal(encoded, expected)
+    np.testing.assert_array_equal(trained_encoder.decode_array(encoded), gates)
+
+
+def test_empty_encoder_array(empty_encoder: GateEncoder) -> None:
+    assert empty_encoder.encode_array([]).shape == (0,)
+    with pytest.raises(KeyError):
+        empty_encoder.encode_array(["x"])
+    with pytest.raises(KeyError):
+        empty_encoder.decode_array([1])
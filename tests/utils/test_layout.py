@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import networkx as nx
+import numpy as np
+import pytest
+
+import qgym.utils.visualisation.layout
+from qgym.utils.input_parsing import parse_connection_graph
+from qgym.utils.visualisation.layout import LayoutCache, get_layout
+
+
+def _assert_normalized(layout: dict[object, np.ndarray]) -> None:
+    positions = np.array(list(layout.values()))
+    assert positions.shape == (len(layout), 2)
+    assert np.abs(positions).max() == pytest.approx(1)
+
+
+@pytest.mark.parametrize("gridspecs", [(2, 3), (3, 3), (1, 4)])
+def test_gridspecs(gridspecs: tuple[int, int]) -> None:
+    graph = parse_connection_graph(gridspecs)
+    layout = get_layout(graph)
+    _assert_normalized(layout)
+
+    # All connected nodes are equally far apart
+    distances = [np.linalg.norm(layout[u] - layout[v]) for u, v in graph.edges]
+    np.testing.assert_allclose(distances, distances[0])
+    assert len(np.unique(np.round(list(layout.values()), 6), axis=0)) == len(graph)
+
+
+def test_tuple_grid() -> None:
+    graph = nx.grid_2d_graph(3, 4)
+    layout = get_layout(graph)
+    _assert_normalized(layout)
+    for node, position in layout.items():
+        np.testing.assert_allclose(position, (np.array(node) - [1, 1.5]) / 1.5)
+
+
+@pytest.mark.parametrize(
+    "graph",
+    [nx.cycle_graph(5), nx.star_graph(4), nx.gnp_random_graph(8, 0.4, seed=1)],
+    ids=["cycle", "star", "random"],
+)
+def test_deterministic(graph: nx.Graph) -> None:
+    layout = LayoutCache().get(graph)
+    _assert_normalized(layout)
+
+    shuffled = nx.Graph()
+    shuffled.add_nodes_from(reversed(list(graph.nodes)))
+    shuffled.add_edges_from((v, u) for u, v in reversed(list(graph.edges)))
+    layout2 = LayoutCache().get(shuffled)
+    assert layout.keys() == layout2.keys()
+    for node, position in layout.items():
+        np.testing.assert_array_equal(position, layout2[node])
+
+
+def test_memory_cache() -> None:
+    cache = LayoutCache(maxsize=2)
+    layout = cache.get(nx.cycle_graph(5))
+    layout[0][:] = 10
+    assert len(cache) == 1
+    assert np.abs(cache.get(nx.cycle_graph(5))[0]).max() <= 1
+
+    cache.get(nx.cycle_graph(6))
+    cache.get(nx.cycle_graph(7))
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_disk_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    graph = nx.cycle_graph(5)
+    layout = LayoutCache(directory=tmp_path).get(graph)
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+
+    def fail(*_args: object) -> None:
+        raise AssertionError("the layout should be loaded from disk")
+
+    monkeypatch.setattr(qgym.utils.visualisation.layout, "compute_layout", fail)
+    layout2 = LayoutCache(directory=tmp_path).get(graph)
+    for node, position in layout.items():
+        np.testing.assert_array_equal(position, layout2[node])
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from gymnasium.spaces import Tuple
+
+from qgym.spaces import Box, Dict, Discrete, MultiBinary, MultiDiscrete
+from qgym.utils import FlatObservationLayout
+
+
+@pytest.fixture(name="space")
+def space_fixture() -> Dict:
+    return Dict(
+        box=Box(-1, 1, (2, 2), dtype=np.int_),
+        discrete=Discrete(3, start=1),
+        multi_binary=MultiBinary(3),
+        multi_discrete=MultiDiscrete([2, 5]),
+    )
+
+
+def test_offsets(space: Dict) -> None:
+    layout = FlatObservationLayout(space)
+    assert layout.offsets == {
+        "box": (0, 4),
+        "discrete": (4, 5),
+        "multi_binary": (5, 8),
+        "multi_discrete": (8, 10),
+    }
+    assert layout.size == 10
+    assert layout.space.shape == (10,)
+    np.testing.assert_array_equal(layout.space.low, [-1, -1, -1, -1, 1, 0, 0, 0, 0, 0])
+    np.testing.assert_array_equal(layout.space.high, [1, 1, 1, 1, 3, 1, 1, 1, 1, 4])
+
+
+def test_flatten_unflatten(space: Dict) -> None:
+    layout = FlatObservationLayout(space)
+    space.seed(0)
+    observation = space.sample()
+    vector = layout.flatten(observation)
+    assert vector in layout.space
+    for key, value in layout.unflatten(vector).items():
+        np.testing.assert_array_equal(value, observation[key])
+
+    batch = np.stack([vector, vector])
+    assert layout.unflatten(batch)["box"].shape == (2, 2, 2)
+
+
+def test_float_dtype() -> None:
+    layout = FlatObservationLayout(Dict(a=Box(0, 1, (2,)), b=MultiBinary(2)))
+    assert layout.dtype == np.float64
+    assert layout.flatten({"a": [0.5, 0.5], "b": [1, 0]}).dtype == np.float64
+    assert layout.space.dtype == np.float64
+
+
+def test_flatten_out(space: Dict) -> None:
+    layout = FlatObservationLayout(space)
+    space.seed(0)
+    observation = space.sample()
+    vector = layout.flatten(observation)
+    assert not np.shares_memory(vector, layout.flatten(observation))
+
+    out = np.zeros(layout.size, dtype=layout.dtype)
+    assert layout.flatten(observation, out=out) is out
+    np.testing.assert_array_equal(out, vector)
+    with pytest.raises(ValueError):
+        layout.flatten(observation, out=out[1:])
+
+
+def test_unsupported_space() -> None:
+    with pytest.raises(TypeError, match="the space of 'a' can not be flattened"):
+        FlatObservationLayout(Dict(a=Tuple([Discrete(2)])))
@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import networkx as nx
+import numpy as np
+import pygame
+import pytest
+
+from qgym.custom_types import Gate
+from qgym.envs import InitialMapping, Routing, Scheduling
+from qgym.templates import Environment, Visualiser
+from qgym.utils.visualisation.raster import (
+    ArraySurface,
+    BitmapFont,
+    blend_rect,
+    fill_circle,
+    fill_polygon,
+    fill_rect,
+    render_batch,
+)
+
+RED = (255, 0, 0)
+
+
+def _drawn(surface: ArraySurface) -> np.ndarray:
+    return (surface.array != 0).any(axis=2)
+
+
+class TestArraySurface:
+    def test_fill(self) -> None:
+        surface = ArraySurface((4, 3))
+        assert surface.array.shape == (3, 4, 3)
+        surface.fill(RED)
+        assert (surface.array == RED).all()
+        surface.fill((0, 0, 0), pygame.Rect(1, 1, 10, 10))
+        assert _drawn(surface).sum() == 12 - 6
+
+    def test_buffer(self) -> None:
+        buffer = np.zeros((2, 5, 3, 3), dtype=np.uint8)
+        surface = ArraySurface((3, 5), buffer=buffer[1])
+        surface.fill(RED)
+        assert (buffer[0] == 0).all()
+        assert (buffer[1] == RED).all()
+        with pytest.raises(ValueError):
+            ArraySurface((5, 3), buffer=buffer[1])
+
+    def test_subsurface(self) -> None:
+        surface = ArraySurface((10, 8))
+        subsurface = surface.subsurface(pygame.Rect(2, 3, 4, 5))
+        assert subsurface.get_size() == (4, 5)
+        assert subsurface.get_offset() == (2, 3)
+        assert subsurface.subsurface((1, 1, 2, 2)).get_offset() == (3, 4)
+        subsurface.fill(RED)
+        assert _drawn(surface)[3:8, 2:6].all()
+        assert _drawn(surface).sum() == 20
+        with pytest.raises(ValueError):
+            surface.subsurface((8, 0, 4, 4))
+
+    def test_blit(self) -> None:
+        surface = ArraySurface((6, 6))
+        source = ArraySurface((4, 4))
+        source.fill(RED)
+        surface.blit(source, (4, -2))
+        assert _drawn(surface).sum() == 4
+        assert _drawn(surface)[:2, 4:].all()
+
+    def test_blit_alpha(self) -> None:
+        surface = ArraySurface((3, 1))
+        surface.fill((0, 0, 200))
+        layer = ArraySurface((3, 1), alpha=True)
+        assert (layer.array == 0).all()
+        layer.array[0, 1] = (255, 0, 0, 255)
+        layer.array[0, 2] = (255, 0, 0, 51)
+        surface.blit(layer, (0, 0))
+        np.testing.assert_array_equal(
+            surface.array[0], [(0, 0, 200), (255, 0, 0), (51, 0, 160)]
+        )
+
+    def test_copy(self) -> None:
+        surface = ArraySurface((2, 2), alpha=True)
+        copy = surface.copy()
+        copy.fill(RED)
+        assert copy.has_alpha
+        assert (surface.array == 0).all()
+
+
+def test_fill_circle() -> None:
+    surface = ArraySurface((20, 20))
+    fill_circle(surface, (10, 10), 3, RED)
+    y_grid, x_grid = np.ogrid[:20, :20]
+    expected = (x_grid - 10) ** 2 + (y_grid - 10) ** 2 <= 9
+    np.testing.assert_array_equal(_drawn(surface), expected)
+
+    # Circles may be partially outside the surface
+    fill_circle(surface, (0, 0), 5, RED)
+    assert _drawn(surface)[0, 0]
+
+
+@pytest.mark.parametrize(
+    "points",
+    [
+        [(2, 2), (12, 2), (12, 6), (2, 6)],
+        [(2, 6), (12, 6), (12, 2), (2, 2)],
+        [(1, 1), (14, 5), (8, 13)],
+        [(-5, 3), (3, -5), (20, 12), (12, 20)],
+    ],
+    ids=["rectangle", "clockwise", "triangle", "clipped"],
+)
+def test_fill_polygon(points: list[tuple[int, int]]) -> None:
+    surface = ArraySurface((16, 16))
+    fill_polygon(surface, points, RED)
+
+    # Pixels inside lie on the same side of all edges
+    corners = np.array(points, dtype=float)
+    edges = np.roll(corners, -1, axis=0) - corners
+    y_grid, x_grid = np.ogrid[:16, :16]
+    cross = [
+        edge[0] * (y_grid - corner[1]) - edge[1] * (x_grid - corner[0])
+        for corner, edge in zip(corners, edges)
+    ]
+    expected = np.logical_and.reduce([c >= 0 for c in cross])
+    expected |= np.logical_and.reduce([c <= 0 for c in cross])
+    np.testing.assert_array_equal(_drawn(surface), expected)
+
+
+@pytest.mark.parametrize("width", [0, 1, 2, 7])
+@pytest.mark.parametrize("border_radius", [0, 3, 5, 20])
+@pytest.mark.parametrize("rect", [(2, 3, 20, 12), (5, 5, 9, 4), (-3, -4, 15, 10)])
+def test_fill_rect(
+    rect: tuple[int, int, int, int], width: int, border_radius: int
+) -> None:
+    surface = ArraySurface((24, 20))
+    fill_rect(surface, RED, rect, width=width, border_radius=border_radius)
+
+    def rounded(rect: pygame.Rect, radius: int) -> np.ndarray:
+        radius = min(radius, rect.width // 2, rect.height // 2)
+        y_grid, x_grid = np.ogrid[:20, :24]
+        mask = (x_grid >= rect.left) & (x_grid < rect.right)
+        mask = mask & (y_grid >= rect.top) & (y_grid < rect.bottom)
+        if radius > 0:
+            x_center = np.clip(x_grid, rect.left + radius, rect.right - 1 - radius)
+            y_center = np.clip(y_grid, rect.top + radius, rect.bottom - 1 - radius)
+            mask &= (x_grid - x_center) ** 2 + (y_grid - y_center) ** 2 <= radius**2
+        return mask
+
+    outer = pygame.Rect(rect)
+    expected = rounded(outer, border_radius)
+    if width > 0:
+        inner = outer.inflate(-2 * width, -2 * width)
+        expected &= ~rounded(inner, max(border_radius - width, 0))
+    np.testing.assert_array_equal(_drawn(surface), expected)
+
+
+def test_blend_rect() -> None:
+    surface = ArraySurface((4, 4))
+    surface.fill((255, 255, 255))
+    blend_rect(surface, (0, 0, 0), (1, 1, 2, 10), 128)
+    assert (surface.array[1:, 1:3] == 127).all()
+    assert (surface.array[0] == 255).all()
+    assert (surface.array[:, 0] == 255).all()
+
+
+class TestBitmapFont:
+    def test_render(self) -> None:
+        font = BitmapFont(30)
+        assert font.scale == 3
+        text = font.render("Q1", True, RED)
+        assert text.has_alpha
+        assert text.get_size() == font.size("Q1") == (3 * 13, 3 * 9)
+        visible = text.array[..., 3] == 255
+        assert visible.any()
+        assert (text.array[visible, :3] == RED).all()
+        assert (text.array[~visible] == 0).all()
+
+        # Glyphs are drawn inside a border of one glyph pixel
+        assert not visible[:3].any() and not visible[-3:].any()
+        assert not visible[:, :3].any() and not visible[:, -3:].any()
+
+    def test_characters(self) -> None:
+        font = BitmapFont(10)
+        masks = [font.render(char, True, RED).array[..., 3] for char in "AaBb01?"]
+        for i, mask in enumerate(masks):
+            assert mask.any()
+            for other in masks[i + 1 :]:
+                assert not np.array_equal(mask, other)
+        unknown = font.render("é", True, RED).array
+        np.testing.assert_array_equal(unknown, font.render("?", True, RED).array)
+        assert font.size("") == (1, 9)
+
+    def test_style(self) -> None:
+        regular = BitmapFont(24).render("X", True, RED).array[..., 3]
+        bold = BitmapFont(24, bold=True).render("X", True, RED).array[..., 3]
+        italic = BitmapFont(24, italic=True).render("X", True, RED).array[..., 3]
+        assert bold.shape == regular.shape
+        assert (bold >= regular).all() and (bold > regular).any()
+        assert italic.shape[1] > regular.shape[1]
+
+
+@pytest.fixture(name="make_env")
+def make_env_fixture(
+    env_type: type[Environment[Any, Any]], mp_dict: dict[str, Any]
+) -> Callable[[str], Environment[Any, Any]]:
+    def make_env(backend: str) -> Environment[Any, Any]:
+        if env_type is Scheduling:
+            return Scheduling(mp_dict, render_mode="rgb_array", render_backend=backend)
+        return env_type((3, 3), render_mode="rgb_array", render_backend=backend)
+
+    return make_env
+
+
+def _reset(env: Environment[Any, Any]) -> None:
+    # Use fixed problems, because seeding does not reseed the generators
+    if isinstance(env, Routing):
+        circuit = [[0, 1], [1, 2], [0, 3], [2, 3], [1, 3], [4, 8], [5, 7], [0, 6]]
+        env.reset(seed=0, options={"interaction_circuit": circuit})
+    elif isinstance(env, InitialMapping):
+        env.reset(seed=0, options={"interaction_graph": nx.cycle_graph(9)})
+    else:
+        circuit = [
+            Gate("prep", 0, 0),
+            Gate("prep", 1, 1),
+            Gate("cnot", 0, 1),
+            Gate("x", 2, 2),
+            Gate("measure", 0, 0),
+            Gate("measure", 1, 1),
+        ]
+        env.reset(seed=0, options={"circuit": circuit})
+
+
+@pytest.mark.parametrize("env_type", [Routing, InitialMapping, Scheduling])
+class TestNumpyBackend:
+    def test_headless(
+        self,
+        make_env: Callable[[str], Environment[Any, Any]],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        def fail(*_args: Any, **_kwargs: Any) -> None:
+            raise AssertionError("pygame should not be initialized")
+
+        monkeypatch.setattr(pygame.display, "init", fail)
+        monkeypatch.setattr(pygame.font, "init", fail)
+        monkeypatch.setattr(pygame.font, "SysFont", fail)
+        monkeypatch.setattr(pygame, "quit", fail)
+
+        env = make_env("numpy")
+        _reset(env)
+        for _ in range(5):
+            env.step(env.action_space.sample())
+            frame = env.render()
+            assert isinstance(frame, np.ndarray)
+            assert frame.dtype == np.uint8
+        env.close()
+
+    def test_same_picture(
+        self, make_env: Callable[[str], Environment[Any, Any]]
+    ) -> None:
+        envs = [make_env(backend) for backend in ("numpy", "pygame")]
+        for env in envs:
+            _reset(env)
+        for _ in range(5):
+            action = envs[0].action_space.sample()
+            frames = []
+            for env in envs:
+                env.step(action)
+                frames.append(env.render())
+            assert frames[0].shape == frames[1].shape
+            # The pictures only differ in antialiasing and the font
+            assert (frames[0] == frames[1]).all(axis=2).mean() > 0.95
+        for env in envs:
+            env.close()
+
+    def test_render_batch(
+        self,
+        make_env: Callable[[str], Environment[Any, Any]],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        envs = [make_env("numpy") for _ in range(3)]
+        for seed, env in enumerate(envs):
+            env.reset(seed=seed)
+        frames = render_batch(envs)
+        assert frames.shape == (3,) + envs[0].render().shape
+        for frame, env in zip(frames, envs):
+            np.testing.assert_array_equal(frame, env.render())
+
+        def fail(*_args: Any) -> None:
+            raise AssertionError("no frame should be allocated")
+
+        # The frames are written into the preallocated array directly
+        monkeypatch.setattr(Visualiser, "_screen_to_array", fail)
+        out = np.zeros_like(frames)
+        assert render_batch(envs, out=out) is out
+        np.testing.assert_array_equal(out, frames)
+        with pytest.raises(ValueError):
+            render_batch(envs, out=out[:, 1:])
+        with pytest.raises(ValueError):
+            render_batch(envs, out=out[1:])
+        with pytest.raises(ValueError):
+            render_batch([])
+
+    def test_render_out(self, make_env: Callable[[str], Environment[Any, Any]]) -> None:
+        env = make_env("pygame")
+        _reset(env)
+        frame = env.render()
+        out = np.zeros_like(frame)
+        assert env.render(out=out) is out
+        np.testing.assert_array_equal(out, frame)
+        env.close()
+
+
+def test_invalid_backend() -> None:
+    with pytest.raises(ValueError):
+        Routing((2, 2), render_mode="human", render_backend="numpy")
+    with pytest.raises(ValueError):
+        Routing((2, 2), render_mode="rgb_array", render_backend="opengl")
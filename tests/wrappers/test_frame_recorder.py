@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+import qgym.wrappers.frame_recorder
+from qgym.envs import Routing
+from qgym.wrappers import FrameRecorder, load_episode
+
+CIRCUIT = [[0, 1], [1, 2], [0, 3], [2, 3], [1, 3], [4, 8], [5, 7], [0, 6]]
+
+
+@pytest.fixture(name="env")
+def env_fixture() -> Routing:
+    return Routing((3, 3), render_mode="rgb_array", render_backend="numpy")
+
+
+def _run_episode(
+    env: FrameRecorder, max_steps: int = 10
+) -> tuple[dict[int, np.ndarray], int]:
+    """Run an episode and give the frame after every step, and the number of steps."""
+    env.reset(seed=0, options={"interaction_circuit": CIRCUIT})
+    frames = {0: env.render()}
+    for step in range(1, max_steps + 1):
+        _, _, terminated, truncated, _ = env.step(env.action_space.sample())
+        frames[step] = env.render()
+        if terminated or truncated:
+            break
+    return frames, step
+
+
+@pytest.mark.parametrize("file_format", ["npz", "npy"])
+@pytest.mark.parametrize("k", [1, 3])
+def test_every_k_steps(env: Routing, tmp_path: Path, file_format: str, k: int) -> None:
+    recorder = FrameRecorder(env, tmp_path, k=k, file_format=file_format, chunk_size=4)
+    episodes = [_run_episode(recorder) for _ in range(2)]
+    recorder.close()
+
+    for episode, (expected_frames, n_steps) in enumerate(episodes):
+        frames, steps = load_episode(tmp_path, episode)
+        expected_steps = list(range(0, n_steps, k))
+        if expected_steps[-1] != n_steps:
+            expected_steps.append(n_steps)
+        np.testing.assert_array_equal(steps, expected_steps)
+        assert frames.dtype == np.uint8
+        assert frames.shape == (len(steps),) + expected_frames[0].shape
+        for frame, step in zip(frames, steps):
+            np.testing.assert_array_equal(frame, expected_frames[step])
+
+
+def test_episode_end(env: Routing, tmp_path: Path) -> None:
+    recorder = FrameRecorder(env, tmp_path, policy="episode_end")
+    episodes = [_run_episode(recorder) for _ in range(3)]
+    recorder.close()
+
+    for episode, (expected_frames, n_steps) in enumerate(episodes):
+        frames, steps = load_episode(tmp_path, episode)
+        np.testing.assert_array_equal(steps, [n_steps])
+        np.testing.assert_array_equal(frames[0], expected_frames[n_steps])
+
+
+def test_chunks(env: Routing, tmp_path: Path) -> None:
+    recorder = FrameRecorder(env, tmp_path, chunk_size=2)
+    _, n_steps = _run_episode(recorder, max_steps=6)
+    recorder.close()
+
+    n_frames = n_steps + 1
+    chunk_paths = sorted(tmp_path.glob("episode_000000_*.npz"))
+    assert len(chunk_paths) == (n_frames + 1) // 2
+    assert len(load_episode(tmp_path, 0)[0]) == n_frames
+
+
+def test_memory_map(env: Routing, tmp_path: Path) -> None:
+    recorder = FrameRecorder(env, tmp_path, file_format="npy")
+    expected_frames, _ = _run_episode(recorder)
+    recorder.close()
+
+    frames, _ = load_episode(tmp_path, 0)
+    assert isinstance(frames, np.memmap)
+    np.testing.assert_array_equal(frames, list(expected_frames.values()))
+
+
+def test_missing_episode(env: Routing, tmp_path: Path) -> None:
+    FrameRecorder(env, tmp_path).close()
+    with pytest.raises(FileNotFoundError):
+        load_episode(tmp_path, 0)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"policy": "random"},
+        {"file_format": "mp4"},
+        {"k": 0},
+        {"chunk_size": 0},
+        {"max_queued_frames": 0},
+    ],
+)
+def test_invalid_arguments(
+    env: Routing, tmp_path: Path, kwargs: dict[str, Any]
+) -> None:
+    with pytest.raises(ValueError):
+        FrameRecorder(env, tmp_path, **kwargs)
+
+
+def test_no_rgb_array(tmp_path: Path) -> None:
+    recorder = FrameRecorder(Routing((3, 3)), tmp_path)
+    with pytest.raises(ValueError):
+        recorder.reset()
+    recorder.close()
+
+
+def test_writer_error(
+    env: Routing, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fail(*_args: Any, **_kwargs: Any) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(qgym.wrappers.frame_recorder.np, "savez_compressed", fail)
+    recorder = FrameRecorder(env, tmp_path, chunk_size=1)
+    with pytest.raises(OSError, match="disk full"):
+        _run_episode(recorder)
+        recorder.close()
+
+
+def test_writer_error_is_sticky(env: Routing, tmp_path: Path) -> None:
+    directory = tmp_path / "frames"
+    recorder = FrameRecorder(env, directory, chunk_size=1, max_queued_frames=1)
+    directory.rmdir()
+
+    # The writer stopped, so recording must raise instead of waiting for it forever
+    with pytest.raises(FileNotFoundError):
+        recorder.reset(options={"interaction_circuit": CIRCUIT})
+        for _ in range(10):
+            recorder.step(recorder.action_space.sample())
+    with pytest.raises(FileNotFoundError):
+        recorder.step(recorder.action_space.sample())
+    with pytest.raises(FileNotFoundError):
+        recorder.close()
+    recorder.close()
+
+
+def test_writer_error_closes_file(
+    env: Routing, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    episode_writers = []
+
+    def fail(self: Any, *_args: Any) -> None:
+        episode_writers.append(self)
+        raise OSError("disk full")
+
+    monkeypatch.setattr(qgym.wrappers.frame_recorder._EpisodeWriter, "add", fail)
+    recorder = FrameRecorder(env, tmp_path, file_format="npy", max_queued_frames=1)
+    with pytest.raises(OSError, match="disk full"):
+        _run_episode(recorder)
+    with pytest.raises(OSError, match="disk full"):
+        recorder.close()
+    assert len(episode_writers) == 1
+    assert episode_writers[0].file.closed